@@ -97,13 +97,19 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         required=True,
         help="directory to write output into",
     )
-    parser_bake.add_argument(
+    recipe_source = parser_bake.add_mutually_exclusive_group(required=True)
+    recipe_source.add_argument(
         "-r",
         "--recipe",
         type=Path,
-        required=True,
         help="recipe file to read",
     )
+    recipe_source.add_argument(
+        "--recipe-dir",
+        type=Path,
+        help="directory of recipes to bake together, sharing common steps. "
+        "Each is output into a subdirectory of the output directory",
+    )
     parser_bake.add_argument(
         "-s", "--style-file", type=Path, help="colour bar definition to use"
     )
@@ -113,6 +119,42 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     parser_bake.add_argument(
         "--skip-write", action="store_true", help="Skip saving processed output"
     )
+    parser_bake.add_argument(
+        "--dask-scheduler",
+        choices=["synchronous", "threads", "processes", "distributed"],
+        help="dask scheduler to compute lazy data with",
+    )
+    parser_bake.add_argument(
+        "--dask-workers", type=int, help="number of dask workers to use"
+    )
+    parser_bake.add_argument(
+        "--dask-memory-limit",
+        type=str,
+        help="memory limit per dask worker, e.g. 4GiB. Distributed scheduler only",
+    )
+    parser_bake.add_argument(
+        "--dask-chunk-size", type=str, help="target size of array chunks, e.g. 128MiB"
+    )
+    parser_bake.add_argument(
+        "--cache-dir",
+        type=str,
+        help="directory to share intermediate diagnostics between bakes",
+    )
+    parser_bake.add_argument(
+        "--cache-memory-limit",
+        type=str,
+        help="memory for intermediate diagnostics before spilling, e.g. 1GiB",
+    )
+    parser_bake.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="keep existing output if the recipe and its inputs are unchanged",
+    )
+    parser_bake.add_argument(
+        "--skipped-marker",
+        type=Path,
+        help="file to create if any recipe is kept by --skip-unchanged",
+    )
     parser_bake.set_defaults(func=_bake_command)
 
     parser_graph = subparsers.add_parser("graph", help="visualise a recipe file")
@@ -248,17 +290,37 @@ def setup_logging(verbosity: int):
 
 def _bake_command(args, unparsed_args):
     from CSET._common import parse_recipe, parse_variable_options
-    from CSET.operators import execute_recipe
+    from CSET.operators import execute_recipe, execute_recipes
 
     recipe_variables = parse_variable_options(unparsed_args, args.input_dir)
-    recipe = parse_recipe(args.recipe, recipe_variables)
-    execute_recipe(
-        recipe,
-        args.output_dir,
+    options = (
         args.style_file,
         args.plot_resolution,
         args.skip_write,
+        {
+            "scheduler": args.dask_scheduler,
+            "workers": args.dask_workers,
+            "memory_limit": args.dask_memory_limit,
+            "chunk_size": args.dask_chunk_size,
+            "cache_directory": args.cache_dir,
+            "cache_memory_limit": args.cache_memory_limit,
+        },
+        args.skip_unchanged,
     )
+    if args.recipe_dir:
+        recipes = [
+            (
+                parse_recipe(recipe_file, recipe_variables),
+                args.output_dir / recipe_file.stem,
+            )
+            for recipe_file in sorted(args.recipe_dir.glob("*.yaml"))
+        ]
+        all_baked = execute_recipes(recipes, *options)
+    else:
+        recipe = parse_recipe(args.recipe, recipe_variables)
+        all_baked = execute_recipe(recipe, args.output_dir, *options)
+    if args.skipped_marker and not all_baked:
+        args.skipped_marker.touch()
 
 
 def _graph_command(args, unparsed_args):
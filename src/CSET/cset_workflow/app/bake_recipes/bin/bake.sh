@@ -1,17 +1,27 @@
 #!/usr/bin/env bash
-# Run CSET bake for a recipe file.
+# Run CSET bake for a recipe file, or a directory of recipes to bake together.
 set -euo pipefail
 
+plots_dir="${CYLC_WORKFLOW_SHARE_DIR}/web/plots/${CYLC_TASK_CYCLE_POINT}"
+if [ -d "$1" ]; then
+    # Each recipe is output into its own subdirectory of the plots directory.
+    recipe_args=( --recipe-dir "$1" --output-dir "$plots_dir" )
+else
+    recipe_args=( --recipe "$1" --output-dir "${plots_dir}/$(basename "$1" .yaml)" )
+fi
+
 # Construct command into array.
 cset_command=( cset bake \
-    --recipe "$1" \
-    --output-dir "${CYLC_WORKFLOW_SHARE_DIR}/web/plots/${CYLC_TASK_CYCLE_POINT}/$(basename "$1" .yaml)" \
+    "${recipe_args[@]}" \
     ${COLORBAR_FILE:+"--style-file=${CYLC_WORKFLOW_SHARE_DIR}/style.json"} \
     ${PLOT_RESOLUTION:+"--plot-resolution=$PLOT_RESOLUTION"} \
-    ${SKIP_WRITE:+"--skip-write"} )
+    ${SKIP_WRITE:+"--skip-write"} \
+    --skip-unchanged \
+    ${DASK_WORKERS_PER_BAKE:+"--dask-workers=$DASK_WORKERS_PER_BAKE"} \
+    --cache-dir="${CYLC_WORKFLOW_SHARE_DIR}/cycle/${CYLC_TASK_CYCLE_POINT}/intermediate_cache" )
 
 # Print command for easy rerunning.
 echo "${cset_command[@]}"
 
-# Bake recipe.
-exec "${cset_command[@]}"
+# Bake recipe, recording its cost for scheduling later cycles.
+exec schedule.py profile "$1" "${cset_command[@]}"
@@ -16,24 +16,24 @@ if ! [ -d "$RECIPE_DIR" ]; then
 fi
 export RECIPE_DIR
 
-# Determine parallelism.
-parallelism="${BUNCH_POOL_SIZE:-$(nproc)}"
+# Write rose-bunch optional configuration, ordering recipes longest first, and
+# baking as many at once as fit in memory.
+mkdir -p "$CYLC_WORKFLOW_RUN_DIR/app/bake_recipes/opt/"
+opt_conf="$CYLC_WORKFLOW_RUN_DIR/app/bake_recipes/opt/rose-app-${optconfkey}.conf"
+app_env_wrapper "$CYLC_WORKFLOW_RUN_DIR/app/bake_recipes/bin/schedule.py" plan "$RECIPE_DIR" "$opt_conf"
+parallelism="$(sed -n 's/^pool-size=//p' "$opt_conf")"
+# Count and display number of recipes.
+echo "Baking $(sed -n 's/^recipe_file=//p' "$opt_conf" | wc -w) recipes and groups of recipes, $parallelism at a time..."
+
+# Divide the cores between the concurrent bakes, so dask doesn't oversubscribe.
+cores="$(nproc)"
+DASK_WORKERS_PER_BAKE=$(( cores / parallelism > 1 ? cores / parallelism : 1 ))
+export DASK_WORKERS_PER_BAKE
 if [ "$CYLC_TASK_SUBMIT_NUMBER" -gt 1 ]; then
     # This is a retry; enable DEBUG logging.
     export LOGLEVEL="DEBUG"
 fi
-
-# Get filenames without leading directory.
-# Portability note: printf is specific to GNU find.
-recipes="$(find "$RECIPE_DIR" -iname '*.yaml' -type f -printf '%P ')"
-# Count and display number of recipes. (By counting the number of spaces.)
-echo "Baking $(echo "$recipes" | tr -dc ' ' | wc -c) recipes..."
-
-# Write rose-bunch optional configuration.
-mkdir -p "$CYLC_WORKFLOW_RUN_DIR/app/bake_recipes/opt/"
-opt_conf="$CYLC_WORKFLOW_RUN_DIR/app/bake_recipes/opt/rose-app-${optconfkey}.conf"
-printf "[bunch]\npool-size=%s\n[bunch-args]\nrecipe_file=%s\n" "$parallelism" "$recipes" > "$opt_conf"
-unset opt_conf parallelism recipes
+unset opt_conf cores parallelism
 
 # Run bake_recipes rose app.
 exec rose task-run -v --app-key=bake_recipes --opt-conf-key="${optconfkey}"
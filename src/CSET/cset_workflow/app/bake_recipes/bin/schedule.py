@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Schedule the baking of a cycle's recipes by their estimated cost.
+
+Each recipe's run time and peak memory are estimated from the profile recorded
+when it was baked for a previous cycle, or otherwise from the size of its input
+files and the operators it uses. Recipes are baked longest first, so a single
+expensive recipe doesn't start last and hold up the cycle, and the number baked
+concurrently is limited so the largest recipes fit in memory together.
+
+Recipes starting with the same step, such as reading the same field, are baked
+together in a group, so the steps they have in common are computed once. Each
+group is a directory of links to its recipes, baked with ``cset bake
+--recipe-dir``, and is scheduled like a single recipe.
+
+Usage:
+    schedule.py plan RECIPE_DIR OPT_CONF
+        Write the rose-bunch configuration for baking the recipes.
+    schedule.py profile RECIPE COMMAND...
+        Run the cset bake command to bake a recipe or group, recording its time
+        and peak memory unless it was skipped as unchanged.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import dask.utils
+
+# Memory used by a bake before loading any data, in bytes.
+BASE_MEMORY = 512 * 1024**2
+# Seconds taken by a bake before processing any data.
+BASE_SECONDS = 30.0
+# Bytes of input processed per second by a bake using simple operators.
+INPUT_THROUGHPUT = 50 * 1024**2
+# Relative cost of operators, by module. Other modules have a cost of 1.
+OPERATOR_COSTS = {
+    "ensembles": 2.0,
+    "mesoscale": 2.0,
+    "plot": 2.0,
+    "power_spectrum": 3.0,
+    "regrid": 2.0,
+    "transect": 2.0,
+}
+# Fraction of the node's memory the concurrent bakes may use. The rest is
+# headroom for memory peaks between the samples of recorded profiles.
+MEMORY_FRACTION = 0.8
+# Seconds between samples of the memory used by a bake's processes.
+MEMORY_SAMPLE_INTERVAL = 1.0
+# Maximum number of recipes baked together in a group. The recipes of a group
+# are baked one after another, so larger groups reduce parallelism.
+MAX_GROUP_SIZE = 8
+# Directory within the recipe directory holding the groups of recipes.
+GROUPS_DIR = "_groups"
+
+logger = logging.getLogger(__name__)
+
+
+class Estimate(NamedTuple):
+    """Estimated cost of baking a recipe."""
+
+    seconds: float
+    memory: int
+
+
+def recipe_key(recipe_file: Path) -> str:
+    """Name identifying a recipe across cycles, without its content hash."""
+    return re.sub(r"_[0-9a-f]{12}$", "", Path(recipe_file).stem)
+
+
+def _profiles_dir() -> Path:
+    return Path(os.environ["CYLC_WORKFLOW_SHARE_DIR"]) / "bake_profiles"
+
+
+def load_profile(recipe_file: Path, profiles_dir: Path) -> Estimate | None:
+    """Get the cost of a recipe recorded in a previous cycle, if any."""
+    try:
+        with open(profiles_dir / f"{recipe_key(recipe_file)}.json") as fp:
+            profile = json.load(fp)
+        return Estimate(float(profile["seconds"]), int(profile["memory"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def record_profile(recipe_file: Path, estimate: Estimate, profiles_dir: Path):
+    """Record the cost of baking a recipe, for scheduling later cycles."""
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+    # Written atomically, as the bakes of other cycles may be reading it.
+    with tempfile.NamedTemporaryFile("wt", dir=profiles_dir, delete=False) as fp:
+        json.dump(estimate._asdict(), fp)
+    os.replace(fp.name, profiles_dir / f"{recipe_key(recipe_file)}.json")
+
+
+def _operators(step):
+    """Get the names of all operators used in a recipe's steps."""
+    if isinstance(step, dict):
+        if isinstance(step.get("operator"), str):
+            yield step["operator"]
+        for value in step.values():
+            yield from _operators(value)
+    elif isinstance(step, list):
+        for value in step:
+            yield from _operators(value)
+
+
+def _read_recipe(recipe_file: Path) -> dict | None:
+    """Parse a recipe, or None if it is invalid."""
+    import ruamel.yaml
+
+    from CSET._common import parse_recipe
+
+    try:
+        return parse_recipe(Path(recipe_file))
+    except (OSError, ValueError, TypeError, KeyError, ruamel.yaml.YAMLError) as err:
+        logger.warning("Could not parse %s: %s", recipe_file, err)
+        return None
+
+
+def estimate_from_recipe(recipe_file: Path) -> Estimate:
+    """Estimate the cost of a recipe from its inputs and operators.
+
+    Recipes which can't be parsed are given the cost of a bake without any
+    input, as they fail quickly.
+    """
+    from CSET.operators._fingerprint import _input_paths
+    from CSET.operators.read import _check_input_files
+
+    recipe = _read_recipe(recipe_file)
+    if recipe is None:
+        return Estimate(seconds=BASE_SECONDS, memory=BASE_MEMORY)
+    input_bytes = 0
+    for file_paths in _input_paths(recipe["steps"]):
+        try:
+            input_bytes += sum(p.stat().st_size for p in _check_input_files(file_paths))
+        except (FileNotFoundError, OSError):
+            pass
+    operator_cost = sum(
+        OPERATOR_COSTS.get(operator.split(".")[0], 1.0)
+        for operator in _operators(recipe["steps"])
+    )
+    return Estimate(
+        seconds=BASE_SECONDS + operator_cost * input_bytes / INPUT_THROUGHPUT,
+        memory=BASE_MEMORY + 2 * input_bytes,
+    )
+
+
+def estimate(recipe_file: Path, profiles_dir: Path) -> Estimate:
+    """Estimate the cost of a recipe, preferring its recorded profile."""
+    return load_profile(recipe_file, profiles_dir) or estimate_from_recipe(recipe_file)
+
+
+def group_recipes(recipe_files: list[Path]) -> list[list[Path]]:
+    """Group recipes which start with the same step, to bake them together.
+
+    Recipes are only grouped if they have the same compute policy, and groups
+    are limited to ``MAX_GROUP_SIZE`` recipes. Recipes which can't share any
+    steps are each in a group of their own.
+    """
+    from CSET.operators._plan import canonical_step, shareable_prefix_length
+
+    groups: dict[tuple[str, str] | Path, list[Path]] = {}
+    for recipe_file in sorted(recipe_files):
+        recipe = _read_recipe(recipe_file)
+        if recipe is not None and shareable_prefix_length(recipe["steps"]):
+            key = (
+                canonical_step(recipe.get("compute", {})),
+                canonical_step(recipe["steps"][0]),
+            )
+        else:
+            key = recipe_file
+        groups.setdefault(key, []).append(recipe_file)
+    return [
+        members[start : start + MAX_GROUP_SIZE]
+        for members in groups.values()
+        for start in range(0, len(members), MAX_GROUP_SIZE)
+    ]
+
+
+def _link_group(members: list[Path], groups_dir: Path) -> Path:
+    """Create a directory of links to the recipes of a group.
+
+    The directory is named by its recipes, so the same group in a later cycle
+    uses the profile recorded for it.
+    """
+    keys = "\n".join(sorted(recipe_key(member) for member in members))
+    group = groups_dir / f"group-{hashlib.sha256(keys.encode()).hexdigest()[:8]}"
+    group.mkdir(parents=True)
+    for member in members:
+        (group / member.name).symlink_to(member.resolve())
+    return group
+
+
+def plan(
+    estimates: dict[str, Estimate], max_parallelism: int, memory_budget: int
+) -> tuple[list[str], int]:
+    """Order recipes longest first, and choose how many to bake at once.
+
+    The number baked at once is limited so that even the recipes with the
+    largest memory use fit within the budget when baked together.
+
+    Parameters
+    ----------
+    estimates: dict[str, Estimate]
+        Estimated cost of each recipe, by recipe file name.
+    max_parallelism: int
+        Maximum number of recipes to bake at once, such as the number of cores.
+    memory_budget: int
+        Bytes of memory available to the concurrent bakes.
+
+    Returns
+    -------
+    recipes: list[str]
+        Recipe file names in the order to bake them.
+    pool_size: int
+        Number of recipes to bake at once.
+    """
+    recipes = sorted(estimates, key=lambda r: estimates[r].seconds, reverse=True)
+    largest = sorted((e.memory for e in estimates.values()), reverse=True)
+    pool_size = 1
+    while (
+        pool_size < min(max_parallelism, len(largest))
+        and sum(largest[: pool_size + 1]) <= memory_budget
+    ):
+        pool_size += 1
+    return recipes, pool_size
+
+
+def _memory_budget() -> int:
+    """Bytes of memory available for baking on this node."""
+    if os.getenv("BAKE_MEMORY_LIMIT"):
+        return dask.utils.parse_bytes(os.environ["BAKE_MEMORY_LIMIT"])
+    total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    return math.floor(total * MEMORY_FRACTION)
+
+
+def main_plan(recipe_dir: Path, opt_conf: Path):
+    """Write the rose-bunch configuration for baking a directory of recipes.
+
+    Each bunch job bakes either a single recipe, or a group of recipes.
+    """
+    profiles_dir = _profiles_dir()
+    groups_dir = recipe_dir / GROUPS_DIR
+    shutil.rmtree(groups_dir, ignore_errors=True)
+    estimates = {}
+    for members in group_recipes(list(recipe_dir.rglob("*.yaml"))):
+        if len(members) == 1:
+            estimates[str(members[0].relative_to(recipe_dir))] = estimate(
+                members[0], profiles_dir
+            )
+            continue
+        group = _link_group(members, groups_dir)
+        # Without a profile of the group, assume its recipes share nothing.
+        member_estimates = [estimate(member, profiles_dir) for member in members]
+        estimates[str(group.relative_to(recipe_dir))] = load_profile(
+            group, profiles_dir
+        ) or Estimate(
+            seconds=sum(e.seconds for e in member_estimates),
+            memory=max(e.memory for e in member_estimates),
+        )
+    max_parallelism = int(os.getenv("BUNCH_POOL_SIZE") or os.cpu_count())
+    recipes, pool_size = plan(estimates, max_parallelism, _memory_budget())
+    for recipe in recipes:
+        print(
+            f"Scheduled {recipe}: ~{estimates[recipe].seconds:.0f}s, "
+            f"{dask.utils.format_bytes(estimates[recipe].memory)}"
+        )
+    with open(opt_conf, "wt") as fp:
+        fp.write(f"[bunch]\npool-size={pool_size}\n")
+        fp.write(f"[bunch-args]\nrecipe_file={' '.join(recipes)}\n")
+
+
+def _process_tree_rss(pid: int) -> int:
+    """Resident memory of a process and all its descendants, in bytes."""
+    rss = 0
+    try:
+        with open(f"/proc/{pid}/statm") as fp:
+            rss = int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        for children in Path(f"/proc/{pid}/task").glob("*/children"):
+            for child in children.read_text().split():
+                rss += _process_tree_rss(int(child))
+    except (OSError, ValueError, IndexError):
+        # The process exited, or /proc isn't available.
+        pass
+    return rss
+
+
+def main_profile(recipe_file: Path, command: list[str]) -> int:
+    """Run a bake command, recording its wall time and peak memory.
+
+    The bake's peak memory is the largest total resident memory of all its
+    processes, such as dask workers, sampled every ``MEMORY_SAMPLE_INTERVAL``
+    seconds. Nothing is recorded if the bake fails, or any of its recipes are
+    skipped as unchanged, as the time and memory used aren't representative.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        skipped_marker = Path(tmpdir) / "skipped"
+        start = time.monotonic()
+        peak_rss = 0
+        with subprocess.Popen([*command, f"--skipped-marker={skipped_marker}"]) as bake:
+            while True:
+                peak_rss = max(peak_rss, _process_tree_rss(bake.pid))
+                try:
+                    bake.wait(timeout=MEMORY_SAMPLE_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    continue
+        seconds = time.monotonic() - start
+        skipped = skipped_marker.exists()
+    # Peak resident memory of the largest single child process, in KiB on
+    # Linux. This catches peaks of a single process between samples.
+    memory = max(
+        peak_rss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
+    )
+    if bake.returncode == 0 and not skipped:
+        record_profile(recipe_file, Estimate(seconds, memory), _profiles_dir())
+    return bake.returncode
+
+
+def main():
+    """Program entry point."""
+    match sys.argv[1:]:
+        case ["plan", recipe_dir, opt_conf]:
+            main_plan(Path(recipe_dir), Path(opt_conf))
+        case ["profile", recipe_file, *command] if command:
+            sys.exit(main_profile(Path(recipe_file), command))
+        case _:
+            sys.exit(__doc__)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
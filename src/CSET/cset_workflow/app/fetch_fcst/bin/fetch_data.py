@@ -301,6 +301,23 @@ def fetch_data(file_retriever: FileRetrieverABC):
     if not any_files_found:
         raise FileNotFoundError("No files found for model!")
 
+    _write_field_catalogue(cycle_data_dir)
+
+
+def _write_field_catalogue(data_dir: str):
+    """Catalogue the fields of the fetched files to speed up later reading.
+
+    The catalogue is only an optimisation, so failing to write it is not fatal.
+    """
+    try:
+        # Imported here as it pulls in iris, which the other fetch code avoids.
+        from CSET.operators._catalogue import update_catalogue
+
+        logger.info("Writing field catalogue for %s", data_dir)
+        update_catalogue(Path(data_dir))
+    except (ImportError, OSError) as err:
+        logger.warning("Could not write field catalogue: %s", err)
+
 
 def fetch_obs(obs_retriever: FileRetrieverABC):
     """Fetch the observations corresponding to a model run.
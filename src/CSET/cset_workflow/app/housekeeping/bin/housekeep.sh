@@ -21,4 +21,5 @@ elif [[ $HOUSEKEEPING_MODE -ge 2 ]]
 then
     # Housekeeping: Standard
     rm -rfv -- "$CYLC_WORKFLOW_SHARE_DIR"/cycle/*/data
+    rm -rfv -- "$CYLC_WORKFLOW_SHARE_DIR"/cycle/*/intermediate_cache
 fi
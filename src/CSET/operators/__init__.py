@@ -14,6 +14,7 @@
 
 """Subpackage contains all of CSET's operators."""
 
+import contextlib
 import inspect
 import json
 import logging
@@ -21,11 +22,15 @@ import os
 import zipfile
 from pathlib import Path
 
+import dask
 from iris import FUTURE
 
 # Import operators here so they are exported for use by recipes.
 import CSET.operators
 from CSET.operators import (
+    _fingerprint,
+    _memoise,
+    _plan,
     ageofair,
     aggregate,
     aviation,
@@ -63,6 +68,7 @@ __all__ = [
     "convection",
     "ensembles",
     "execute_recipe",
+    "execute_recipes",
     "feature",
     "filters",
     "fluxes",
@@ -185,13 +191,87 @@ def create_diagnostic_archive():
                 archive.write(file, arcname=file.relative_to(output_directory))
 
 
+@contextlib.contextmanager
+def _compute_policy(policy: dict):
+    """Configure how dask computes lazy data for the duration of a recipe.
+
+    Parameters
+    ----------
+    policy: dict
+        Mapping optionally containing the keys ``scheduler``, one of
+        "synchronous", "threads", "processes" or "distributed"; ``workers``, the
+        number of dask workers; ``memory_limit``, the memory limit per worker
+        such as "4GiB"; ``chunk_size``, the target size of array chunks such
+        as "128MiB", which iris also uses when loading data; and
+        ``cache_directory`` and ``cache_memory_limit``, which enable memoising
+        intermediate diagnostics, spilling to the directory beyond the memory
+        limit.
+
+    Raises
+    ------
+    ValueError
+        If the scheduler is unknown, or is distributed and dask.distributed is
+        not installed.
+    """
+    scheduler = policy.get("scheduler")
+    workers = policy.get("workers")
+    memory_limit = policy.get("memory_limit")
+    chunk_size = policy.get("chunk_size")
+    cache_directory = policy.get("cache_directory")
+    cache_memory_limit = policy.get("cache_memory_limit")
+    config = {}
+    if chunk_size:
+        config["array.chunk-size"] = chunk_size
+    with contextlib.ExitStack() as stack:
+        match scheduler:
+            case None | "synchronous" | "threads" | "processes":
+                if scheduler:
+                    config["scheduler"] = scheduler
+                if workers:
+                    config["num_workers"] = workers
+                if memory_limit:
+                    logger.warning(
+                        "Memory limit is only enforced by the distributed scheduler."
+                    )
+            case "distributed":
+                try:
+                    from dask.distributed import Client, LocalCluster
+                except ImportError as err:
+                    raise ValueError(
+                        "The distributed scheduler requires dask.distributed."
+                    ) from err
+                # Single threaded workers, so workers is the number of cores
+                # used. No dashboard, so concurrent bakes don't clash on ports.
+                cluster = stack.enter_context(
+                    LocalCluster(
+                        n_workers=workers,
+                        threads_per_worker=1,
+                        memory_limit=memory_limit or "auto",
+                        dashboard_address=None,
+                    )
+                )
+                # The client registers itself as the default scheduler.
+                stack.enter_context(Client(cluster))
+            case _:
+                raise ValueError(f"Unknown dask scheduler: {scheduler}")
+        logger.info("Dask compute policy: %s", policy)
+        stack.enter_context(dask.config.set(config))
+        if cache_directory or cache_memory_limit:
+            stack.enter_context(
+                _memoise.intermediate_cache(cache_memory_limit, cache_directory)
+            )
+        yield
+
+
 def execute_recipe(
     recipe: dict,
     output_directory: Path,
     style_file: Path | None = None,
     plot_resolution: int | None = None,
     skip_write: bool | None = None,
-) -> None:
+    compute_policy: dict | None = None,
+    skip_unchanged: bool = False,
+) -> bool:
     """Parse and executes the steps from a recipe file.
 
     Parameters
@@ -206,6 +286,18 @@ def execute_recipe(
         Resolution of plots in dpi.
     skip_write: bool, optional
         Skip saving processed output alongside plots.
+    compute_policy: dict, optional
+        Dask scheduler, workers, memory limit and chunk size to use. Set values
+        override those in the recipe's ``compute`` key.
+    skip_unchanged: bool, optional
+        Keep the existing output if the recipe was already baked into the
+        output directory with the same recipe, options, input files and CSET
+        version.
+
+    Returns
+    -------
+    bool
+        Whether the recipe was baked, rather than skipped as unchanged.
 
     Raises
     ------
@@ -218,6 +310,113 @@ def execute_recipe(
     TypeError
         The provided recipe is not a stream or Path.
     """
+    return _execute_recipe(
+        recipe,
+        output_directory,
+        style_file,
+        plot_resolution,
+        skip_write,
+        compute_policy,
+        skip_unchanged,
+    )
+
+
+def execute_recipes(
+    recipes: list[tuple[dict, Path]],
+    style_file: Path | None = None,
+    plot_resolution: int | None = None,
+    skip_write: bool | None = None,
+    compute_policy: dict | None = None,
+    skip_unchanged: bool = False,
+) -> bool:
+    """Execute a set of recipes, running steps common to several only once.
+
+    Recipes starting with identical steps, such as reading the same field, share
+    the output of those steps rather than each executing them. Steps which
+    write output are always executed separately for each recipe.
+
+    Parameters
+    ----------
+    recipes: list[tuple[dict, Path]]
+        Parsed recipes, each with the output directory to bake it into.
+    style_file: Path, optional
+        Path to a style file.
+    plot_resolution: int, optional
+        Resolution of plots in dpi.
+    skip_write: bool, optional
+        Skip saving processed output alongside plots.
+    compute_policy: dict, optional
+        Dask scheduler, workers, memory limit and chunk size to use.
+    skip_unchanged: bool, optional
+        Keep the existing output of recipes that are unchanged since they were
+        last baked.
+
+    Returns
+    -------
+    bool
+        Whether every recipe was baked, rather than any being skipped as
+        unchanged.
+
+    Raises
+    ------
+    RuntimeError
+        If any of the recipes failed. The other recipes are still executed.
+    """
+    plan = _plan.RecipePlan(
+        [recipe["steps"] for recipe, _ in recipes],
+        [_recipe_compute_policy(recipe, compute_policy) for recipe, _ in recipes],
+    )
+    failed = []
+    all_baked = True
+    for index in plan.order:
+        recipe, output_directory = recipes[index]
+        try:
+            all_baked &= _execute_recipe(
+                recipe,
+                output_directory,
+                style_file,
+                plot_resolution,
+                skip_write,
+                compute_policy,
+                skip_unchanged,
+                plan,
+                index,
+            )
+        except Exception:
+            logger.exception("Recipe failed: %s", recipe.get("title", index))
+            failed.append(output_directory)
+        finally:
+            plan.release(index)
+    if failed:
+        raise RuntimeError(f"{len(failed)} recipes failed, outputs in: {failed}")
+    return all_baked
+
+
+def _recipe_compute_policy(recipe: dict, compute_policy: dict | None) -> dict:
+    """Get the compute policy to execute a recipe with.
+
+    Command line compute options take precedence over the recipe's.
+    """
+    return recipe.get("compute", {}) | {
+        key: value for key, value in (compute_policy or {}).items() if value is not None
+    }
+
+
+def _execute_recipe(
+    recipe: dict,
+    output_directory: Path,
+    style_file: Path | None,
+    plot_resolution: int | None,
+    skip_write: bool | None,
+    compute_policy: dict | None,
+    skip_unchanged: bool,
+    plan: _plan.RecipePlan | None = None,
+    plan_index: int = 0,
+) -> bool:
+    """Execute a recipe, taking the output of its shared steps from the plan.
+
+    Returns whether the recipe was baked, rather than skipped as unchanged.
+    """
     # Create output directory.
     try:
         output_directory.mkdir(parents=True, exist_ok=True)
@@ -226,6 +425,22 @@ def execute_recipe(
         raise
     steps = recipe["steps"]
 
+    # Compute policy is excluded, as it doesn't change the output.
+    fingerprint = None
+    if skip_unchanged:
+        fingerprint = _fingerprint.recipe_fingerprint(
+            recipe,
+            {
+                "style_file": style_file,
+                "plot_resolution": plot_resolution,
+                "skip_write": skip_write,
+            },
+        )
+        if _fingerprint.is_unchanged(output_directory, fingerprint):
+            logger.info("Recipe is unchanged, keeping output in %s", output_directory)
+            return False
+    _fingerprint.clear_fingerprint(output_directory)
+
     # Execute the steps in a recipe.
     original_working_directory = Path.cwd()
     try:
@@ -244,15 +459,22 @@ def execute_recipe(
             recipe["plot_resolution"] = plot_resolution
         if skip_write:
             recipe["skip_write"] = skip_write
+        recipe["compute"] = _recipe_compute_policy(recipe, compute_policy)
         _write_metadata(recipe)
 
         # Execute the recipe.
-        step_input = None
-        for step in steps:
-            step_input = _step_parser(step, step_input)
+        with _compute_policy(recipe["compute"]):
+            step_input = None
+            if plan is not None:
+                step_input = plan.prefix_output(plan_index, _step_parser)
+                steps = steps[plan.prefix_length(plan_index) :]
+            for step in steps:
+                step_input = _step_parser(step, step_input)
         logger.info("Recipe output:\n%s", step_input)
 
         logger.info("Creating diagnostic archive.")
         create_diagnostic_archive()
+        _fingerprint.record_fingerprint(output_directory, fingerprint)
     finally:
         os.chdir(original_working_directory)
+    return True
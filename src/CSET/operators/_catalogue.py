@@ -0,0 +1,348 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Field catalogue used to skip input files that cannot match a constraint.
+
+A catalogue is a small JSON file stored alongside the input data, describing
+each field of each file after the loading callbacks have been applied. It
+records the names, STASH code, cell methods, non-spatial coordinate points,
+time points and grid of every field, keyed by file name and checked against the
+file's size and modification time.
+
+Constraints created by the constraint operators carry a "field filter", a
+function that decides from a catalogue entry whether the field could possibly
+match. Files with no potentially matching fields are dropped before iris opens
+them. Anything not described by the catalogue is always loaded, so pruning can
+only ever remove files that would have produced no cubes.
+"""
+
+import json
+import logging
+import operator
+import os
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import cf_units
+import iris
+import iris.cube
+import iris.exceptions
+import numpy as np
+
+from CSET.operators._utils import get_cube_yxcoordname
+
+logger = logging.getLogger(__name__)
+
+CATALOGUE_FILENAME = ".cset_catalogue.json"
+CATALOGUE_VERSION = 1
+
+# Coordinates with more points than this are recorded as present, but their
+# points are not stored.
+_MAX_STORED_POINTS = 10000
+
+_FIELD_FILTER_ATTRIBUTE = "_cset_field_filter"
+
+
+class FieldSummary:
+    """Read-only view of a single field's catalogue entry.
+
+    This is the object passed to field filters attached to constraints.
+
+    Parameters
+    ----------
+    entry: dict
+        The field's entry from the catalogue.
+    """
+
+    def __init__(self, entry: dict):
+        self.entry = entry
+
+    @property
+    def names(self) -> set[str]:
+        """Names the field can be matched by, including its STASH code."""
+        names = set(self.entry.get("names", []))
+        if self.entry.get("stash"):
+            names.add(self.entry["stash"])
+        return names
+
+    @property
+    def stash(self) -> str | None:
+        """STASH code of the field, if any."""
+        return self.entry.get("stash")
+
+    def has_coord(self, name: str) -> bool:
+        """Whether the field has a coordinate with the given name."""
+        return name in self.entry.get("coords", {})
+
+    def coord_points(self, name: str) -> list | None:
+        """Points of the named coordinate, or None if they are not recorded."""
+        return self.entry.get("coords", {}).get(name)
+
+    def time_values(self) -> tuple[np.ndarray, cf_units.Unit] | None:
+        """Numeric time points and their units, or None if not recorded."""
+        time = self.entry.get("time")
+        if time is None:
+            return None
+        unit = cf_units.Unit(time["units"], calendar=time["calendar"])
+        return np.asarray(time["points"]), unit
+
+
+def attach_field_filter(
+    constraint: iris.Constraint, field_filter: Callable[[FieldSummary], bool]
+) -> iris.Constraint:
+    """Attach a catalogue field filter to a constraint.
+
+    The filter must return False only when no cube derived from the field
+    could satisfy the constraint.
+    """
+    setattr(constraint, _FIELD_FILTER_ATTRIBUTE, field_filter)
+    return constraint
+
+
+def get_field_filter(constraint) -> Callable[[FieldSummary], bool] | None:
+    """Get the catalogue field filter for a constraint, if possible.
+
+    Combinations of constraints are handled by combining the filters of their
+    parts. None is returned when the constraint cannot be evaluated against the
+    catalogue, in which case no files should be skipped.
+    """
+    # Iris's ConstraintCombination isn't public, so is detected by its parts.
+    if hasattr(constraint, "lhs") and hasattr(constraint, "rhs"):
+        lhs = get_field_filter(constraint.lhs)
+        rhs = get_field_filter(constraint.rhs)
+        combine = getattr(constraint, "operator", None)
+        if combine is operator.and_:
+            if lhs is None or rhs is None:
+                return lhs or rhs
+            return lambda field: lhs(field) and rhs(field)
+        if combine is operator.or_ and lhs is not None and rhs is not None:
+            return lambda field: lhs(field) or rhs(field)
+        return None
+    return getattr(constraint, _FIELD_FILTER_ATTRIBUTE, None)
+
+
+def _points_list(coord) -> list | None:
+    """Convert a coordinate's points into a JSON serialisable list."""
+    if coord.points.ndim != 1 or coord.points.size > _MAX_STORED_POINTS:
+        return None
+    if not np.issubdtype(coord.points.dtype, np.number):
+        return None
+    return coord.points.tolist()
+
+
+def _summarise_cube(index: int, cube: iris.cube.Cube) -> dict:
+    """Create the catalogue entry for a single loaded field."""
+    try:
+        y_name, x_name = get_cube_yxcoordname(cube)
+        grid = {
+            "y": y_name,
+            "x": x_name,
+            "shape": [len(cube.coord(y_name).points), len(cube.coord(x_name).points)],
+            "coord_system": str(cube.coord(y_name).coord_system),
+        }
+    except ValueError:
+        y_name = x_name = None
+        grid = None
+
+    # Coordinates are recorded under all their names, as iris matches on any.
+    coords = {}
+    for coord in cube.coords():
+        if coord.name() in (y_name, x_name):
+            continue
+        points = _points_list(coord)
+        for name in (coord.standard_name, coord.long_name, coord.var_name):
+            if name is not None:
+                coords[name] = points
+
+    time = None
+    if cube.coords("time"):
+        time_coord = cube.coord("time")
+        time_points = _points_list(time_coord)
+        if time_points is not None:
+            time = {
+                "units": time_coord.units.origin,
+                "calendar": time_coord.units.calendar,
+                "points": time_points,
+            }
+
+    stash = cube.attributes.get("STASH")
+    return {
+        "index": index,
+        "names": [
+            name
+            for name in (cube.standard_name, cube.long_name, cube.var_name)
+            if name is not None
+        ],
+        "stash": str(stash) if stash is not None else None,
+        "cell_methods": [str(cm) for cm in cube.cell_methods],
+        "coords": coords,
+        "time": time,
+        "grid": grid,
+    }
+
+
+def _file_signature(path: Path) -> dict:
+    """Size and modification time used to detect changed files."""
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _index_file(path: Path) -> dict:
+    """Create the catalogue record for a file.
+
+    Files that can't be read are recorded without fields, so they are always
+    loaded, where any error is raised as normal.
+    """
+    # Imported here to avoid a circular import, as read uses this module.
+    from CSET.operators.read import _loading_callback
+
+    signature = _file_signature(path)
+    try:
+        cubes = iris.load_raw(path, callback=_loading_callback)
+    except (OSError, ValueError, iris.exceptions.IrisError) as err:
+        logger.warning("Could not add %s to field catalogue: %s", path, err)
+        return signature | {"fields": None}
+    return signature | {
+        "fields": [_summarise_cube(i, cube) for i, cube in enumerate(cubes)]
+    }
+
+
+def load_catalogue(directory: Path) -> dict:
+    """Load the catalogue of a directory, returning an empty one if missing."""
+    try:
+        with open(directory / CATALOGUE_FILENAME, "rt", encoding="UTF-8") as fp:
+            catalogue = json.load(fp)
+        if catalogue.get("version") == CATALOGUE_VERSION:
+            return catalogue
+        logger.debug("Ignoring catalogue with different version in %s", directory)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as err:
+        logger.warning("Ignoring unreadable field catalogue in %s: %s", directory, err)
+    return {"version": CATALOGUE_VERSION, "files": {}}
+
+
+def _save_catalogue(directory: Path, catalogue: dict):
+    """Atomically write the catalogue, so concurrent readers never see a partial file."""
+    try:
+        with tempfile.NamedTemporaryFile(
+            "wt", dir=directory, prefix=CATALOGUE_FILENAME, delete=False
+        ) as fp:
+            json.dump(catalogue, fp)
+        os.replace(fp.name, directory / CATALOGUE_FILENAME)
+    except OSError as err:
+        logger.debug("Could not write field catalogue in %s: %s", directory, err)
+
+
+def _is_current(record: dict | None, path: Path) -> bool:
+    """Check a catalogue record still describes the file on disk."""
+    if record is None:
+        return False
+    try:
+        return {"size": record["size"], "mtime": record["mtime"]} == _file_signature(
+            path
+        )
+    except (KeyError, OSError):
+        return False
+
+
+def update_catalogue(directory: Path, files: Iterable[Path] | None = None) -> dict:
+    """Add new or changed files to a directory's catalogue.
+
+    Parameters
+    ----------
+    directory: Path
+        Directory containing the data, into which the catalogue is written.
+    files: Iterable[Path], optional
+        Files to ensure are catalogued. Defaults to all files in the directory.
+
+    Returns
+    -------
+    catalogue: dict
+        The up to date catalogue.
+    """
+    directory = Path(directory)
+    if files is None:
+        files = (
+            p
+            for p in directory.iterdir()
+            if p.is_file() and not p.name.startswith(CATALOGUE_FILENAME)
+        )
+    catalogue = load_catalogue(directory)
+    changed = False
+    for path in files:
+        if not _is_current(catalogue["files"].get(path.name), path):
+            logger.debug("Adding %s to field catalogue.", path)
+            catalogue["files"][path.name] = _index_file(path)
+            changed = True
+    if changed:
+        _save_catalogue(directory, catalogue)
+    return catalogue
+
+
+def prune_files(files: list[Path], constraint) -> list[Path]:
+    """Remove files which the catalogue shows cannot match the constraint.
+
+    A catalogue is only built lazily for a directory when all of its files are
+    being read, as is the case when CSET is pointed at a data directory.
+    Otherwise an existing catalogue is used if present, and files it does not
+    describe are kept.
+
+    Parameters
+    ----------
+    files: list[Path]
+        Files that would be loaded.
+    constraint: iris.Constraint | None
+        Constraint that will be used when loading.
+
+    Returns
+    -------
+    list[Path]
+        Files that might contain matching fields, in their original order.
+    """
+    field_filter = get_field_filter(constraint)
+    if field_filter is None:
+        return files
+
+    by_directory: dict[Path, list[Path]] = {}
+    for path in files:
+        by_directory.setdefault(path.parent, []).append(path)
+
+    candidates = set()
+    for directory, dir_files in by_directory.items():
+        whole_directory = {p.name for p in dir_files} == {
+            p.name
+            for p in directory.iterdir()
+            if p.is_file() and not p.name.startswith(CATALOGUE_FILENAME)
+        }
+        if whole_directory or (directory / CATALOGUE_FILENAME).is_file():
+            catalogue = update_catalogue(directory, dir_files)
+        else:
+            catalogue = {"files": {}}
+        for path in dir_files:
+            record = catalogue["files"].get(path.name)
+            if (
+                not _is_current(record, path)
+                or record["fields"] is None
+                or any(field_filter(FieldSummary(field)) for field in record["fields"])
+            ):
+                candidates.add(path)
+
+    pruned = [path for path in files if path in candidates]
+    logger.info(
+        "Field catalogue excluded %s of %s files.", len(files) - len(pruned), len(files)
+    )
+    return pruned
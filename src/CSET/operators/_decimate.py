@@ -0,0 +1,191 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reduction of spatial fields to the resolution they are displayed at.
+
+A 10 inch figure at 100 dpi has only about 1000 pixels across, so drawing a
+field with many more grid cells than that wastes time building and projecting
+a mesh of cells smaller than a pixel. Fields are reduced by aggregating blocks
+of grid cells, so that there are at most a given number of cells along each
+spatial dimension.
+"""
+
+import logging
+import math
+
+import iris.cube
+import numpy as np
+
+from CSET.operators._utils import get_cube_yxcoordname
+
+logger = logging.getLogger(__name__)
+
+DECIMATION_METHODS = ("AUTO", "MEAN", "MAX", "MODE", "STRIDE")
+
+
+def check_decimation_method(method: str):
+    """Raise a ValueError if the decimation method is not recognised."""
+    if method not in DECIMATION_METHODS:
+        raise ValueError(
+            f"Unknown decimation method {method}, expected one of {DECIMATION_METHODS}"
+        )
+
+
+def _block_factor(size: int, max_cells: int) -> int:
+    """Get the number of cells to aggregate along a dimension."""
+    return max(1, math.ceil(size / max_cells))
+
+
+def _blocks(data: np.ndarray, dims: tuple[int, int], factors: tuple[int, int]):
+    """View data as blocks, with the cells of each block on the last axis.
+
+    The spatial dimensions are moved to the end, and padded with masked values
+    to a whole number of blocks.
+    """
+    data = np.ma.masked_invalid(np.moveaxis(data, dims, (-2, -1)), copy=False)
+    ny, nx = data.shape[-2:]
+    fy, fx = factors
+    by, bx = -(-ny // fy), -(-nx // fx)
+    padded = np.ma.masked_all(data.shape[:-2] + (by * fy, bx * fx), dtype=data.dtype)
+    padded[..., :ny, :nx] = data
+    blocks = padded.reshape(padded.shape[:-2] + (by, fy, bx, fx))
+    blocks = np.swapaxes(blocks, -3, -2)
+    return blocks.reshape(blocks.shape[:-2] + (fy * fx,))
+
+
+def _block_mode(blocks: np.ma.MaskedArray) -> np.ma.MaskedArray:
+    """Most common value of each block, ignoring masked cells."""
+    categories = np.unique(blocks.compressed())
+    if categories.size == 0:
+        return np.ma.masked_all(blocks.shape[:-1], dtype=blocks.dtype)
+    counts = np.stack(
+        [
+            np.ma.filled(blocks == category, False).sum(axis=-1)
+            for category in categories
+        ]
+    )
+    mode = categories[np.argmax(counts, axis=0)]
+    return np.ma.masked_where(counts.max(axis=0) == 0, mode)
+
+
+def _block_level_mode(blocks: np.ma.MaskedArray, levels) -> np.ma.MaskedArray:
+    """Value from the most common colour level of each block.
+
+    Each cell is binned by the boundaries of the colour levels, as a
+    BoundaryNorm does, and each block takes the first of its values in its
+    most common bin, so it is drawn in a colour of the colour scale.
+    """
+    bins = np.ma.masked_array(
+        np.digitize(np.ma.getdata(blocks), levels), mask=np.ma.getmaskarray(blocks)
+    )
+    mode = _block_mode(bins)
+    matches = np.ma.filled(bins == mode[..., None], False)
+    first = np.argmax(matches, axis=-1)[..., None]
+    values = np.take_along_axis(np.ma.getdata(blocks), first, axis=-1)[..., 0]
+    return np.ma.masked_array(values, mask=np.ma.getmaskarray(mode))
+
+
+def _reduce_coord(coord, factor: int):
+    """Copy of a 1D coordinate with a point and bounds for each block of cells."""
+    points = coord.points
+    n_blocks = -(-points.size // factor)
+    starts = np.arange(n_blocks) * factor
+    ends = np.minimum(starts + factor, points.size) - 1
+    bounds = coord.bounds if coord.has_bounds() else None
+    reduced = coord.copy(points=(points[starts] + points[ends]) / 2)
+    if bounds is not None:
+        reduced.bounds = np.stack([bounds[starts, 0], bounds[ends, 1]], axis=-1)
+    return reduced
+
+
+def decimate_for_display(
+    cube: iris.cube.Cube, max_cells: int, method: str = "AUTO", levels=None
+) -> iris.cube.Cube:
+    """Reduce a spatial field to at most max_cells along each spatial dimension.
+
+    Parameters
+    ----------
+    cube: Cube
+        Cube with two spatial dimensions, and possibly other dimensions.
+    max_cells: int
+        Maximum number of cells along each spatial dimension, such as the
+        number of pixels across the figure.
+    method: str, optional
+        How to aggregate blocks of cells. 'MEAN' or 'MAX' for continuous
+        fields, 'MODE' for categorical fields, or 'STRIDE' to take the first
+        cell of each block. 'AUTO' takes the most common colour level of each
+        block if the field has discrete colour levels, and otherwise uses
+        'MODE' for integer and boolean fields, and 'MEAN' for others.
+    levels: array-like, optional
+        Boundaries of the discrete colour levels the field is plotted with,
+        such as those of a BoundaryNorm.
+
+    Returns
+    -------
+    Cube
+        The reduced cube, or the original cube if it is already small enough
+        or is not a spatial field.
+
+    Raises
+    ------
+    ValueError
+        If the method is not recognised.
+    """
+    check_decimation_method(method)
+    try:
+        y_name, x_name = get_cube_yxcoordname(cube)
+    except ValueError:
+        return cube
+    y_dims, x_dims = cube.coord_dims(y_name), cube.coord_dims(x_name)
+    # Only rectilinear grids with 1D spatial coordinates are reduced.
+    if len(y_dims) != 1 or len(x_dims) != 1 or y_dims == x_dims:
+        return cube
+    dims = (y_dims[0], x_dims[0])
+    factors = tuple(_block_factor(cube.shape[dim], max_cells) for dim in dims)
+    if factors == (1, 1):
+        return cube
+
+    if method == "AUTO":
+        integral = np.issubdtype(cube.dtype, np.integer) or cube.dtype == bool
+        if levels is not None:
+            method = "LEVEL_MODE"
+        else:
+            method = "MODE" if integral else "MEAN"
+    logger.debug(
+        "Decimating %s by %s for display using %s.", cube.name(), factors, method
+    )
+
+    # Subsampling the cube gives the reduced shape with all its coordinates.
+    keys = [slice(None)] * cube.ndim
+    for dim, factor in zip(dims, factors, strict=True):
+        keys[dim] = slice(None, None, factor)
+    reduced = cube[tuple(keys)]
+    if method != "STRIDE":
+        blocks = _blocks(cube.data, dims, factors)
+        if method == "LEVEL_MODE":
+            data = _block_level_mode(blocks, levels)
+        elif method == "MODE":
+            data = _block_mode(blocks)
+        elif method == "MAX":
+            data = blocks.max(axis=-1)
+        else:
+            data = blocks.mean(axis=-1)
+        data = np.moveaxis(data, (-2, -1), dims)
+        reduced.data = data if np.ma.is_masked(data) else np.ma.getdata(data)
+
+    # Spatial coordinates cover the whole of each block.
+    for name, factor in zip((y_name, x_name), factors, strict=True):
+        reduced.replace_coord(_reduce_coord(cube.coord(name), factor))
+    return reduced
@@ -0,0 +1,126 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fingerprints of baked recipes, used to skip recipes that haven't changed.
+
+A fingerprint is a SHA-256 digest of the recipe, the options it is baked with,
+the size and modification time of each of its input files, and the CSET
+version. It is recorded in the output directory once a recipe has been baked
+successfully, so when a cycle is rerun only recipes whose definition or inputs
+have changed need to be baked again.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_FILENAME = ".cset_fingerprint.json"
+
+
+def _input_paths(step) -> Iterator:
+    """Get the file paths given to all read operators in a recipe's steps."""
+    if isinstance(step, dict):
+        if str(step.get("operator", "")).startswith("read.") and "file_paths" in step:
+            yield step["file_paths"]
+        for value in step.values():
+            yield from _input_paths(value)
+    elif isinstance(step, list):
+        for value in step:
+            yield from _input_paths(value)
+
+
+def _file_record(path: Path) -> list:
+    """Path, size and modification time of a file."""
+    stat = path.stat()
+    return [str(path.resolve()), stat.st_size, stat.st_mtime_ns]
+
+
+def recipe_fingerprint(recipe: dict, options: dict) -> str | None:
+    """Calculate the fingerprint of a recipe and its inputs.
+
+    Parameters
+    ----------
+    recipe: dict
+        Parsed recipe, with its variables substituted.
+    options: dict
+        Other options affecting the output, such as the plot resolution. Any
+        path given as the style_file is treated as an input file.
+
+    Returns
+    -------
+    str | None
+        Hex digest of the fingerprint, or None if the inputs can't be found,
+        in which case the recipe should always be baked.
+    """
+    # Imported here to avoid a circular import, as read is an operator.
+    from CSET.operators.read import _check_input_files
+
+    try:
+        inputs = [
+            [_file_record(path) for path in _check_input_files(file_paths)]
+            for file_paths in _input_paths(recipe.get("steps", []))
+        ]
+        if options.get("style_file"):
+            inputs.append([_file_record(Path(options["style_file"]))])
+    except (FileNotFoundError, OSError) as err:
+        logger.debug("No fingerprint as inputs can't be found: %s", err)
+        return None
+
+    content = {
+        "recipe": recipe,
+        "options": options,
+        "inputs": inputs,
+        "version": importlib.metadata.version("CSET"),
+    }
+    serialised = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.sha256(serialised).hexdigest()
+
+
+def is_unchanged(output_directory: Path, fingerprint: str | None) -> bool:
+    """Check whether the output directory was baked with the same fingerprint."""
+    if fingerprint is None:
+        return False
+    try:
+        with open(output_directory / FINGERPRINT_FILENAME, encoding="UTF-8") as fp:
+            return json.load(fp).get("fingerprint") == fingerprint
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def clear_fingerprint(output_directory: Path):
+    """Remove any recorded fingerprint, as the outputs are being replaced."""
+    (output_directory / FINGERPRINT_FILENAME).unlink(missing_ok=True)
+
+
+def record_fingerprint(output_directory: Path, fingerprint: str | None):
+    """Record the fingerprint of a successfully baked recipe."""
+    if fingerprint is None:
+        return
+    # Written atomically, so an interrupted write never matches.
+    try:
+        with tempfile.NamedTemporaryFile(
+            "wt", dir=output_directory, prefix=FINGERPRINT_FILENAME, delete=False
+        ) as fp:
+            json.dump({"fingerprint": fingerprint}, fp)
+        os.replace(fp.name, output_directory / FINGERPRINT_FILENAME)
+    except OSError as err:
+        logger.warning("Could not record recipe fingerprint: %s", err)
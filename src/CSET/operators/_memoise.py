@@ -0,0 +1,340 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memoisation of intermediate arrays shared between derived diagnostics.
+
+Derived diagnostics such as relative humidity and equivalent potential
+temperature share intermediates like the vapour pressure and exner pressure.
+Functions calculating these intermediates are decorated with ``memoise``, so
+while an intermediate cache is active each intermediate is only computed once.
+
+The cache is keyed on the units of each input cube and a token of its data,
+along with any other arguments. Concrete data is tokenised by its content, and
+lazy data by its dask graph, so it isn't computed. Intermediates stay lazy:
+within a cache the blocks of an intermediate are named by its key, so its tasks
+are shared by everything computed together, and the blocks that are computed
+are kept. Later calls use the kept blocks rather than computing them again.
+
+Blocks are held in memory up to a memory budget, beyond which the least
+recently used are spilled to the cache directory, if one is given. Blocks still
+in memory are also written to the directory when the cache is closed, so
+recipes baked later with the same directory reuse them, provided their inputs
+have the same tokens. Blocks computed in other processes, such as by the
+processes or distributed schedulers, are written straight to the directory.
+
+Without an active cache the decorated functions are called as normal.
+"""
+
+import contextlib
+import functools
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+import dask
+import dask.array as da
+import dask.array.utils
+import dask.base
+import dask.utils
+import iris.cube
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_LIMIT = "1GiB"
+
+
+def _block_path(directory: Path, key: str) -> Path:
+    return directory / f"{key}.npz"
+
+
+def _read_block(directory: Path, key: str) -> np.ndarray | None:
+    """Read a block from a cache directory, or None if it isn't there."""
+    try:
+        with np.load(_block_path(directory, key)) as spilled:
+            array = spilled["data"]
+            if "mask" in spilled:
+                array = np.ma.masked_array(array, mask=spilled["mask"])
+    except (OSError, ValueError, KeyError):
+        return None
+    logger.debug("Loaded intermediate %s from %s", key, directory)
+    return array
+
+
+def _write_block(directory: Path, key: str, array: np.ndarray):
+    """Write a block to a cache directory, unless it is already there."""
+    if _block_path(directory, key).exists():
+        return
+    arrays = {"data": np.ma.getdata(array)}
+    if np.ma.is_masked(array):
+        arrays["mask"] = np.ma.getmaskarray(array)
+    # Written atomically, as concurrent bakes may share the directory.
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=directory, suffix=".npz", delete=False
+        ) as fp:
+            np.savez(fp, **arrays)
+        os.replace(fp.name, _block_path(directory, key))
+    except OSError as err:
+        logger.warning("Could not spill intermediate to %s: %s", directory, err)
+
+
+class IntermediateCache:
+    """Least recently used cache of computed blocks of arrays, spilling to disk.
+
+    Parameters
+    ----------
+    memory_limit: int
+        Maximum number of bytes of blocks to hold in memory. Arrays larger
+        than this are not cached.
+    directory: Path, optional
+        Directory to spill blocks to, and look for previously spilled blocks
+        in. If not given, blocks evicted from memory are discarded.
+    """
+
+    def __init__(self, memory_limit: int, directory: Path | None = None):
+        self.memory_limit = memory_limit
+        self.directory = Path(directory) if directory is not None else None
+        # Tasks refer to the cache by its identifier, so they can be pickled.
+        self.cache_id = uuid.uuid4().hex
+        self._arrays: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._memory_used = 0
+        # Blocks are added by the threads computing them.
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Get a cached array, or None if it is not cached."""
+        with self._lock:
+            if key in self._arrays:
+                self._arrays.move_to_end(key)
+                return self._arrays[key]
+        if self.directory is None:
+            return None
+        array = _read_block(self.directory, key)
+        if array is not None:
+            self.put(key, array)
+        return array
+
+    def put(self, key: str, array: np.ndarray):
+        """Add a computed array to the cache."""
+        if array.nbytes > self.memory_limit:
+            logger.debug("Intermediate %s is too large to cache.", key)
+            return
+        with self._lock:
+            if key in self._arrays:
+                return
+            self._arrays[key] = array
+            self._memory_used += array.nbytes
+            evicted = []
+            while self._memory_used > self.memory_limit:
+                evicted.append(self._arrays.popitem(last=False))
+                self._memory_used -= evicted[-1][1].nbytes
+        if self.directory is not None:
+            for evicted_key, evicted_array in evicted:
+                _write_block(self.directory, evicted_key, evicted_array)
+
+    def _cached_block(self, key: str, shape, meta) -> da.Array | None:
+        """Lazy array of a cached block, or None if it is not cached.
+
+        Blocks in memory are held onto, and spilled blocks are only loaded when
+        the array is computed.
+        """
+        with self._lock:
+            block = self._arrays.get(key)
+        if block is not None:
+            return da.from_array(block, chunks=block.shape, asarray=False)
+        if self.directory is None or not _block_path(self.directory, key).exists():
+            return None
+        return da.from_delayed(
+            dask.delayed(_load_block)(self.cache_id, self.directory, key),
+            shape,
+            dtype=meta.dtype,
+            meta=meta,
+        )
+
+    def intermediate(self, key: str, evaluate: Callable[[], da.Array]) -> da.Array:
+        """Get the lazy array of an intermediate, caching its computed blocks.
+
+        Parameters
+        ----------
+        key: str
+            Key identifying the intermediate.
+        evaluate: Callable[[], dask.array.Array]
+            Function creating the lazy array of the intermediate. The blocks
+            of the array are named by the key, so arrays created for the same
+            key share their tasks when computed together.
+
+        Returns
+        -------
+        dask.array.Array
+            Lazy array of the intermediate. Blocks that have already been
+            computed are taken from the cache, and the others are cached when
+            they are computed.
+        """
+        result = evaluate()
+        if result.nbytes > self.memory_limit:
+            logger.debug("Intermediate %s is too large to cache.", key)
+            return result
+        meta = dask.array.utils.meta_from_array(result)
+        stored = result.map_blocks(
+            _store_block,
+            self.cache_id,
+            self.directory,
+            key,
+            dtype=result.dtype,
+            meta=meta,
+            name=f"memoise-{key}",
+        )
+        blocks = {}
+        for index in np.ndindex(result.numblocks):
+            shape = tuple(c[i] for c, i in zip(result.chunks, index, strict=True))
+            blocks[index] = self._cached_block(_block_key(key, index), shape, meta)
+        cached = sum(block is not None for block in blocks.values())
+        if cached:
+            logger.debug("Reusing %s cached blocks of %s", cached, key)
+
+            def nested(index: tuple[int, ...]):
+                if len(index) == result.ndim:
+                    block = blocks[index]
+                    return stored.blocks[index] if block is None else block
+                return [
+                    nested(index + (i,)) for i in range(result.numblocks[len(index)])
+                ]
+
+            stored = da.block(nested(()))
+        return stored
+
+    def close(self):
+        """Discard the blocks held in memory, writing them to the directory.
+
+        Blocks are written to the directory if there is one, so later recipes
+        can reuse them.
+        """
+        with self._lock:
+            arrays = list(self._arrays.items())
+            self._arrays.clear()
+            self._memory_used = 0
+        if self.directory is not None:
+            for key, array in arrays:
+                _write_block(self.directory, key, array)
+
+
+def _block_key(key: str, index: tuple[int, ...]) -> str:
+    """Key of a block of an intermediate, by its position."""
+    return f"{key}-{'_'.join(str(i) for i in index)}"
+
+
+# Caches by their identifier, for the tasks computing and loading blocks.
+_caches: dict[str, IntermediateCache] = {}
+
+
+def _store_block(
+    block: np.ndarray,
+    cache_id: str,
+    directory: Path | None,
+    key: str,
+    block_info=None,
+) -> np.ndarray:
+    """Cache a block of an intermediate as it is computed.
+
+    In processes without the cache, the block is written to its directory.
+    """
+    if block_info is not None:
+        block_key = _block_key(key, block_info[None]["chunk-location"])
+        cache = _caches.get(cache_id)
+        if cache is not None:
+            cache.put(block_key, block)
+        elif directory is not None:
+            _write_block(directory, block_key, block)
+    return block
+
+
+def _load_block(cache_id: str, directory: Path, key: str) -> np.ndarray:
+    """Load a block of an intermediate spilled to the cache directory."""
+    cache = _caches.get(cache_id)
+    block = cache.get(key) if cache is not None else _read_block(directory, key)
+    if block is None:
+        raise FileNotFoundError(f"Intermediate {key} is missing from {directory}")
+    return block
+
+
+_active_cache: IntermediateCache | None = None
+
+
+@contextlib.contextmanager
+def intermediate_cache(
+    memory_limit: str | int | None = None, directory: Path | None = None
+):
+    """Memoise intermediates within the context.
+
+    Parameters
+    ----------
+    memory_limit: str | int, optional
+        Memory budget for intermediates, either in bytes or as a string such as
+        "1GiB". Defaults to DEFAULT_MEMORY_LIMIT.
+    directory: Path, optional
+        Directory to spill intermediates to, shared between recipes.
+    """
+    global _active_cache
+    if isinstance(memory_limit, str) or memory_limit is None:
+        memory_limit = dask.utils.parse_bytes(memory_limit or DEFAULT_MEMORY_LIMIT)
+    previous_cache = _active_cache
+    _active_cache = IntermediateCache(memory_limit, directory)
+    _caches[_active_cache.cache_id] = _active_cache
+    try:
+        yield _active_cache
+    finally:
+        _active_cache.close()
+        del _caches[_active_cache.cache_id]
+        _active_cache = previous_cache
+
+
+def _fingerprint(value):
+    """Token identifying an argument, using the content of cubes' data."""
+    if isinstance(value, iris.cube.Cube):
+        # Lazy data is identified by its dask graph, so isn't computed.
+        return (str(value.units), dask.base.tokenize(value.core_data()))
+    return value
+
+
+def memoise(func: Callable[..., da.Array]) -> Callable[..., da.Array]:
+    """Memoise a function calculating an intermediate array from cubes.
+
+    While an intermediate cache is active, the blocks of the result are cached
+    as they are computed, so for each distinct set of arguments they are only
+    computed once.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _active_cache
+        if cache is None:
+            return func(*args, **kwargs)
+        key = dask.base.tokenize(
+            func.__module__,
+            func.__qualname__,
+            [_fingerprint(arg) for arg in args],
+            {name: _fingerprint(value) for name, value in sorted(kwargs.items())},
+        )
+        return cache.intermediate(key, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,167 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Planning the execution of a set of recipes, sharing their common steps.
+
+Recipes for the same model and field often start with identical steps, such as
+reading a field and collapsing it, before plotting it in different ways. Each
+step is canonicalised into a key of its operator and arguments, including any
+nested steps, so the steps of all the recipes form a tree of shared prefixes.
+Each distinct prefix is executed once, and its output shared with every recipe
+starting with it.
+
+Only steps without side effects are shared. The first step which writes output,
+or depends on the recipe's output directory, and all the steps after it are
+executed separately for each recipe. Steps are also only shared between recipes
+executed with the same compute policy.
+"""
+
+import json
+import logging
+from collections.abc import Callable
+
+import iris.cube
+
+logger = logging.getLogger(__name__)
+
+# Operators in these modules write output or read the recipe's metadata.
+_UNSHAREABLE_MODULES = frozenset({"feature", "plot", "write"})
+
+
+def canonical_step(step: dict) -> str:
+    """Get a key identifying a step by its operator and all its arguments."""
+    return json.dumps(step, sort_keys=True, default=repr)
+
+
+def _is_shareable(step) -> bool:
+    """Whether a step and all its nested steps are free of side effects."""
+    if isinstance(step, dict):
+        operator = step.get("operator")
+        if isinstance(operator, str) and operator.split(".")[0] in _UNSHAREABLE_MODULES:
+            return False
+        return all(_is_shareable(value) for value in step.values())
+    if isinstance(step, list):
+        return all(_is_shareable(value) for value in step)
+    return True
+
+
+def shareable_prefix_length(steps: list[dict]) -> int:
+    """Get the number of leading steps which can be shared between recipes."""
+    for index, step in enumerate(steps):
+        if not _is_shareable(step):
+            return index
+    return len(steps)
+
+
+def share(value):
+    """Copy a step's output, so it isn't modified by the steps consuming it.
+
+    Cubes are copied, which keeps lazy data lazy. Other outputs are shared.
+    """
+    if isinstance(value, iris.cube.Cube):
+        return value.copy()
+    if isinstance(value, iris.cube.CubeList):
+        return iris.cube.CubeList(share(cube) for cube in value)
+    return value
+
+
+class RecipePlan:
+    """Execution plan for a set of recipes, sharing their common prefixes.
+
+    Parameters
+    ----------
+    step_lists: list[list[dict]]
+        The steps of each recipe.
+    contexts: list[dict], optional
+        Settings each recipe's steps are executed with, such as its compute
+        policy. Prefixes are only shared between recipes with equal contexts.
+    """
+
+    def __init__(
+        self, step_lists: list[list[dict]], contexts: list[dict] | None = None
+    ):
+        self._steps = step_lists
+        self._contexts = [
+            canonical_step(context) for context in contexts or [{}] * len(step_lists)
+        ]
+        self._prefixes = [
+            tuple(
+                canonical_step(step) for step in steps[: shareable_prefix_length(steps)]
+            )
+            for steps in step_lists
+        ]
+        # Recipes sharing prefixes are run consecutively, so shared outputs are
+        # only held while they are needed.
+        self.order = sorted(
+            range(len(step_lists)), key=lambda i: (self._contexts[i], self._prefixes[i])
+        )
+        self._users: dict[tuple[str, ...], int] = {}
+        for index in range(len(step_lists)):
+            for key in self._keys(index):
+                self._users[key] = self._users.get(key, 0) + 1
+        self._outputs: dict[tuple[str, ...], object] = {}
+
+        total = sum(len(prefix) for prefix in self._prefixes)
+        logger.info(
+            "Planned %s recipes, merging %s shareable steps into %s.",
+            len(step_lists),
+            total,
+            len(self._users),
+        )
+
+    def _keys(self, index: int) -> list[tuple[str, ...]]:
+        """Get the keys of each of the shared steps of a recipe."""
+        prefix = self._prefixes[index]
+        return [
+            (self._contexts[index], *prefix[:length])
+            for length in range(1, len(prefix) + 1)
+        ]
+
+    def prefix_length(self, index: int) -> int:
+        """Get the number of steps of a recipe that are shared."""
+        return len(self._prefixes[index])
+
+    def prefix_output(self, index: int, evaluate: Callable[[dict, object], object]):
+        """Get the output of the shared steps of a recipe.
+
+        Parameters
+        ----------
+        index: int
+            Index of the recipe.
+        evaluate: Callable
+            Function executing a single step given the previous step's output.
+
+        Returns
+        -------
+        object
+            A copy of the output of the last shared step, or None if the recipe
+            has no shared steps.
+        """
+        output = None
+        for length, key in enumerate(self._keys(index), start=1):
+            if key not in self._outputs:
+                step = self._steps[index][length - 1]
+                self._outputs[key] = evaluate(step, share(output))
+            else:
+                logger.debug("Reusing output of shared step %s", key[-1])
+            output = self._outputs[key]
+        return share(output)
+
+    def release(self, index: int):
+        """Discard shared outputs that no remaining recipe needs."""
+        for key in self._keys(index):
+            self._users[key] -= 1
+            if self._users[key] == 0:
+                self._outputs.pop(key, None)
@@ -0,0 +1,100 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Multi-resolution tile pyramids of rendered plots.
+
+A plot rendered at high resolution is cut into square tiles, stored in a
+``{zoom}/{x}/{y}.png`` directory layout like XYZ map tiles. Zoom level 0 fits
+the whole plot in a single tile, and each further level doubles the resolution,
+up to the full resolution of the rendered plot. Each level is downsampled from
+the level above, so the plot is only rendered once.
+
+A ``tiles.json`` descriptor records the tile size and the size of each level,
+and is used by the tile viewer of the plot page.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+
+import PIL.Image
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+# Limit on the zoom level, so rendered plots are at most 8192 pixels across.
+MAX_ZOOM = 5
+DESCRIPTOR_FILENAME = "tiles.json"
+
+
+def zoom_levels(cells: int) -> int:
+    """Get the highest zoom level needed to show a number of grid cells."""
+    if cells <= TILE_SIZE:
+        return 0
+    return min(MAX_ZOOM, math.ceil(math.log2(cells / TILE_SIZE)))
+
+
+def rendered_size(cells: int) -> int:
+    """Get the size in pixels to render a plot of a number of grid cells at."""
+    return TILE_SIZE * 2 ** zoom_levels(cells)
+
+
+def write_tile_pyramid(image: PIL.Image.Image, directory: Path) -> Path:
+    """Cut an image into a pyramid of tiles.
+
+    Parameters
+    ----------
+    image: PIL.Image.Image
+        The plot rendered at the highest resolution to be shown.
+    directory: Path
+        Directory to write the tiles and their descriptor into.
+
+    Returns
+    -------
+    Path
+        Path to the descriptor of the tile pyramid.
+    """
+    directory = Path(directory)
+    max_zoom = zoom_levels(max(image.size))
+    levels = [image]
+    for _ in range(max_zoom):
+        levels.append(levels[-1].reduce(2))
+    levels.reverse()
+
+    for zoom, level in enumerate(levels):
+        width, height = level.size
+        for x in range(math.ceil(width / TILE_SIZE)):
+            column = directory / str(zoom) / str(x)
+            column.mkdir(parents=True, exist_ok=True)
+            for y in range(math.ceil(height / TILE_SIZE)):
+                box = (
+                    x * TILE_SIZE,
+                    y * TILE_SIZE,
+                    min((x + 1) * TILE_SIZE, width),
+                    min((y + 1) * TILE_SIZE, height),
+                )
+                level.crop(box).save(column / f"{y}.png")
+
+    descriptor = {
+        "tile_size": TILE_SIZE,
+        "max_zoom": max_zoom,
+        "levels": [list(level.size) for level in levels],
+    }
+    descriptor_path = directory / DESCRIPTOR_FILENAME
+    with open(descriptor_path, "wt", encoding="UTF-8") as fp:
+        json.dump(descriptor, fp)
+    logger.debug("Wrote %s zoom levels of tiles to %s", max_zoom + 1, directory)
+    return descriptor_path
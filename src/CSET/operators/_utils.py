@@ -25,6 +25,8 @@ import re
 from datetime import timedelta
 from pathlib import Path
 
+import cf_units
+import dask.array as da
 import iris
 import iris.coords
 import iris.cube
@@ -225,6 +227,31 @@ def get_cube_coordindex(cube: iris.cube.Cube, coord_name) -> int:
     return coord_index
 
 
+def lazy_data_in_units(cube: iris.cube.Cube, units: str) -> da.Array:
+    """Return the data of a cube as a lazy array in the given units.
+
+    Unlike converting the units of a copy of the cube, this neither copies nor
+    realises the data, so it can be used as part of a larger lazy expression.
+
+    Arguments
+    ---------
+    cube: iris.cube.Cube
+        Cube whose data is wanted.
+    units: str
+        Units to convert the data into.
+
+    Returns
+    -------
+    dask.array.Array
+        The cube's data converted into the requested units.
+    """
+    data = cube.lazy_data()
+    units = cf_units.Unit(units)
+    if cube.units == units:
+        return data
+    return data.map_blocks(cube.units.convert, units)
+
+
 def is_spatialdim(cube: iris.cube.Cube) -> bool:
     """Determine whether a cube is has two spatial dimension coordinates.
 
@@ -16,9 +16,11 @@
 
 import logging
 
+import dask.array as da
 import iris
 import iris.analysis
 import iris.coord_categorisation
+import iris.coords
 import iris.cube
 import iris.exceptions
 import iris.util
@@ -42,6 +44,245 @@ def _add_nref(cube: iris.cube.Cube):
     return cube
 
 
+# Coordinates identifying a case and lead time, in the order of the dimensions
+# of an aggregatable cube.
+_CASE_COORDS = ("forecast_period", "forecast_reference_time")
+
+
+def _compatibility_signature(cube: iris.cube.Cube) -> tuple:
+    """Hashable signature equal for cubes that may be compatible to combine.
+
+    Cubes with different signatures are never compatible, but cubes with the
+    same signature must still be checked with ``iris.cube.Cube.is_compatible``,
+    which also compares their units and the attributes common to both.
+    """
+    return (cube.name(), tuple(cube.cell_methods))
+
+
+def _over_cases(
+    values: np.ndarray, dims: tuple[int, ...], case_dims: list[int], case_shape
+) -> np.ndarray:
+    """Flatten coordinate values over a cube's case dimensions.
+
+    Any trailing axes of the values, such as for bounds, are kept.
+    """
+    values = np.asarray(values)
+    if not dims:
+        # Scalar coordinates have a single point.
+        values = values[0]
+    extra = list(range(len(dims), values.ndim))
+    values = np.transpose(values, [*np.argsort(dims), *extra])
+    shape = [
+        size if dim in dims else 1
+        for dim, size in zip(case_dims, case_shape, strict=True)
+    ]
+    values = values.reshape(shape + [values.shape[i] for i in extra])
+    values = np.broadcast_to(
+        values, list(case_shape) + list(values.shape[len(shape) :])
+    )
+    return values.reshape((-1,) + values.shape[len(shape) :])
+
+
+def _case_samples(cube: iris.cube.Cube):
+    """Split a cube into samples of each forecast_period and reference time.
+
+    Returns the data with the samples along the first axis, the dimensions of
+    the remaining axes, and the points and bounds of each coordinate varying
+    only between samples. The data is reordered without being realised.
+    """
+    try:
+        case_dims = sorted(
+            {dim for name in _CASE_COORDS for dim in cube.coord_dims(name)}
+        )
+    except iris.exceptions.CoordinateNotFoundError as err:
+        raise ValueError(
+            "Cube should have 'forecast_period' and 'forecast_reference_time' dimension coordinates.",
+            cube,
+        ) from err
+    other_dims = [dim for dim in range(cube.ndim) if dim not in case_dims]
+    case_shape = [cube.shape[dim] for dim in case_dims]
+    data = cube.core_data().transpose(case_dims + other_dims)
+    data = data.reshape((-1,) + tuple(cube.shape[dim] for dim in other_dims))
+
+    sample_coords = {}
+    for coord in cube.coords():
+        dims = cube.coord_dims(coord)
+        if not set(dims).issubset(case_dims):
+            if set(dims).intersection(case_dims):
+                raise ValueError(
+                    f"Coordinate {coord.name()} varies with both the case and other dimensions.",
+                    cube,
+                )
+            continue
+        bounds = coord.bounds
+        sample_coords[coord.name()] = (
+            _over_cases(coord.points, dims, case_dims, case_shape),
+            None
+            if bounds is None
+            else _over_cases(bounds, dims, case_dims, case_shape),
+        )
+    return data, other_dims, sample_coords
+
+
+def _new_coord(cls, template: iris.coords.Coord, points, bounds):
+    """Create a coordinate with the metadata of another."""
+    metadata = template.metadata._asdict()
+    if cls is not iris.coords.DimCoord:
+        metadata.pop("circular", None)
+    return cls(points, bounds=bounds, **metadata)
+
+
+def _grid_coord(template: iris.coords.Coord, points, bounds):
+    """Create a coordinate on the smallest set of case dimensions it varies over.
+
+    Points and bounds are given over the (forecast_period,
+    forecast_reference_time) grid, and the coordinate is returned along with
+    the dimensions it spans.
+    """
+    values = (
+        points if bounds is None else np.concatenate([points[..., None], bounds], -1)
+    )
+    varies = [
+        not np.array_equal(values, np.take(values, [0], axis=axis).repeat(n, axis))
+        for axis, n in enumerate(points.shape)
+    ]
+    dims = tuple(axis for axis, vary in enumerate(varies) if vary)
+    index = tuple(slice(None) if vary else 0 for vary in varies)
+    coord = _new_coord(
+        iris.coords.AuxCoord,
+        template,
+        points[index],
+        None if bounds is None else bounds[index],
+    )
+    return coord, dims
+
+
+def _stack_cases(cubes: iris.cube.CubeList) -> iris.cube.Cube:
+    """Combine compatible cubes into a single cube over cases.
+
+    The result has leading ``forecast_period`` and ``forecast_reference_time``
+    dimensions, equivalent to merging the cubes sliced over every forecast
+    period and reference time, but built by stacking their data directly.
+    Lazy data is kept lazy.
+    """
+    template = cubes[0]
+    samples = [_case_samples(cube) for cube in cubes]
+    other_dims = samples[0][1]
+    other_shape = samples[0][0].shape[1:]
+    names = set(samples[0][2])
+    for cube, (data, _, coords) in zip(cubes, samples, strict=True):
+        if data.shape[1:] != other_shape or set(coords) != names:
+            raise ValueError("Cubes have different dimensions or coordinates.", cube)
+        for coord in template.coords():
+            if coord.name() not in names and coord not in cube.coords(coord.name()):
+                raise ValueError(f"Cubes have different {coord.name()}.", cube)
+
+    # Gather the coordinate values of every sample, in the template's units.
+    values = {}
+    for name in names:
+        units = template.coord(name).units
+        points, bounds = [], []
+        for cube, (_, _, coords) in zip(cubes, samples, strict=True):
+            sample_points, sample_bounds = coords[name]
+            convert = cube.coord(name).units != units
+            if convert:
+                sample_points = cube.coord(name).units.convert(sample_points, units)
+            points.append(sample_points)
+            if sample_bounds is not None and convert:
+                sample_bounds = cube.coord(name).units.convert(sample_bounds, units)
+            bounds.append(sample_bounds)
+        values[name] = (
+            np.concatenate(points),
+            None if any(b is None for b in bounds) else np.concatenate(bounds),
+        )
+
+    # Index each sample by its position on the grid of cases.
+    (period, period_index), (ref_time, ref_time_index) = (
+        np.unique(values[name][0], return_index=True)[:2] for name in _CASE_COORDS
+    )
+    keys = np.searchsorted(period, values["forecast_period"][0]) * len(
+        ref_time
+    ) + np.searchsorted(ref_time, values["forecast_reference_time"][0])
+    if len(np.unique(keys)) != len(keys):
+        raise ValueError("Cubes have duplicate forecast periods and reference times.")
+    if len(keys) != len(period) * len(ref_time):
+        raise ValueError(
+            "Cubes don't cover every forecast period of every reference time."
+        )
+    order = np.argsort(keys, kind="stable")
+
+    parts = [data for data, _, _ in samples]
+    if any(isinstance(part, da.Array) for part in parts):
+        data = da.concatenate([da.asanyarray(part) for part in parts])
+    elif any(np.ma.isMaskedArray(part) for part in parts):
+        data = np.ma.concatenate(parts)
+    else:
+        data = np.concatenate(parts)
+    grid_shape = (len(period), len(ref_time))
+    if not np.array_equal(order, np.arange(len(order))):
+        data = data[order]
+    data = data.reshape(grid_shape + other_shape)
+
+    cube = iris.cube.Cube(data, **template.metadata._asdict())
+    coord_mapping = {}
+    for dim, (name, unique_points, first) in enumerate(
+        zip(
+            _CASE_COORDS,
+            (period, ref_time),
+            (period_index, ref_time_index),
+            strict=True,
+        )
+    ):
+        coord = template.coord(name)
+        bounds = values[name][1]
+        dim_coord = _new_coord(
+            iris.coords.DimCoord,
+            coord,
+            unique_points,
+            None if bounds is None else bounds[first],
+        )
+        cube.add_dim_coord(dim_coord, dim)
+        coord_mapping[id(coord)] = dim_coord
+    for name in names.difference(_CASE_COORDS):
+        coord = template.coord(name)
+        points, bounds = values[name]
+        grid_coord, dims = _grid_coord(
+            coord,
+            points[order].reshape(grid_shape),
+            None if bounds is None else bounds[order].reshape(grid_shape + (-1,)),
+        )
+        cube.add_aux_coord(grid_coord, dims)
+        coord_mapping[id(coord)] = grid_coord
+
+    # Copy the coordinates of the other dimensions.
+    def new_dims(dims):
+        return tuple(2 + other_dims.index(dim) for dim in dims)
+
+    for coord in template.dim_coords:
+        if coord.name() not in names:
+            coord_mapping[id(coord)] = coord.copy()
+            cube.add_dim_coord(
+                coord_mapping[id(coord)], new_dims(template.coord_dims(coord))
+            )
+    for coord in template.aux_coords:
+        if coord.name() not in names:
+            coord_mapping[id(coord)] = coord.copy()
+            cube.add_aux_coord(
+                coord_mapping[id(coord)], new_dims(template.coord_dims(coord))
+            )
+    for factory in template.aux_factories:
+        cube.add_aux_factory(factory.updated(coord_mapping))
+    for measure in template.cell_measures():
+        dims = template.cell_measure_dims(measure)
+        if set(dims).issubset(other_dims):
+            cube.add_cell_measure(measure.copy(), new_dims(dims))
+    for variable in template.ancillary_variables():
+        dims = template.ancillary_variable_dims(variable)
+        if set(dims).issubset(other_dims):
+            cube.add_ancillary_variable(variable.copy(), new_dims(dims))
+    return cube
+
+
 def time_aggregate(
     cube: iris.cube.Cube,
     method: str,
@@ -142,31 +383,19 @@ def ensure_aggregatable_across_cases(
     The necessary dimension coordinates for a cube to be aggregatable are
     ``forecast_period`` and ``forecast_reference_time``.
     """
-
-    # Group compatible cubes.
-    class Buckets:
-        def __init__(self):
-            self.buckets = []
-
-        def add(self, cube: iris.cube.Cube):
-            """Add a cube into a bucket.
-
-            If the cube is compatible with an existing bucket it is added there.
-            Otherwise it gets its own bucket.
-            """
-            for bucket in self.buckets:
-                if bucket[0].is_compatible(cube):
-                    bucket.append(cube)
-                    return
-            self.buckets.append(iris.cube.CubeList([cube]))
-
-        def get_buckets(self) -> list[iris.cube.CubeList]:
-            return self.buckets
-
-    b = Buckets()
+    # Group compatible cubes. Cubes are only compared with the buckets sharing
+    # their signature, and join the first with a compatible first cube.
+    buckets: list[iris.cube.CubeList] = []
+    signature_buckets: dict[tuple, list[iris.cube.CubeList]] = {}
     for cube in iter_maybe(cubes):
-        b.add(cube)
-    buckets = b.get_buckets()
+        candidates = signature_buckets.setdefault(_compatibility_signature(cube), [])
+        for bucket in candidates:
+            if bucket[0].is_compatible(cube):
+                bucket.append(cube)
+                break
+        else:
+            candidates.append(iris.cube.CubeList([cube]))
+            buckets.append(candidates[-1])
 
     logger.debug("Buckets:\n%s", "\n---\n".join(str(b) for b in buckets))
 
@@ -181,18 +410,7 @@ def ensure_aggregatable_across_cases(
             continue
 
         # Create an aggregatable cube from the provided CubeList.
-        to_merge = iris.cube.CubeList()
-        for cube in bucket:
-            try:
-                to_merge.extend(
-                    cube.slices_over(["forecast_period", "forecast_reference_time"])
-                )
-            except iris.exceptions.CoordinateNotFoundError as err:
-                raise ValueError(
-                    "Cube should have 'forecast_period' and 'forecast_reference_time' dimension coordinates.",
-                    cube,
-                ) from err
-        aggregatable_cube = to_merge.merge_cube()
+        aggregatable_cube = _stack_cases(bucket)
 
         # Add attribute on number of forecast_reference_times
         aggregatable_cube = _add_nref(aggregatable_cube)
@@ -15,24 +15,220 @@
 """Operators to perform various kind of collapse on either 1 or 2 dimensions."""
 
 import datetime
+import itertools
 import logging
+import math
 import warnings
 
+import dask.array as da
 import iris
 import iris.analysis
-import iris.coord_categorisation
 import iris.coords
 import iris.cube
-import iris.exceptions
-import iris.util
 import numpy as np
 
 from CSET._common import iter_maybe
-from CSET.operators.aggregate import add_hour_coordinate
 
 logger = logging.getLogger(__name__)
 
 
+# Time coordinates describing the individual forecasts, which are removed when
+# collapsing across forecasts.
+_CASE_COORDS = ("forecast_period", "forecast_reference_time", "hour")
+
+
+def _points_over(
+    cube: iris.cube.Cube, coord: iris.coords.Coord, dims: tuple[int, ...]
+) -> np.ndarray:
+    """Points of a coordinate broadcast over the given dimensions of a cube."""
+    coord_dims = cube.coord_dims(coord)
+    points = coord.points
+    if coord_dims:
+        points = np.transpose(points, np.argsort([dims.index(d) for d in coord_dims]))
+    shape = [cube.shape[dim] if dim in coord_dims else 1 for dim in dims]
+    return np.broadcast_to(points.reshape(shape), [cube.shape[dim] for dim in dims])
+
+
+def _validity_times(
+    cube: iris.cube.Cube,
+) -> tuple[iris.coords.Coord, tuple[int, ...], np.ndarray]:
+    """Calculate the validity times of a cube without a time coordinate.
+
+    Returns a time coordinate holding the metadata for the validity times, the
+    dimensions they vary over, and the validity times over those dimensions.
+    """
+    ref_time_coord = cube.coord("forecast_reference_time")
+    period_coord = cube.coord("forecast_period")
+    dims = tuple(
+        sorted(set(cube.coord_dims(ref_time_coord) + cube.coord_dims(period_coord)))
+    )
+    ref_units = ref_time_coord.units
+    ref_times = ref_units.num2date(_points_over(cube, ref_time_coord, dims).ravel())
+    period_seconds = period_coord.units.convert(
+        _points_over(cube, period_coord, dims).ravel(), "seconds"
+    )
+    times = [
+        ref_time + datetime.timedelta(seconds=float(seconds))
+        for ref_time, seconds in zip(ref_times, period_seconds, strict=True)
+    ]
+    time_coord = iris.coords.AuxCoord(0, standard_name="time", units=ref_units)
+    return time_coord, dims, np.asarray(ref_units.date2num(times))
+
+
+def _mask_invalid(cube: iris.cube.Cube):
+    """Mask NaNs in a cube's data, keeping lazy data lazy."""
+    if cube.has_lazy_data():
+        cube.data = da.ma.masked_invalid(cube.lazy_data())
+    else:
+        cube.data = np.ma.masked_invalid(cube.data)
+
+
+def _reduce_sorted_groups(ordered: np.ndarray, edges: np.ndarray, aggregator, **kwargs):
+    """Reduce the leading axis of an array sorted into groups between edges."""
+    parts = []
+    for start, end in itertools.pairwise(edges):
+        if start < end:
+            parts.append(aggregator.aggregate(ordered[start:end], 0, **kwargs))
+        else:
+            empty = aggregator.aggregate(ordered[:1], 0, **kwargs)
+            parts.append(np.ma.masked_all_like(empty))
+    return np.ma.stack(parts)
+
+
+def _reduce_groups(data, keys: np.ndarray, n_groups: int, aggregator, **kwargs):
+    """Reduce the leading axis of an array over groups of equal integer keys.
+
+    Groups without any values are masked. Lazy arrays give a lazy result. If
+    the aggregator has no lazy form, each chunk of the other dimensions is
+    reduced over all the groups at once when it is computed.
+    """
+    order = np.argsort(keys, kind="stable")
+    edges = np.searchsorted(keys[order], np.arange(n_groups + 1))
+    ordered = data[order]
+    if not isinstance(data, da.Array):
+        return _reduce_sorted_groups(ordered, edges, aggregator, **kwargs)
+
+    if aggregator.lazy_func is None:
+        ordered = ordered.rechunk(
+            {0: -1} | dict.fromkeys(range(1, ordered.ndim), "auto")
+        )
+        # Reduce a single value to find any dimensions the aggregator adds.
+        sample = aggregator.aggregate(
+            np.ma.zeros((1,) * ordered.ndim, dtype=ordered.dtype), 0, **kwargs
+        )
+        added = sample.shape[ordered.ndim - 1 :]
+        return da.map_blocks(
+            _reduce_sorted_groups,
+            ordered,
+            edges,
+            aggregator,
+            **kwargs,
+            chunks=((n_groups,), *ordered.chunks[1:], *((n,) for n in added)),
+            new_axis=list(range(ordered.ndim, ordered.ndim + len(added))),
+            dtype=sample.dtype,
+            meta=np.ma.masked_array(np.empty((0,) * (sample.ndim + 1), sample.dtype)),
+        )
+
+    parts = []
+    for start, end in itertools.pairwise(edges):
+        if start < end:
+            parts.append(
+                aggregator.lazy_aggregate(ordered[start:end], axis=0, **kwargs)
+            )
+        else:
+            empty = aggregator.lazy_aggregate(ordered[:1], axis=0, **kwargs)
+            mask = da.ones(empty.shape, dtype=bool, chunks=empty.chunks)
+            parts.append(da.ma.masked_array(empty, mask=mask))
+    return da.stack(parts)
+
+
+def _collapse_groups(
+    cube: iris.cube.Cube,
+    sample_dims: tuple[int, ...],
+    keys: np.ndarray,
+    group_coords: list[iris.coords.DimCoord],
+    collapsed_coord: iris.coords.Coord,
+    method: str,
+    additional_percent: float | None,
+    mask_invalid: bool = False,
+) -> iris.cube.Cube:
+    """Collapse groups of points along the time dimensions of a cube.
+
+    The data over the sample dimensions is treated as a single sequence of
+    samples, which are reduced in one pass over groups identified by integer
+    keys. This avoids slicing the cube into a cube per time and merging them.
+
+    Arguments
+    ---------
+    cube: iris.cube.Cube
+        Cube to collapse.
+    sample_dims: tuple[int]
+        Dimensions over which the samples vary, in the order of the keys.
+    keys: np.ndarray
+        Group index of each sample, for the flattened sample dimensions.
+    group_coords: list[iris.coords.DimCoord]
+        Coordinates of the leading dimensions of the collapsed cube. The groups
+        are the product of these, in C order.
+    collapsed_coord: iris.coords.Coord
+        Coordinate named in the cell method, as if it had been collapsed.
+    method: str
+        Type of collapse, as for the collapse operator.
+    additional_percent: float, optional
+        Percentiles for the PERCENTILE method.
+    mask_invalid: bool, optional
+        Whether to mask NaNs before collapsing.
+
+    Returns
+    -------
+    iris.cube.Cube
+        Collapsed cube, with the group coordinates leading the other
+        dimensions of the cube.
+    """
+    if method == "RANGE":
+        args = (cube, sample_dims, keys, group_coords, collapsed_coord)
+        return _collapse_groups(*args, "MAX", None, mask_invalid) - _collapse_groups(
+            *args, "MIN", None, mask_invalid
+        )
+
+    aggregator = getattr(iris.analysis, method)
+    kwargs = {"percent": additional_percent} if method == "PERCENTILE" else {}
+    group_shape = tuple(len(coord.points) for coord in group_coords)
+
+    # Flatten the sample dimensions into a single leading axis.
+    data = cube.core_data()
+    xp = da if cube.has_lazy_data() else np
+    data = xp.moveaxis(data, sample_dims, range(len(sample_dims)))
+    data = data.reshape((-1,) + data.shape[len(sample_dims) :])
+    if mask_invalid:
+        data = da.ma.masked_invalid(data) if xp is da else np.ma.masked_invalid(data)
+    data = _reduce_groups(data, keys, math.prod(group_shape), aggregator, **kwargs)
+    data = data.reshape(group_shape + data.shape[1:])
+
+    # Build the collapsed cube, keeping coordinates not on the sample dims.
+    other_dims = [dim for dim in range(cube.ndim) if dim not in sample_dims]
+    ndim = len(group_shape) + len(other_dims)
+    collapsed = iris.cube.Cube(data[(Ellipsis,) + (0,) * (data.ndim - ndim)])
+    collapsed.metadata = cube.metadata
+    for dim, coord in enumerate(group_coords):
+        collapsed.add_dim_coord(coord, dim)
+    for coords, add_coord in (
+        (cube.dim_coords, collapsed.add_dim_coord),
+        (cube.aux_coords, collapsed.add_aux_coord),
+    ):
+        for coord in coords:
+            dims = cube.coord_dims(coord)
+            if coord.name() in _CASE_COORDS or set(dims) & set(sample_dims):
+                continue
+            add_coord(
+                coord.copy(),
+                tuple(len(group_shape) + other_dims.index(dim) for dim in dims),
+            )
+
+    # Cell methods and percentile dimensions are added as iris would.
+    aggregator.update_metadata(collapsed, [collapsed_coord], **kwargs)
+    return aggregator.post_process(collapsed, data, [collapsed_coord], **kwargs)
+
+
 def collapse(
     cubes: iris.cube.Cube | iris.cube.CubeList,
     coordinate: str | list[str],
@@ -186,44 +382,51 @@ def collapse_by_hour_of_day(
 
     collapsed_cubes = iris.cube.CubeList([])
     for cube in iter_maybe(cubes):
-        # Ensure hour coordinate in each input is sorted, and data adjusted if needed.
-        sorted_cube = iris.cube.CubeList()
-        for fcst_slice in cube.slices_over(["forecast_reference_time"]):
-            # Categorise the time coordinate by hour of the day.
-            fcst_slice = add_hour_coordinate(fcst_slice)
-            if method == "PERCENTILE":
-                by_hour = fcst_slice.aggregated_by(
-                    "hour", getattr(iris.analysis, method), percent=additional_percent
-                )
-            else:
-                by_hour = fcst_slice.aggregated_by(
-                    "hour", getattr(iris.analysis, method)
-                )
-            # Compute if data needs sorting to lie in increasing order [0..23].
-            # Note multiple forecasts can sit in same cube spanning different
-            # initialisation times and data ranges.
-            time_points = by_hour.coord("hour").points
-            time_points_sorted = np.sort(by_hour.coord("hour").points)
-            if time_points[0] != time_points_sorted[0]:
-                nroll = time_points[0] / (time_points[1] - time_points[0])
-                # Shift hour coordinate and data cube to be in time of day order.
-                by_hour.coord("hour").points = np.roll(time_points, nroll, 0)
-                by_hour.data = np.roll(by_hour.data, nroll, axis=0)
-
-            # Remove unnecessary time coordinate.
-            # "hour" and "forecast_period" remain as AuxCoord.
-            by_hour.remove_coord("time")
-
-            sorted_cube.append(by_hour)
-
-        # Recombine cube slices.
-        cube = sorted_cube.merge_cube()
+        time_coord = cube.coord("time")
+        sample_dims = cube.coord_dims(time_coord)
+        # Categorise the time points by hour of the day, only converting each
+        # distinct time once.
+        points, inverse = np.unique(
+            _points_over(cube, time_coord, sample_dims), return_inverse=True
+        )
+        hours = np.array([t.hour for t in time_coord.units.num2date(points)])
+        hours = hours[inverse.ravel()]
+        hour_coord = iris.coords.DimCoord(
+            np.unique(hours),
+            long_name="hour",
+            units="hours",
+            attributes=time_coord.attributes.copy(),
+        )
+        keys = np.searchsorted(hour_coord.points, hours)
+        group_coords = [hour_coord]
+
+        # Each forecast is first aggregated by hour separately.
+        case_coords = cube.coords("forecast_reference_time", dim_coords=True)
+        multi_case = bool(case_coords) and (
+            cube.coord_dims(case_coords[0])[0] in sample_dims
+        )
+        if multi_case:
+            case_dim = cube.coord_dims(case_coords[0])[0]
+            cases = np.indices([cube.shape[dim] for dim in sample_dims])[
+                sample_dims.index(case_dim)
+            ].ravel()
+            keys = cases * len(hour_coord.points) + keys
+            group_coords.insert(0, case_coords[0].copy())
+        cube = _collapse_groups(
+            cube,
+            sample_dims,
+            keys,
+            group_coords,
+            hour_coord,
+            method,
+            additional_percent,
+        )
 
         # Apply a mask to check for invalid data, this will allow NaNs to
         # be ignored.
-        cube.data = np.ma.masked_invalid(cube.data)
+        _mask_invalid(cube)
 
-        if cube.coords("forecast_reference_time", dim_coords=True):
+        if multi_case:
             # Collapse by forecast reference time to get a single cube.
             cube = collapse(
                 cube,
@@ -231,13 +434,6 @@ def collapse_by_hour_of_day(
                 method,
                 additional_percent=additional_percent,
             )
-        else:
-            # Or remove forecast reference time if a single case, as collapse
-            # will have effectively done this.
-            cube.remove_coord("forecast_reference_time")
-
-        # Promote "hour" to dim_coord.
-        iris.util.promote_aux_coord_to_dim_coord(cube, "hour")
         collapsed_cubes.append(cube)
 
     if len(collapsed_cubes) == 1:
@@ -284,65 +480,32 @@ def collapse_by_validity_time(
 
     collapsed_cubes = iris.cube.CubeList([])
     for cube in iter_maybe(cubes):
-        # Slice over cube by both time dimensions to create a CubeList.
-        new_cubelist = iris.cube.CubeList(
-            cube.slices_over(["forecast_period", "forecast_reference_time"])
-        )
-        for sub_cube in new_cubelist:
-            # Reconstruct the time coordinate if it is missing.
-            if "time" not in [coord.name() for coord in sub_cube.coords()]:
-                ref_time_coord = sub_cube.coord("forecast_reference_time")
-                ref_units = ref_time_coord.units
-                ref_time = ref_units.num2date(ref_time_coord.points)
-                period_coord = sub_cube.coord("forecast_period")
-                period_units = period_coord.units
-                # Given how we are slicing there will only be one point.
-                period_seconds = period_units.convert(period_coord.points[0], "seconds")
-                period_duration = datetime.timedelta(seconds=period_seconds)
-                time = ref_time + period_duration
-                time_points = ref_units.date2num(time)
-                time_coord = iris.coords.AuxCoord(
-                    points=time_points, standard_name="time", units=ref_units
-                )
-                sub_cube.add_aux_coord(time_coord)
-            # Remove forecast_period and forecast_reference_time coordinates.
-            sub_cube.remove_coord("forecast_period")
-            sub_cube.remove_coord("forecast_reference_time")
-        # Create new CubeList by merging with unique = False to produce a validity
-        # time cube.
-        merged_list_1 = new_cubelist.merge(unique=False)
-        # Create a new "fake" coordinate and apply to each remaining cube to allow
-        # final merging to take place into a single cube.
-        equalised_validity_time = iris.coords.AuxCoord(
-            points=0, long_name="equalised_validity_time", units="1"
-        )
-        for sub_cube, eq_valid_time in zip(
-            merged_list_1, range(len(merged_list_1)), strict=True
-        ):
-            sub_cube.add_aux_coord(equalised_validity_time.copy(points=eq_valid_time))
-
-        # Merge CubeList to create final cube.
-        final_cube = merged_list_1.merge_cube()
-        logger.debug("Pre-collapse validity time cube:\n%s", final_cube)
-
-        # Apply a mask to check for invalid data, this will allow NaNs to
-        # be ignored.
-        final_cube.data = np.ma.masked_invalid(final_cube.data)
-
-        # Collapse over equalised_validity_time as a proxy for equal validity
-        # time.
-        try:
-            collapsed_cube = collapse(
-                final_cube,
-                "equalised_validity_time",
-                method,
-                additional_percent=additional_percent,
-            )
-        except iris.exceptions.CoordinateCollapseError as err:
+        if cube.coords("time"):
+            time_coord = cube.coord("time")
+            sample_dims = cube.coord_dims(time_coord)
+            points = _points_over(cube, time_coord, sample_dims).ravel()
+        else:
+            time_coord, sample_dims, points = _validity_times(cube)
+        validity_times, keys = np.unique(points, return_inverse=True)
+        # Without repeated validity times there is nothing to collapse.
+        if len(validity_times) == len(points):
             raise ValueError(
                 "Cubes do not overlap therefore cannot collapse across validity time."
-            ) from err
-        collapsed_cube.remove_coord("equalised_validity_time")
+            )
+        # Named as the coordinate equalising validity times between cases.
+        equalised_validity_time = iris.coords.AuxCoord(
+            0, long_name="equalised_validity_time", units="1"
+        )
+        collapsed_cube = _collapse_groups(
+            cube,
+            sample_dims,
+            keys.ravel(),
+            [iris.coords.DimCoord(validity_times, **time_coord.metadata._asdict())],
+            equalised_validity_time,
+            method,
+            additional_percent,
+            mask_invalid=True,
+        )
         collapsed_cubes.append(collapsed_cube)
 
     if len(collapsed_cubes) == 1:
@@ -16,19 +16,170 @@
 
 import numbers
 import re
-from collections.abc import Iterable
-from datetime import timedelta
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
 
+import cftime
 import iris
 import iris.coords
 import iris.cube
+import iris.exceptions
+import numpy as np
+from iris.time import PartialDateTime
 
 import CSET.operators._utils as operator_utils
 from CSET._common import iter_maybe
+from CSET.operators._catalogue import attach_field_filter
 
 # STASH code pattern: mXXsXXiXXX where X is a digit
 _STASH_RE = re.compile(r"^m\d{2}s\d{2}i\d{3}$")
 
+# Fields of a datetime, from most to least significant.
+_DATETIME_FIELDS = ("year", "month", "day", "hour", "minute", "second", "microsecond")
+_DATETIME_FIELD_MINIMUMS = (None, 1, 1, 0, 0, 0, 0)
+_DATETIME_FIELD_STEPS = {
+    "day": timedelta(days=1),
+    "hour": timedelta(hours=1),
+    "minute": timedelta(minutes=1),
+    "second": timedelta(seconds=1),
+    "microsecond": timedelta(microseconds=1),
+}
+
+
+class _PointRange:
+    """Range of numeric coordinate points.
+
+    Parameters
+    ----------
+    limits: Callable[[str | None], tuple[object, object, bool]]
+        Function giving the lower and upper limits for a calendar, or None for
+        coordinates that aren't times, and whether the upper limit is
+        inclusive. The lower limit is always inclusive.
+    description: str
+        Human readable description of the range, used in the repr.
+    """
+
+    def __init__(
+        self,
+        limits: Callable[[str | None], tuple[object, object, bool]],
+        description: str,
+    ):
+        self._limits = limits
+        self._description = description
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._description})"
+
+    def point_mask(self, points, units=None) -> np.ndarray:
+        """Boolean array of which numeric points are within the range.
+
+        Time limits are converted into the given units.
+        """
+        calendar = units.calendar if units is not None else None
+        lower, upper, upper_inclusive = self._limits(calendar)
+        if units is not None and units.is_time_reference():
+            lower, upper = units.date2num(lower), units.date2num(upper)
+        points = np.asarray(points)
+        below_upper = points <= upper if upper_inclusive else points < upper
+        return (lower <= points) & below_upper
+
+
+class _PointRangeConstraint(iris.Constraint):
+    """Constraint selecting the points of a coordinate within a range.
+
+    Iris evaluates a function given in ``coord_values`` once per cell, which for
+    time coordinates means first converting every point into a datetime. This
+    instead compares all of the coordinate's numeric points at once.
+
+    Parameters
+    ----------
+    coord_name: str
+        Name of the coordinate to constrain.
+    point_range: _PointRange
+        Range of points to select.
+    """
+
+    def __init__(self, coord_name: str, point_range: _PointRange):
+        super().__init__()
+        self.coord_name = coord_name
+        self.point_range = point_range
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.coord_name}: {self.point_range!r})"
+
+    def _CIM_extract(self, cube):
+        # Iris extracts by combining column index managers from each part of a
+        # constraint, so this hooks in alongside its own constraint classes.
+        cube_cim = super()._CIM_extract(cube)
+        try:
+            coord = cube.coord(self.coord_name)
+        except iris.exceptions.CoordinateNotFoundError:
+            cube_cim.all_false()
+            return cube_cim
+        dims = cube.coord_dims(coord)
+        if len(dims) > 1:
+            raise iris.exceptions.CoordinateMultiDimError(
+                "Cannot apply constraints to multidimensional coordinates"
+            )
+        matches = self.point_range.point_mask(coord.points, coord.units)
+        if dims:
+            cube_cim[dims[0]] = matches
+        elif not matches.all():
+            cube_cim.all_false()
+        return cube_cim
+
+
+def _datetime_limit(value, upper: bool) -> tuple[tuple[int, ...], object, bool]:
+    """Get the datetime fields of the limit of a time range.
+
+    A partial datetime matches every time within the period given by its
+    specified fields, so its lower limit is the start of that period, and its
+    upper limit is the (exclusive) start of the following period.
+
+    Returns
+    -------
+    fields: tuple[int, ...]
+        Year to microsecond of the limit, before any step is applied.
+    step: str | timedelta | None
+        Field to increment ("year" or "month"), or time to add, to reach the
+        exclusive upper limit.
+    inclusive: bool
+        Whether the limit itself is part of the range.
+    """
+    if isinstance(value, PartialDateTime):
+        specified = [getattr(value, field) is not None for field in _DATETIME_FIELDS]
+        count = specified.index(False) if False in specified else len(specified)
+        if count == 0 or any(specified[count:]):
+            raise ValueError(
+                f"Partial datetime must give all fields from the year: {value}"
+            )
+        fields = tuple(
+            getattr(value, field) if i < count else _DATETIME_FIELD_MINIMUMS[i]
+            for i, field in enumerate(_DATETIME_FIELDS)
+        )
+        if not upper:
+            return fields, None, True
+        last = _DATETIME_FIELDS[count - 1]
+        return fields, _DATETIME_FIELD_STEPS.get(last, last), False
+
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    fields = tuple(getattr(value, field) for field in _DATETIME_FIELDS)
+    return fields, None, True
+
+
+def _datetime_in_calendar(fields, step, calendar: str) -> cftime.datetime:
+    """Create a datetime in the given calendar, applying any step."""
+    year, month, *rest = fields
+    if step == "year":
+        year += 1
+    elif step == "month":
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    limit = cftime.datetime(year, month, *rest, calendar=calendar)
+    if isinstance(step, timedelta):
+        limit = limit + step
+    return limit
+
 
 def generate_stash_constraint(stash: str, **kwargs) -> iris.AttributeConstraint:
     """Generate constraint from STASH code.
@@ -49,7 +200,7 @@ def generate_stash_constraint(stash: str, **kwargs) -> iris.AttributeConstraint:
     # At a later stage str list an option to combine constraints. Arguments
     # could be a list of stash codes that combined build the constraint.
     stash_constraint = iris.AttributeConstraint(STASH=stash)
-    return stash_constraint
+    return attach_field_filter(stash_constraint, lambda field: field.stash == stash)
 
 
 def generate_var_constraint(varname: str, **kwargs) -> iris.Constraint:
@@ -74,7 +225,10 @@ def generate_var_constraint(varname: str, **kwargs) -> iris.Constraint:
     # Case 1: UM STASHcode input
 
     if isinstance(varname, str) and _STASH_RE.match(varname):
-        return iris.AttributeConstraint(STASH=varname)
+        return attach_field_filter(
+            iris.AttributeConstraint(STASH=varname),
+            lambda field: field.stash == varname,
+        )
 
     # Ensure access to variable vector components for computed fields
     if "wind_speed_at_10m" in iter_maybe(varname):
@@ -92,11 +246,15 @@ def generate_var_constraint(varname: str, **kwargs) -> iris.Constraint:
                 or cube.var_name in varname
             )
         )
+        field_names = set(varname)
 
     else:
         varname_constraint = iris.Constraint(name=varname)
+        field_names = {varname}
 
-    return varname_constraint
+    return attach_field_filter(
+        varname_constraint, lambda field: not field_names.isdisjoint(field.names)
+    )
 
 
 def generate_level_constraint(
@@ -133,7 +291,10 @@ def generate_level_constraint(
     """
     # If asterisks, then return all levels for given coordinate.
     if levels == "*":
-        return iris.Constraint(**{coordinate: lambda cell: True})
+        return attach_field_filter(
+            iris.Constraint(**{coordinate: lambda cell: True}),
+            lambda field: field.has_coord(coordinate),
+        )
     else:
         # Ensure is iterable.
         if not isinstance(levels, Iterable):
@@ -146,11 +307,23 @@ def generate_level_constraint(
                 # Reject cubes for which coordinate exists.
                 return not cube.coords(coordinate)
 
-            return iris.Constraint(cube_func=no_levels)
+            return attach_field_filter(
+                iris.Constraint(cube_func=no_levels),
+                lambda field: not field.has_coord(coordinate),
+            )
+
+        def field_has_levels(field) -> bool:
+            # Fields with unrecorded points might have the levels.
+            if not field.has_coord(coordinate):
+                return False
+            points = field.coord_points(coordinate)
+            return points is None or any(point in levels for point in points)
 
         # Filter the coordinate to the desired levels.
         # Dictionary unpacking is used to provide programmatic keyword arguments.
-        return iris.Constraint(**{coordinate: levels})
+        return attach_field_filter(
+            iris.Constraint(**{coordinate: levels}), field_has_levels
+        )
 
 
 def generate_remove_single_level_constraint(
@@ -288,11 +461,9 @@ def generate_time_constraint(
         pdt_start, offset_start = time_start, timedelta(0)
 
     if time_end is None:
-        pdt_end, offset_end = time_start, offset_start
+        pdt_end, offset_end = pdt_start, offset_start
     elif isinstance(time_end, str):
         pdt_end, offset_end = operator_utils.pdt_fromisoformat(time_end)
-        print(pdt_end)
-        print(offset_end)
     else:
         pdt_end, offset_end = time_end, timedelta(0)
 
@@ -301,14 +472,36 @@ def generate_time_constraint(
     if offset_end is None:
         offset_end = timedelta(0)
 
-    time_constraint = iris.Constraint(
-        time=lambda t: (
-            (pdt_start <= (t.point - offset_start))
-            and ((t.point - offset_end) <= pdt_end)
-        )
-    )
+    lower_fields, _, _ = _datetime_limit(pdt_start, upper=False)
+    upper_fields, upper_step, upper_inclusive = _datetime_limit(pdt_end, upper=True)
+
+    # The limits are created in the calendar of each time coordinate once, and
+    # then reused for every cube sharing that calendar.
+    calendar_limits = {}
+
+    def time_limits(calendar) -> tuple[cftime.datetime, cftime.datetime, bool]:
+        calendar = calendar or "standard"
+        if calendar not in calendar_limits:
+            lower = _datetime_in_calendar(lower_fields, None, calendar)
+            upper = _datetime_in_calendar(upper_fields, upper_step, calendar)
+            calendar_limits[calendar] = (
+                lower + offset_start,
+                upper + offset_end,
+                upper_inclusive,
+            )
+        return calendar_limits[calendar]
+
+    time_range = _PointRange(time_limits, f"{pdt_start} to {pdt_end}")
+    time_constraint = _PointRangeConstraint("time", time_range)
+
+    def field_in_time_range(field) -> bool:
+        # Fields with unrecorded times might be in range.
+        if not field.has_coord("time"):
+            return False
+        time = field.time_values()
+        return time is None or bool(time_range.point_mask(*time).any())
 
-    return time_constraint
+    return attach_field_filter(time_constraint, field_in_time_range)
 
 
 def generate_area_constraint(
@@ -477,8 +670,19 @@ def generate_hour_constraint(
     if (hour_start < 0) or (hour_start > 23) or (hour_end < 0) or (hour_end > 23):
         raise ValueError("Hours must be between 0 and 23 inclusive.")
 
-    hour_constraint = iris.Constraint(hour=lambda h: hour_start <= h.point <= hour_end)
-    return hour_constraint
+    hour_range = _PointRange(
+        lambda calendar: (hour_start, hour_end, True), f"{hour_start} to {hour_end}"
+    )
+    hour_constraint = _PointRangeConstraint("hour", hour_range)
+
+    def field_in_hour_range(field) -> bool:
+        # Fields with unrecorded hours might be in range.
+        if not field.has_coord("hour"):
+            return False
+        points = field.coord_points("hour")
+        return points is None or bool(hour_range.point_mask(points).any())
+
+    return attach_field_filter(hour_constraint, field_in_hour_range)
 
 
 def combine_constraints(
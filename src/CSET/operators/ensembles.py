@@ -1,4 +1,4 @@
-# © Crown copyright, Met Office (2022-2025) and CSET contributors.
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -19,12 +19,20 @@ The diagnostics here are applicable to ensembles and apply generally to
 ensembles. They are not just limited to considering ensemble spread.
 """
 
+import warnings
+
 import iris
+import iris.analysis
 import iris.cube
 import numpy as np
 
 
-def DKE(u: iris.cube.Cube, v: iris.cube.Cube) -> iris.cube.Cube:
+def DKE(
+    u: iris.cube.Cube,
+    v: iris.cube.Cube,
+    coordinate: str | list[str] | None = None,
+    method: str = "MEAN",
+) -> iris.cube.Cube:
     r"""Calculate the Difference Kinetic Energy (DKE).
 
     Parameters
@@ -35,11 +43,26 @@ def DKE(u: iris.cube.Cube, v: iris.cube.Cube) -> iris.cube.Cube:
         coordinate.
     v: iris.cube.Cube
         Iris cube of the v component of the wind field same format as u.
+    coordinate: str | list[str], optional
+        Coordinate(s) to collapse the DKE over, such as the vertical
+        coordinate or the spatial coordinates to give a domain average.
+        Defaults to not collapsing.
+    method: str, optional
+        Method to collapse the coordinate(s) with, either 'MEAN' or 'SUM'.
+        Defaults to 'MEAN'.
 
     Returns
     -------
     DKE: iris.cube.Cube
         An iris cube of the DKE for each of the control - member comparisons.
+        The DKE is lazily evaluated, so only a chunk of the wind fields need
+        be held in memory at a time.
+
+    Raises
+    ------
+    ValueError
+        If the cubes don't match, lack a leading realization coordinate, or
+        the collapse method is not supported.
 
     Notes
     -----
@@ -72,7 +95,13 @@ def DKE(u: iris.cube.Cube, v: iris.cube.Cube) -> iris.cube.Cube:
     Examples
     --------
     >>> DKE = ensembles.DKE(u, v)
+    >>> DKE_profile = ensembles.DKE(
+    ...     u, v, coordinate=["grid_latitude", "grid_longitude"], method="MEAN"
+    ... )
     """
+    if method not in ("MEAN", "SUM"):
+        raise ValueError(f"Unsupported DKE collapse method: {method}")
+
     for cube in [u, v]:
         # Use dim_map to store the dimensions and check the realization
         # coordinate is the first coordinate.
@@ -96,16 +125,26 @@ def DKE(u: iris.cube.Cube, v: iris.cube.Cube) -> iris.cube.Cube:
                 f"u and v should have matching coordinates for {coord_u.name()}."
             )
     # Define control member and perturbed members.
-    u_ctrl = u[np.where(u.coord("realization").points[:] == 0)[0][0], :]
-    u_mem = u[np.where(u.coord("realization").points[:] != 0)[0][:], :]
-    v_ctrl = v[np.where(v.coord("realization").points[:] == 0)[0][0], :]
-    v_mem = v[np.where(v.coord("realization").points[:] != 0)[0][:], :]
-
-    # Calculate the DKE
-    DKE = u_mem.copy()
-    DKE.data[:] = 0.0
-    DKE.data = (
-        0.5 * (u_ctrl.data - u_mem.data) ** 2 + 0.5 * (v_ctrl.data - v_mem.data) ** 2
+    realization = u.coord("realization").points
+    control = np.flatnonzero(realization == 0)[0]
+    members = np.flatnonzero(realization != 0)
+
+    # Calculate the DKE lazily, broadcasting the control against the members.
+    u_data = u.lazy_data()
+    v_data = v.lazy_data()
+    dke_data = (
+        0.5 * (u_data[control] - u_data[members]) ** 2
+        + 0.5 * (v_data[control] - v_data[members]) ** 2
     )
+    # Index a lazy copy so the metadata is subset without realising the data.
+    DKE = u.copy(data=u_data)[members].copy(data=dke_data)
     DKE.rename("Difference Kinetic Energy")
+    if coordinate is not None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                "Collapsing spatial coordinate.+without weighting",
+                UserWarning,
+            )
+            DKE = DKE.collapsed(coordinate, getattr(iris.analysis, method))
     return DKE
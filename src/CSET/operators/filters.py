@@ -15,7 +15,9 @@
 """Operators to perform various kind of filtering."""
 
 import logging
+import operator
 
+import dask.array as da
 import iris
 import iris.cube
 import iris.exceptions
@@ -25,6 +27,46 @@ from CSET._common import iter_maybe
 
 logger = logging.getLogger(__name__)
 
+# Masks are stored as single bytes, rather than booleans, so they can still be
+# written to netCDF and summed or multiplied like any other field.
+_MASK_DTYPE = np.int8
+
+_MASK_CONDITIONS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+
+
+def _lazy(data):
+    """Wrap array data as a dask array, unless it already is one."""
+    return data if isinstance(data, da.Array) else da.asarray(data)
+
+
+def _mask_is_set(mask: iris.cube.Cube):
+    """Lazy boolean array of where a mask selects data.
+
+    Any non-zero value selects data, so masks combined by addition still work.
+    NaNs never select data, as produced by masks converted to 1s and NaNs.
+    """
+    data = _lazy(mask.core_data())
+    is_set = data != 0
+    if np.issubdtype(data.dtype, np.floating):
+        is_set = is_set & ~da.isnan(data)
+    return is_set
+
+
+def _mask_cube(like: iris.cube.Cube, is_set, name: str) -> iris.cube.Cube:
+    """Create a mask cube with the metadata of another cube."""
+    mask = like.copy(data=is_set.astype(_MASK_DTYPE))
+    mask.attributes["mask"] = name
+    mask.rename(name)
+    mask.units = "1"
+    return mask
+
 
 def apply_mask(
     original_field: iris.cube.Cube | iris.cube.CubeList,
@@ -46,11 +88,12 @@ def apply_mask(
 
     Notes
     -----
-    The mask is first converted to 1s and NaNs before multiplication with
-    the original data.
+    Data is masked wherever the mask is zero or NaN. The result is lazy, so
+    nothing is computed until the data is needed.
 
     As discussed in generate_mask, you can combine multiple masks in a
-    recipe using other functions before applying the mask to the data.
+    recipe using mask_and, mask_or and mask_not before applying the mask to
+    the data.
 
     Examples
     --------
@@ -58,16 +101,15 @@ def apply_mask(
     """
     masked_fields = iris.cube.CubeList([])
     for M, F in zip(iter_maybe(mask), iter_maybe(original_field), strict=True):
-        # Ensure mask data are floats and only 1s or NaNs.
-        M.data = np.float64(M.data)
-        M.data[M.data == 0.0] = np.nan
-        M.data[~np.isnan(M.data)] = 1.0
         logger.info(
-            "Mask set to 1 or 0s, if addition of multiple masks results"
-            "in values > 1 these are set to 1."
+            "Mask treated as 1 or 0s, if addition of multiple masks results"
+            "in values > 1 these are treated as 1."
+        )
+        # The mask is used directly as the condition of a lazy masked array,
+        # so no full size copy of either the mask or the field is made.
+        masked_field = F.copy(
+            data=da.ma.masked_where(~_mask_is_set(M), _lazy(F.core_data()))
         )
-        masked_field = F.copy()
-        masked_field.data *= M.data
         masked_field.attributes["mask"] = f"mask_of_{F.name()}"
         masked_fields.append(masked_field)
     if len(masked_fields) == 1:
@@ -191,11 +233,13 @@ def generate_mask(
 
     Notes
     -----
-    The mask is created in the opposite sense to numpy.ma.masked_arrays. This
+    The mask is created in the opposite sense to numpy.ma.masked_arrays, with
+    1 where the condition is met and 0 elsewhere. It is a lazy array of single
+    bytes, so is far smaller than the field it is generated from. This
     method was chosen to allow easy combination of masks together outside of
-    this function using misc.addition or misc.multiplication depending on
-    applicability. The combinations can be of any fields such as orography >
-    500 m, and humidity == 100 %.
+    this function using mask_and, mask_or and mask_not, or misc.addition or
+    misc.multiplication depending on applicability. The combinations can be of
+    any fields such as orography > 500 m, and humidity == 100 %.
 
     The conversion to a masked array occurs in the apply_mask routine, which
     should happen after all relevant masks have been combined.
@@ -204,32 +248,135 @@ def generate_mask(
     --------
     >>> land_mask = generate_mask(land_sea_mask,'gt',1)
     """
+    try:
+        compare = _MASK_CONDITIONS[condition]
+    except KeyError:
+        raise ValueError(
+            "Unexpected value for condition. Expected eq, ne, gt, ge, lt, le. "
+            f"Got {condition}."
+        ) from None
     mask_list = iris.cube.CubeList([])
     for cube in iter_maybe(mask_field):
-        mask = cube.copy()
-        mask.data[:] = 0.0
-        match condition:
-            case "eq":
-                mask.data[cube.data == value] = 1.0
-            case "ne":
-                mask.data[cube.data != value] = 1.0
-            case "gt":
-                mask.data[cube.data > value] = 1.0
-            case "ge":
-                mask.data[cube.data >= value] = 1.0
-            case "lt":
-                mask.data[cube.data < value] = 1.0
-            case "le":
-                mask.data[cube.data <= value] = 1.0
-            case _:
-                raise ValueError("""Unexpected value for condition. Expected eq, ne,
-                                  gt, ge, lt, le. Got {condition}.""")
-        mask.attributes["mask"] = f"mask_for_{cube.name()}_{condition}_{value}"
-        mask.rename(f"mask_for_{cube.name()}_{condition}_{value}")
-        mask.units = "1"
+        mask = _mask_cube(
+            cube,
+            compare(_lazy(cube.core_data()), value),
+            f"mask_for_{cube.name()}_{condition}_{value}",
+        )
         mask_list.append(mask)
 
     if len(mask_list) == 1:
         return mask_list[0]
     else:
         return mask_list
+
+
+def _combine_masks(masks_1, masks_2, combine, name: str):
+    """Combine pairs of masks with a logical operation."""
+    mask_list = iris.cube.CubeList([])
+    for mask_1, mask_2 in zip(iter_maybe(masks_1), iter_maybe(masks_2), strict=True):
+        if mask_1.shape != mask_2.shape:
+            raise ValueError(
+                f"Masks have different shapes: {mask_1.shape} and {mask_2.shape}"
+            )
+        mask_list.append(
+            _mask_cube(
+                mask_1,
+                combine(_mask_is_set(mask_1), _mask_is_set(mask_2)),
+                f"{mask_1.name()}_{name}_{mask_2.name()}",
+            )
+        )
+    if len(mask_list) == 1:
+        return mask_list[0]
+    else:
+        return mask_list
+
+
+def mask_and(
+    mask_1: iris.cube.Cube | iris.cube.CubeList,
+    mask_2: iris.cube.Cube | iris.cube.CubeList,
+) -> iris.cube.Cube | iris.cube.CubeList:
+    """Combine masks so data is selected where both masks select it.
+
+    Parameters
+    ----------
+    mask_1: iris.cube.Cube | iris.cube.CubeList
+        Mask(s) as produced by generate_mask.
+    mask_2: iris.cube.Cube | iris.cube.CubeList
+        Mask(s) to combine with mask_1. CubeLists are combined on a strict
+        ordering (e.g. first mask with first mask).
+
+    Returns
+    -------
+    mask: iris.cube.Cube | iris.cube.CubeList
+        Lazy mask(s) that are 1 where both masks are set, and 0 elsewhere.
+
+    Raises
+    ------
+    ValueError
+        If the masks have different shapes.
+
+    Examples
+    --------
+    >>> high_and_humid = mask_and(orography_mask, humidity_mask)
+    """
+    return _combine_masks(mask_1, mask_2, operator.and_, "and")
+
+
+def mask_or(
+    mask_1: iris.cube.Cube | iris.cube.CubeList,
+    mask_2: iris.cube.Cube | iris.cube.CubeList,
+) -> iris.cube.Cube | iris.cube.CubeList:
+    """Combine masks so data is selected where either mask selects it.
+
+    Parameters
+    ----------
+    mask_1: iris.cube.Cube | iris.cube.CubeList
+        Mask(s) as produced by generate_mask.
+    mask_2: iris.cube.Cube | iris.cube.CubeList
+        Mask(s) to combine with mask_1. CubeLists are combined on a strict
+        ordering (e.g. first mask with first mask).
+
+    Returns
+    -------
+    mask: iris.cube.Cube | iris.cube.CubeList
+        Lazy mask(s) that are 1 where either mask is set, and 0 elsewhere.
+
+    Raises
+    ------
+    ValueError
+        If the masks have different shapes.
+
+    Examples
+    --------
+    >>> high_or_humid = mask_or(orography_mask, humidity_mask)
+    """
+    return _combine_masks(mask_1, mask_2, operator.or_, "or")
+
+
+def mask_not(
+    mask: iris.cube.Cube | iris.cube.CubeList,
+) -> iris.cube.Cube | iris.cube.CubeList:
+    """Invert masks so data is selected where it was not before.
+
+    Parameters
+    ----------
+    mask: iris.cube.Cube | iris.cube.CubeList
+        Mask(s) as produced by generate_mask.
+
+    Returns
+    -------
+    mask: iris.cube.Cube | iris.cube.CubeList
+        Lazy mask(s) that are 1 where the mask is not set, and 0 elsewhere.
+
+    Examples
+    --------
+    >>> sea_mask = mask_not(land_mask)
+    """
+    mask_list = iris.cube.CubeList(
+        _mask_cube(cube, ~_mask_is_set(cube), f"not_{cube.name()}")
+        for cube in iter_maybe(mask)
+    )
+    if len(mask_list) == 1:
+        return mask_list[0]
+    else:
+        return mask_list
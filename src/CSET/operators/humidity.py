@@ -14,14 +14,50 @@
 
 """Operators for humidity conversions."""
 
+import dask.array as da
 import iris.cube
 import numpy as np
 
 from CSET._common import iter_maybe
 from CSET.operators._atmospheric_constants import EPSILON
-from CSET.operators._utils import get_cube_coordindex
-from CSET.operators.misc import convert_units
-from CSET.operators.pressure import vapour_pressure
+from CSET.operators._memoise import memoise
+from CSET.operators._utils import get_cube_coordindex, lazy_data_in_units
+from CSET.operators.pressure import _vapour_pressure_data
+
+
+@memoise
+def _saturation_mixing_ratio_data(
+    temperature: iris.cube.Cube, pressure: iris.cube.Cube
+) -> da.Array:
+    """Lazy saturation mixing ratio, as calculated by saturation_mixing_ratio."""
+    e = _vapour_pressure_data(temperature)
+    return (EPSILON * e) / (lazy_data_in_units(pressure, "hPa") - e)
+
+
+@memoise
+def _saturation_specific_humidity_data(
+    temperature: iris.cube.Cube, pressure: iris.cube.Cube
+) -> da.Array:
+    """Lazy saturation specific humidity, as in saturation_specific_humidity."""
+    e = _vapour_pressure_data(temperature)
+    return (EPSILON * e) / lazy_data_in_units(pressure, "hPa")
+
+
+def _vertical_integral(cube: iris.cube.Cube, data: da.Array) -> iris.cube.Cube:
+    """Lazily integrate data over the level_height of a cube.
+
+    The integral uses the trapezoid rule, as numpy.trapezoid, but is written in
+    terms of slices and sums so it doesn't realise the data. The returned cube
+    has the metadata of the lowest level of the given cube.
+    """
+    axis = get_cube_coordindex(cube, "level_height")
+    dx = np.diff(cube.coord("level_height").points)
+    dx = dx.reshape((-1,) + (1,) * (data.ndim - axis - 1))
+    lower = (slice(None),) * axis + (slice(None, -1),)
+    upper = (slice(None),) * axis + (slice(1, None),)
+    integral = ((data[lower] + data[upper]) * (dx / 2.0)).sum(axis=axis)
+    lowest_level = (slice(None),) * axis + (0,)
+    return cube[lowest_level].copy(data=integral)
 
 
 def mixing_ratio_from_specific_humidity(
@@ -152,8 +188,7 @@ def saturation_mixing_ratio(
     """
     w = iris.cube.CubeList([])
     for T, P in zip(iter_maybe(temperature), iter_maybe(pressure), strict=True):
-        P = convert_units(P, "hPa")
-        mr = (EPSILON * vapour_pressure(T)) / (P - vapour_pressure(T))
+        mr = T.copy(data=_saturation_mixing_ratio_data(T, P))
         mr.units = "kg/kg"
         mr.rename("saturation_mixing_ratio")
         w.append(mr)
@@ -203,8 +238,7 @@ def saturation_specific_humidity(
     """
     q = iris.cube.CubeList([])
     for T, P in zip(iter_maybe(temperature), iter_maybe(pressure), strict=True):
-        P = convert_units(P, "hPa")
-        sh = (EPSILON * vapour_pressure(T)) / P
+        sh = T.copy(data=_saturation_specific_humidity_data(T, P))
         sh.units = "kg/kg"
         sh.rename("saturation_specific_humidity")
         q.append(sh)
@@ -263,8 +297,9 @@ def mixing_ratio_from_relative_humidity(
         iter_maybe(relative_humidity),
         strict=True,
     ):
-        RH = convert_units(RH, "1")
-        mr = saturation_mixing_ratio(T, P) * RH
+        mr = T.copy(
+            data=_saturation_mixing_ratio_data(T, P) * lazy_data_in_units(RH, "1")
+        )
         mr.rename("mixing_ratio")
         mr.units = "kg/kg"
         w.append(mr)
@@ -322,8 +357,9 @@ def specific_humidity_from_relative_humidity(
         iter_maybe(relative_humidity),
         strict=True,
     ):
-        RH = convert_units(RH, "1")
-        sh = saturation_specific_humidity(T, P) * RH
+        sh = T.copy(
+            data=_saturation_specific_humidity_data(T, P) * lazy_data_in_units(RH, "1")
+        )
         sh.rename("specific_humidity")
         sh.units = "kg/kg"
         q.append(sh)
@@ -380,9 +416,13 @@ def relative_humidity_from_mixing_ratio(
         iter_maybe(pressure),
         strict=True,
     ):
-        rel_h = W / saturation_mixing_ratio(T, P)
+        rel_h = W.copy(
+            data=100.0
+            * lazy_data_in_units(W, "kg/kg")
+            / _saturation_mixing_ratio_data(T, P)
+        )
         rel_h.rename("relative_humidity")
-        rel_h = convert_units(rel_h, "%")
+        rel_h.units = "%"
         RH.append(rel_h)
     if len(RH) == 1:
         return RH[0]
@@ -437,9 +477,13 @@ def relative_humidity_from_specific_humidity(
         iter_maybe(pressure),
         strict=True,
     ):
-        rel_h = Q / saturation_specific_humidity(T, P)
+        rel_h = Q.copy(
+            data=100.0
+            * lazy_data_in_units(Q, "kg/kg")
+            / _saturation_specific_humidity_data(T, P)
+        )
         rel_h.rename("relative_humidity")
-        rel_h = convert_units(rel_h, "%")
+        rel_h.units = "%"
         RH.append(rel_h)
     if len(RH) == 1:
         return RH[0]
@@ -494,27 +538,8 @@ def precipitable_water(
     """
     precipitable_water = iris.cube.CubeList([])
     for w in iter_maybe(mixing_ratio):
-        # Integrate the data in the vertical using np.trapezoid
-        # (following trapezoid rule).
-        pw = np.trapezoid(
-            w.data,
-            x=w.coord("level_height").points[:],
-            axis=get_cube_coordindex(w, "level_height"),
-        )
-        # Determine array information of input cube to get
-        # correct cube to copy across to.
-        if len(w.coord("realization").points) != 1 and len(w.coord("time").points) != 1:
-            pwat = w[:, :, 0, :, :].copy()
-        elif (
-            len(w.coord("realization").points) != 1 and len(w.coord("time").points) == 1
-        ) or (
-            len(w.coord("time").points) != 1 and len(w.coord("realization").points) == 1
-        ):
-            pwat = w[:, 0, :, :].copy()
-        else:
-            pwat = w[0, :, :].copy()
-        # Create the data array, rename, and correct units.
-        pwat.data = pw
+        # Integrate the data in the vertical following the trapezoid rule.
+        pwat = _vertical_integral(w, w.lazy_data())
         pwat.rename("precipitable_water")
         # Setting units to mm to account for normalization by density of water.
         pwat.units = "mm"
@@ -576,28 +601,8 @@ def saturation_precipitable_water(
     for w, rh in zip(
         iter_maybe(mixing_ratio), iter_maybe(relative_humidity), strict=True
     ):
-        # Integrate the data in the vertical using np.trapezoid
-        # (following trapezoid rule).
-        rh = convert_units(rh, "1")
-        spw = np.trapezoid(
-            (w / rh).data,
-            x=w.coord("level_height").points[:],
-            axis=get_cube_coordindex(w, "level_height"),
-        )
-        # Determine array information of input cube to get
-        # correct cube to copy across to.
-        if len(w.coord("realization").points) != 1 and len(w.coord("time").points) != 1:
-            satpw = w[:, :, 0, :, :].copy()
-        elif (
-            len(w.coord("realization").points) != 1 and len(w.coord("time").points) == 1
-        ) or (
-            len(w.coord("time").points) != 1 and len(w.coord("realization").points) == 1
-        ):
-            satpw = w[:, 0, :, :].copy()
-        else:
-            satpw = w[0, :, :].copy()
-        # Store the data for output, rename cube, and correct units.
-        satpw.data = spw
+        # Integrate the data in the vertical following the trapezoid rule.
+        satpw = _vertical_integral(w, w.lazy_data() / lazy_data_in_units(rh, "1"))
         satpw.rename("saturation_precipitable_water")
         # Setting units to mm to account for normalization by density of water.
         satpw.units = "mm"
@@ -1,4 +1,4 @@
-# © Crown copyright, Met Office (2022-2025) and CSET contributors.
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -16,10 +16,11 @@
 
 import logging
 
+import dask.array as da
 import iris
 import iris.cube
 import numpy as np
-from skimage.metrics import structural_similarity
+from scipy.ndimage import gaussian_filter
 
 from CSET._common import is_increasing
 from CSET.operators._utils import fully_equalise_attributes, get_cube_yxcoordname
@@ -123,10 +124,160 @@ def _SSIM_cube_preparation(
 
     if time_coord is None:
         raise ValueError("Cubes should contain a time coordinate.")
-    # Create and empty CubeList for storing the time or realization data.
     return base, other, time_coord
 
 
+def _first_along(cube: iris.cube.Cube, dims) -> iris.cube.Cube:
+    """Take the first point along the given dimensions, removing them."""
+    return cube[tuple(0 if dim in dims else slice(None) for dim in range(cube.ndim))]
+
+
+def _ssim_float_type(*dtypes) -> np.dtype:
+    """Use single precision only when all of the input is single precision."""
+    return np.result_type(
+        *(
+            np.float32 if dtype.kind == "f" and dtype.itemsize <= 4 else np.float64
+            for dtype in dtypes
+        )
+    )
+
+
+def _structural_similarity_block(
+    im1: np.ndarray,
+    im2: np.ndarray,
+    spatial_axes: tuple[int, int],
+    sigma: float,
+    mean: bool,
+) -> np.ndarray:
+    """Calculate the structural similarity of every 2D field in a stack.
+
+    This matches :func:`skimage.metrics.structural_similarity` with Gaussian
+    weights applied to each 2D field separately, but filters the whole stack at
+    once by only smoothing over the spatial axes. The data range of each field
+    is taken from im2.
+
+    Parameters
+    ----------
+    im1, im2: np.ndarray
+        Stacks of fields to compare, with the full spatial extent.
+    spatial_axes: tuple[int, int]
+        Axes of the y and x dimensions.
+    sigma: float
+        Standard deviation of the Gaussian kernel.
+    mean: bool
+        Whether to return the mean structural similarity of each field instead
+        of the structural similarity map.
+
+    Returns
+    -------
+    np.ndarray
+        Structural similarity maps with the shape of the input, or the means
+        with the spatial axes removed.
+    """
+    K1, K2 = 0.01, 0.03
+    # Set to give an 11-tap filter with the default sigma of 1.5 to match
+    # Wang et. al. 2004, as in skimage.
+    truncate = 3.5
+    radius = int(truncate * sigma + 0.5)
+    win_size = 2 * radius + 1
+    if any(im1.shape[axis] < win_size for axis in spatial_axes):
+        raise ValueError("Gaussian window exceeds spatial extent of data.")
+
+    float_type = _ssim_float_type(im1.dtype, im2.dtype)
+    # Masked points are excluded from the data range, but otherwise ignored.
+    data_range = im2.max(axis=spatial_axes, keepdims=True) - im2.min(
+        axis=spatial_axes, keepdims=True
+    )
+    data_range = np.ma.getdata(data_range).astype(float_type, copy=False)
+    im1 = np.ma.getdata(im1).astype(float_type, copy=False)
+    im2 = np.ma.getdata(im2).astype(float_type, copy=False)
+
+    # Smooth only over the spatial axes; a sigma of zero skips an axis.
+    sigmas = [sigma if axis in spatial_axes else 0 for axis in range(im1.ndim)]
+
+    def smooth(x):
+        return gaussian_filter(x, sigmas, mode="reflect", truncate=truncate)
+
+    # Sample covariance normalisation over the window, as in skimage.
+    num_points = win_size**2
+    cov_norm = num_points / (num_points - 1)
+    ux = smooth(im1)
+    uy = smooth(im2)
+    vx = cov_norm * (smooth(im1 * im1) - ux * ux)
+    vy = cov_norm * (smooth(im2 * im2) - uy * uy)
+    vxy = cov_norm * (smooth(im1 * im2) - ux * uy)
+
+    C1 = (K1 * data_range) ** 2
+    C2 = (K2 * data_range) ** 2
+    ssim = ((2 * ux * uy + C1) * (2 * vxy + C2)) / (
+        (ux**2 + uy**2 + C1) * (vx + vy + C2)
+    )
+    if not mean:
+        return ssim
+
+    # Ignore a strip of the filter radius around the edges to avoid edge
+    # effects, and use float64 for accuracy.
+    crop = tuple(
+        slice(radius, -radius or None) if axis in spatial_axes else slice(None)
+        for axis in range(ssim.ndim)
+    )
+    return ssim[crop].mean(axis=spatial_axes, dtype=np.float64)
+
+
+def _structural_similarity(
+    cubes: iris.cube.CubeList, sigma: float, mean: bool
+) -> iris.cube.Cube:
+    """Calculate the structural similarity over all fields of two cubes at once.
+
+    Lazy data is processed block-wise, with each block holding whole fields.
+    The result is written directly into a single output cube, rather than
+    merging a cube per field.
+    """
+    base, other, _ = _SSIM_cube_preparation(cubes)
+
+    # A length one realization dimension was historically collapsed to a scalar
+    # coordinate, so is kept that way.
+    if (
+        base.coords("realization", dim_coords=True)
+        and len(base.coord("realization")) == 1
+    ):
+        base = _first_along(base, base.coord_dims("realization"))
+        other = _first_along(other, other.coord_dims("realization"))
+
+    y_name, x_name = get_cube_yxcoordname(base)
+    spatial_axes = (base.coord_dims(y_name)[0], base.coord_dims(x_name)[0])
+
+    if base.has_lazy_data() or other.has_lazy_data():
+        # Each block must contain entire fields for the spatial smoothing.
+        whole_fields = {axis: -1 for axis in spatial_axes}
+        im1 = da.asarray(other.core_data()).rechunk(whole_fields)
+        im2 = da.asarray(base.core_data()).rechunk(whole_fields)
+        ssim = da.map_blocks(
+            _structural_similarity_block,
+            im1,
+            im2,
+            spatial_axes=spatial_axes,
+            sigma=sigma,
+            mean=mean,
+            drop_axis=spatial_axes if mean else [],
+            dtype=np.float64 if mean else _ssim_float_type(im1.dtype, im2.dtype),
+        )
+    else:
+        ssim = _structural_similarity_block(
+            other.data, base.data, spatial_axes, sigma, mean
+        )
+
+    if mean:
+        # The mean structural similarity is compressed to a single point, so
+        # the output keeps the coordinates of the first point of the domain.
+        base = _first_along(base, spatial_axes)
+    ssim = base.copy(data=ssim)
+    ssim.standard_name = None
+    ssim.long_name = "structural_similarity"
+    ssim.units = "1"
+    return ssim
+
+
 def spatial_structural_similarity_model_comparisons(
     cubes: iris.cube.CubeList, sigma: float = 1.5
 ) -> iris.cube.Cube:
@@ -190,35 +341,7 @@ def spatial_structural_similarity_model_comparisons(
     >>> plt.colorbar()
     >>> plt.show()
     """
-    base, other, time_coord = _SSIM_cube_preparation(cubes)
-    ssim = iris.cube.CubeList()
-
-    # Loop over realization and time coordinates.
-    for base_r, other_r in zip(
-        base.slices_over("realization"),
-        other.slices_over("realization"),
-        strict=True,
-    ):
-        for base_t, other_t in zip(
-            base_r.slices_over(time_coord), other_r.slices_over(time_coord), strict=True
-        ):
-            # Use the full array as output will be as a 2D map.
-            ssim_map = base_t.copy()
-            _, ssim_map.data = structural_similarity(
-                other_t.data,
-                base_t.data,
-                data_range=base_t.data.max() - base_t.data.min(),
-                gaussian_weights=True,
-                sigma=sigma,
-                full=True,
-            )
-            ssim.append(ssim_map)
-    # Merge the cube slices into one cube, rename, and change units.
-    ssim = ssim.merge_cube()
-    ssim.standard_name = None
-    ssim.long_name = "structural_similarity"
-    ssim.units = "1"
-    return ssim
+    return _structural_similarity(cubes, sigma, mean=False)
 
 
 def mean_structural_similarity_model_comparisons(
@@ -280,33 +403,4 @@ def mean_structural_similarity_model_comparisons(
             cubes,sigma=1.5, spatial_plot=False)
     >>> iplt.plot(MSSIM)
     """
-    base, other, time_coord = _SSIM_cube_preparation(cubes)
-    ssim = iris.cube.CubeList()
-
-    # Loop over realization and time coordinates.
-    for base_r, other_r in zip(
-        base.slices_over("realization"),
-        other.slices_over("realization"),
-        strict=True,
-    ):
-        for base_t, other_t in zip(
-            base_r.slices_over(time_coord), other_r.slices_over(time_coord), strict=True
-        ):
-            # The MSSIM (Mean structural similarity) is compression to
-            # a single point. Therefore, copying cube data for one
-            # point in the domain to keep cube consistency.
-            mssim = base_t[0, 0].copy()
-            mssim.data = structural_similarity(
-                other_t.data,
-                base_t.data,
-                data_range=base_t.data.max() - base_t.data.min(),
-                gaussian_weights=True,
-                sigma=sigma,
-            )
-            ssim.append(mssim)
-    # Merge the cube slices into one cube, rename, and change units.
-    ssim = ssim.merge_cube()
-    ssim.standard_name = None
-    ssim.long_name = "structural_similarity"
-    ssim.units = "1"
-    return ssim
+    return _structural_similarity(cubes, sigma, mean=True)
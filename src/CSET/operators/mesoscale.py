@@ -21,8 +21,10 @@ CSET.
 
 """
 
+import functools
 import logging
 
+import dask.array as da
 import iris
 from scipy.ndimage import gaussian_filter, uniform_filter
 
@@ -30,6 +32,9 @@ from CSET.operators._utils import get_cube_yxcoordname
 
 logger = logging.getLogger(__name__)
 
+# Number of standard deviations at which gaussian_filter truncates its kernel.
+_GAUSSIAN_TRUNCATE = 4.0
+
 
 def spatial_perturbation_field(
     original_field: iris.cube.Cube,
@@ -56,7 +61,13 @@ def spatial_perturbation_field(
     Returns
     -------
     pert_field: iris.cube.Cube
-        An iris cube of the spatial perturbation field.
+        An iris cube of the spatial perturbation field. Its data is lazy, and
+        is computed for each time or realization separately when realised.
+
+    Raises
+    ------
+    ValueError
+        If the field doesn't have two spatial dimensions.
 
     Notes
     -----
@@ -88,23 +99,51 @@ def spatial_perturbation_field(
     >>> plt.show()
 
     """
-    pert_field = original_field.copy()
-    # find axes of spatial coordinates in field
-    coords = [coord.name() for coord in original_field.coords()]
-    # axes tuple containing latitude, longitude coordinate name.
-    axes = (
-        coords.index(get_cube_yxcoordname(original_field)[0]),
-        coords.index(get_cube_yxcoordname(original_field)[1]),
+    # Axes of the spatial dimensions of the field.
+    y_name, x_name = get_cube_yxcoordname(original_field)
+    axes = tuple(
+        dict.fromkeys(
+            original_field.coord_dims(y_name) + original_field.coord_dims(x_name)
+        )
     )
+    if len(axes) != 2:
+        raise ValueError(
+            f"Field must have two spatial dimensions, but has {len(axes)}."
+        )
     # apply convolution depending on type used
     if apply_gaussian_filter:
         filter_type = "Gaussian"
         logger.info("Gaussian filter applied.")
-        pert_field.data -= gaussian_filter(original_field.data, filter_scale, axes=axes)
+        smooth = functools.partial(gaussian_filter, sigma=filter_scale, axes=axes)
+        radius = int(_GAUSSIAN_TRUNCATE * filter_scale + 0.5)
     else:
         logger.info("Uniform filter applied.")
         filter_type = "Uniform"
-        pert_field.data -= uniform_filter(original_field.data, filter_scale, axes=axes)
+        smooth = functools.partial(uniform_filter, size=filter_scale, axes=axes)
+        radius = filter_scale // 2
+
+    def perturbation(block):
+        return block - smooth(block)
+
+    # Each slice over the other dimensions, such as time and realization, is
+    # filtered separately. Spatial chunks are filtered with a halo of the
+    # filter's radius, unless it covers the whole domain.
+    data = original_field.lazy_data()
+    chunks = {dim: 1 for dim in range(data.ndim) if dim not in axes}
+    depth = {}
+    for dim in axes:
+        if radius < data.shape[dim]:
+            depth[dim] = radius
+        else:
+            chunks[dim] = -1
+    pert_data = da.map_overlap(
+        perturbation,
+        data.rechunk(chunks),
+        depth=depth,
+        boundary="reflect",
+        dtype=data.dtype,
+    )
+    pert_field = original_field.copy(data=pert_data)
     # provide attributes to cube to indicate spatial perturbation field
     pert_field.attributes["perturbation_field"] = (
         f"{filter_type}_with_{filter_scale}_grid_point_filter_scale"
@@ -16,24 +16,28 @@
 
 import fcntl
 import importlib.resources
-import itertools
 import json
 import logging
 import math
 import os
 import sys
+from pathlib import Path
 from typing import Literal
 
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
+import dask
+import dask.array as da
 import iris
 import iris.coords
 import iris.cube
 import iris.exceptions
 import iris.plot as iplt
 import matplotlib as mpl
+import matplotlib.image
 import matplotlib.pyplot as plt
 import numpy as np
+import PIL.Image
 from cartopy.mpl.geoaxes import GeoAxes
 from iris.cube import Cube
 from markdown_it import MarkdownIt
@@ -46,10 +50,12 @@ from CSET._common import (
     render_file,
     slugify,
 )
+from CSET.operators import _tiles
 from CSET.operators._colormaps import (
     colorbar_map_levels,
     get_model_colors_map,
 )
+from CSET.operators._decimate import check_decimation_method, decimate_for_display
 from CSET.operators._utils import (
     check_sequence_coordinate,
     check_single_cube,
@@ -147,17 +153,97 @@ def _save_close_figure(figure, plot_type: str, filename: str):
         Filename for saved figure.
     """
     if not in_sphinx_gallery():
-        figure.savefig(filename, bbox_inches="tight", dpi=_get_plot_resolution())
+        dpi = _get_plot_resolution()
+        pixels = _draw_tight(figure, dpi)
+        if pixels is None:
+            figure.savefig(filename, bbox_inches="tight", dpi=dpi)
+        else:
+            _write_image(pixels, filename, dpi)
         logger.info("Saved %s plot to %s", plot_type, filename)
         plt.close(figure)
 
 
+def _draw_tight(figure, dpi: int) -> np.ndarray | None:
+    """Draw a figure once, cropped to its tight bounding box.
+
+    Saving with a tight bounding box normally draws the figure twice, first to
+    find the bounding box and then to write it. Instead the figure is drawn
+    once, and the bounding box found from that draw is cropped out of the
+    rendered pixels.
+
+    Returns
+    -------
+    pixels: np.ndarray | None
+        RGBA pixels of the cropped figure, or None if the figure can't be
+        cropped, such as when the bounding box extends beyond the figure.
+    """
+    if not hasattr(figure.canvas, "buffer_rgba"):
+        return None
+    figure.set_dpi(dpi)
+    figure.canvas.draw()
+    pad = mpl.rcParams["savefig.pad_inches"]
+    bbox = figure.get_tightbbox(figure.canvas.get_renderer()).padded(pad)
+    pixels = np.asarray(figure.canvas.buffer_rgba())
+    height, width = pixels.shape[:2]
+    x0 = math.floor(bbox.x0 * dpi)
+    x1 = math.ceil(bbox.x1 * dpi)
+    # Pixel rows count down from the top of the figure.
+    y0 = height - math.ceil(bbox.y1 * dpi)
+    y1 = height - math.floor(bbox.y0 * dpi)
+    if x0 < 0 or y0 < 0 or x1 > width or y1 > height:
+        return None
+    return pixels[y0:y1, x0:x1]
+
+
+def _write_image(pixels: np.ndarray, filename: str, dpi: int):
+    """Encode RGBA pixels to an image file, in the format of its extension.
+
+    Opaque PNGs with no more than 256 colours, such as plots of discrete
+    colour levels, are losslessly palettised, which is much faster to compress
+    and gives much smaller files. Images with more colours are written in true
+    colour, unless the recipe's plot_quantise is true, in which case they are
+    lossily quantised to 256 colours. Other formats supported by Pillow, such
+    as WebP, can also be used.
+    """
+    image = PIL.Image.fromarray(np.ascontiguousarray(pixels))
+    if pixels[..., 3].min() == 255:
+        image = image.convert("RGB")
+        if filename.lower().endswith(".png"):
+            image = _palettise(
+                image, lossy=get_recipe_metadata().get("plot_quantise", False)
+            )
+    image.save(filename, dpi=(dpi, dpi))
+
+
+def _palettise(image, lossy: bool):
+    """Convert an RGB image to a palette image, if it has few enough colours.
+
+    Images with more than 256 colours are returned unchanged, or quantised to
+    256 colours if lossy.
+    """
+    colours = image.getcolors(256)
+    if colours is None:
+        if not lossy:
+            return image
+        return image.quantize(256, method=PIL.Image.Quantize.MEDIANCUT, dither=0)
+    # Index each pixel into the exact palette of its colours.
+    pixels = np.asarray(image, dtype=np.uint32)
+    packed = (pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]
+    palette, indices = np.unique(packed, return_inverse=True)
+    palette_image = PIL.Image.fromarray(indices.reshape(packed.shape).astype(np.uint8))
+    rgb = np.stack([palette >> 16, palette >> 8, palette], axis=-1) & 0xFF
+    # Adding a palette makes the image a palette image.
+    palette_image.putpalette(rgb.astype(np.uint8).tobytes())
+    return palette_image
+
+
 def _setup_spatial_map(
     cube: iris.cube.Cube,
     figure,
     cmap,
     grid_size: tuple[int, int] | None = None,
     subplot: int | None = None,
+    map_layers: Literal["all", "lines", "labels"] = "all",
 ):
     """Define map projections, extent and add coastlines and borderlines for spatial plots.
 
@@ -176,6 +262,10 @@ def _setup_spatial_map(
         Size of grid (rows, cols) for subplots if multiple spatial subplots in figure.
     subplot: int, optional
         Subplot index if multiple spatial subplots in figure.
+    map_layers: "all" | "lines" | "labels", optional
+        Which map decorations to add. Either coastlines, borderlines and
+        labelled gridlines, just the lines, or just the gridline labels.
+        Defaults to all of them.
 
     Returns
     -------
@@ -253,7 +343,9 @@ def _setup_spatial_map(
 
         # Add coastlines and borderlines if cube contains x and y map coordinates.
         # Avoid adding lines for specific fixed ancillary spatial plots
-        if any(name in cube.name() for name in ("land_", "orography", "altitude")):
+        if map_layers == "labels" or any(
+            name in cube.name() for name in ("land_", "orography", "altitude")
+        ):
             pass
         else:
             if cmap.name in ["viridis", "Greys"]:
@@ -267,13 +359,16 @@ def _setup_spatial_map(
         # Add gridlines.
         gl = axes.gridlines(
             alpha=0.3,
-            draw_labels=True,
+            draw_labels=map_layers != "lines",
             dms=False,
             x_inline=False,
             y_inline=False,
         )
         gl.top_labels = False
         gl.right_labels = False
+        if map_layers == "labels":
+            gl.xlines = False
+            gl.ylines = False
         if subplot:
             gl.bottom_labels = False
             gl.left_labels = False
@@ -296,6 +391,108 @@ def _setup_spatial_map(
     return axes
 
 
+def _map_background(
+    cube: iris.cube.Cube, cmap, figsize, grid_size: tuple[int, int]
+) -> np.ndarray | None:
+    """Render the map lines of a postage stamp once, to share between stamps.
+
+    The coastlines, borderlines and gridlines of the first stamp of a grid are
+    drawn on an otherwise transparent figure of the same size and resolution as
+    the postage stamp figure, and cropped to the stamp's axes.
+
+    Returns
+    -------
+    background: np.ndarray | None
+        RGBA pixels of the map lines, or None if the cube is not a map.
+    """
+    fig = plt.figure(figsize=figsize, dpi=_get_plot_resolution())
+    try:
+        axes = _setup_spatial_map(
+            cube, fig, cmap, grid_size=grid_size, subplot=1, map_layers="lines"
+        )
+        if not isinstance(axes, GeoAxes):
+            return None
+        # Only the lines should be drawn, not the frame or background.
+        fig.patch.set_visible(False)
+        axes.patch.set_visible(False)
+        for spine in axes.spines.values():
+            spine.set_visible(False)
+        return _draw_axes_pixels(fig, axes)
+    finally:
+        plt.close(fig)
+
+
+def _draw_axes_pixels(figure, axes) -> np.ndarray:
+    """Draw a figure, returning a copy of the RGBA pixels within the axes."""
+    figure.canvas.draw()
+    pixels = np.asarray(figure.canvas.buffer_rgba())
+    bbox = axes.bbox
+    height = pixels.shape[0]
+    return pixels[
+        height - round(bbox.y1) : height - round(bbox.y0),
+        round(bbox.x0) : round(bbox.x1),
+    ].copy()
+
+
+def _save_tile_pyramid(cube: iris.cube.Cube, filename: str, method: str):
+    """Render a spatial field at its full resolution into a tile pyramid.
+
+    The field is rendered once with its map lines but without any labels, at
+    about one pixel per grid cell, and cut into tiles in a directory named
+    after the plot.
+    """
+    if in_sphinx_gallery():
+        return
+    try:
+        lat_axis, lon_axis = get_cube_yxcoordname(cube)
+    except ValueError:
+        logger.warning("Not writing tiles for %s, as it is not a map.", filename)
+        return
+    cells = max(cube.coord(lat_axis).shape[0], cube.coord(lon_axis).shape[0])
+    dpi = 100
+    size = _tiles.rendered_size(cells) / dpi
+    fig = plt.figure(figsize=(size, size), dpi=dpi)
+    try:
+        cmap, levels, norm = colorbar_map_levels(cube)
+        axes = _setup_spatial_map(cube, fig, cmap, map_layers="lines")
+        # Fill the figure, leaving the area outside of the map transparent.
+        axes.set_position([0, 0, 1, 1])
+        fig.patch.set_visible(False)
+        vmin, vmax = _colour_range(levels, norm)
+        if method == "contourf":
+            iplt.contourf(cube, cmap=cmap, levels=levels, norm=norm)
+        else:
+            iplt.pcolormesh(cube, cmap=cmap, norm=norm, vmin=vmin, vmax=vmax)
+        pixels = _draw_axes_pixels(fig, axes)
+    finally:
+        plt.close(fig)
+    _tiles.write_tile_pyramid(
+        PIL.Image.fromarray(pixels), Path(f"{filename.rsplit('.', 1)[0]}_tiles")
+    )
+
+
+def _colour_range(levels, norm) -> tuple[float | None, float | None]:
+    """Get the vmin and vmax to plot with, which are unset if norm is used."""
+    try:
+        vmin = min(levels)
+        vmax = max(levels)
+    except TypeError:
+        vmin, vmax = None, None
+    # Ensure to use norm and not vmin/vmax if levels are defined.
+    if norm is not None:
+        vmin = None
+        vmax = None
+    return vmin, vmax
+
+
+def _discrete_levels(cube: iris.cube.Cube) -> np.ndarray | None:
+    """Get the boundaries of the discrete colour levels of a field, if any."""
+    _, _, norm = colorbar_map_levels(cube)
+    if isinstance(norm, mpl.colors.BoundaryNorm):
+        return norm.boundaries
+    return None
+
+
 def _get_plot_resolution() -> int:
     """Get resolution of rasterised plots in pixels per inch."""
     return get_recipe_metadata().get("plot_resolution", 100)
@@ -474,40 +671,101 @@ def _set_axis_range(cubes):
             break
 
     if levels is None:
-        vmin = min(cb.data.min() for cb in cubes)
-        vmax = max(cb.data.max() for cb in cubes)
+        # Find all minima and maxima in a single pass, without realising data.
+        limits = dask.compute(
+            *(cb.core_data().min() for cb in cubes),
+            *(cb.core_data().max() for cb in cubes),
+        )
+        vmin = min(limits[: len(cubes)])
+        vmax = max(limits[len(cubes) :])
 
     return vmin, vmax
 
 
+def _histogram_counts(cubes: iris.cube.CubeList, bins) -> list[np.ndarray]:
+    """Count the data of each cube into fixed bins.
+
+    Lazy data is binned chunk by chunk, so the full field is never held in
+    memory, and the histograms of all cubes are computed in a single pass.
+    """
+    counts = [
+        da.histogram(cube.core_data(), bins=bins)[0]
+        if cube.has_lazy_data()
+        else np.histogram(cube.data, bins=bins)[0]
+        for cube in cubes
+    ]
+    return list(dask.compute(*counts))
+
+
+def _save_histogram_counts(
+    filename: str, bins, cubes: iris.cube.CubeList, counts: list[np.ndarray]
+):
+    """Save the bin counts of a histogram plot alongside it.
+
+    The counts allow the histogram to be replotted, or combined with those of
+    other cases by summing, without needing the original data.
+    """
+    if in_sphinx_gallery() or get_recipe_metadata().get("skip_write"):
+        return
+    histograms = {
+        "name": cubes[0].name(),
+        "units": str(cubes[0].units),
+        "bins": np.asarray(bins).tolist(),
+        "histograms": [
+            {"model_name": cube.attributes.get("model_name"), "counts": c.tolist()}
+            for cube, c in zip(cubes, counts, strict=True)
+        ],
+    }
+    counts_file = f"{os.path.splitext(filename)[0]}_histogram.json"
+    with open(counts_file, "wt", encoding="UTF-8") as fp:
+        json.dump(histograms, fp)
+    logger.debug("Saved histogram counts to %s", counts_file)
+
+
+def _matched_slice_indices(
+    cubes, sequence_coordinate
+) -> dict[object, list[tuple[iris.cube.Cube, int | None]]]:
+    """Group the positions of each sequence_coordinate point across cubes.
+
+    Returns a dictionary mapping each point, in sorted order, to the cubes
+    containing it and the index of the point along the coordinate's dimension.
+    The index is None for scalar coordinates. No cubes are sliced.
+    """
+    matched = {}
+    for cube in cubes:
+        coord = cube.coord(sequence_coordinate)
+        if not cube.coord_dims(coord):
+            matched.setdefault(coord.points[0], []).append((cube, None))
+            continue
+        for index, point in enumerate(coord.points):
+            matched.setdefault(point, []).append((cube, index))
+    return {point: matched[point] for point in sorted(matched)}
+
+
 def _find_matched_slices(cubes, sequence_coordinate):
     """Identify matched cubes in CubeList by sequence_coordinate values.
 
-    Ensures common points are compared for multiple cube inputs.
+    Ensures common points are compared for multiple cube inputs. Yields a
+    CubeList of the matching slices for each point, in sorted order, only
+    slicing the cubes as each point is reached.
     """
-    all_points = sorted(
-        set(
-            itertools.chain.from_iterable(
-                cb.coord(sequence_coordinate).points for cb in cubes
-            )
-        )
-    )
-    all_slices = list(
-        itertools.chain.from_iterable(
-            cb.slices_over(sequence_coordinate) for cb in cubes
-        )
-    )
     # Matched slices (matched by seq coord point; it may happen that
     # evaluated models do not cover the same seq coord range, hence matching
     # necessary)
-    cube_iterables = [
-        iris.cube.CubeList(
-            s for s in all_slices if s.coord(sequence_coordinate).points[0] == point
+    for positions in _matched_slice_indices(cubes, sequence_coordinate).values():
+        yield iris.cube.CubeList(
+            _slice_at(cube, sequence_coordinate, index) for cube, index in positions
         )
-        for point in all_points
-    ]
 
-    return cube_iterables
+
+def _slice_at(cube: iris.cube.Cube, coordinate: str, index: int | None):
+    """Slice of a cube at an index along a coordinate, as from slices_over."""
+    if index is None:
+        return cube
+    (dim,) = cube.coord_dims(coordinate)
+    keys = [slice(None)] * cube.ndim
+    keys[dim] = index
+    return cube[tuple(keys)]
 
 
 def _plot_and_save_spatial_plot(
@@ -556,15 +814,8 @@ def _plot_and_save_spatial_plot(
     axes = _setup_spatial_map(cube, fig, cmap)
 
     # Set colorscale bounds
-    try:
-        vmin = min(levels)
-        vmax = max(levels)
-    except TypeError:
-        vmin, vmax = None, None
-    # Ensure to use norm and not vmin/vmax if levels are defined.
+    vmin, vmax = _colour_range(levels, norm)
     if norm is not None:
-        vmin = None
-        vmax = None
         logger.debug("Plotting using defined levels.")
 
     # Plot the field.
@@ -861,16 +1112,37 @@ def _plot_and_save_postage_stamp_spatial_plot(
     if contour_cube:
         cntr_cmap, cntr_levels, cntr_norm = colorbar_map_levels(contour_cube)
 
+    # The map lines are the same for every member, so are drawn once and
+    # shared between the stamps.
+    background = _map_background(
+        next(cube.slices_over(stamp_coordinate)),
+        cmap,
+        fig.get_size_inches(),
+        (grid_rows, grid_size),
+    )
+
     # Make a subplot for each member.
     for member, subplot in zip(
         cube.slices_over(stamp_coordinate),
         range(1, grid_size * grid_rows + 1),
         strict=False,
     ):
-        # Setup subplot map projection, extent and coastlines and borderlines.
+        # Setup subplot map projection, extent and gridline labels.
         axes = _setup_spatial_map(
-            member, fig, cmap, grid_size=(grid_rows, grid_size), subplot=subplot
+            member,
+            fig,
+            cmap,
+            grid_size=(grid_rows, grid_size),
+            subplot=subplot,
+            map_layers="labels" if background is not None else "all",
         )
+        if background is not None:
+            # Draw the shared map lines over the field, as the coastlines would be.
+            axes.add_artist(
+                mpl.image.BboxImage(
+                    axes.bbox, data=background, interpolation="nearest", zorder=1.5
+                )
+            )
         if method == "contourf":
             # Filled contour plot of the field.
             plot = iplt.contourf(member, cmap=cmap, levels=levels, norm=norm)
@@ -1539,51 +1811,55 @@ def _plot_and_save_histogram_series(
     # at each bin (integral over range sums to 1).
     density = True
 
-    for cube in iter_maybe(cubes):
-        # Easier to check title (where var name originates)
-        # than seeing if long names exist etc.
-        # Exception case, where distribution better fits log scales/bins.
-        if (
-            ("surface_microphysical" in title)
-            or ("rain accumulation" in title)
-            or ("Rainfall rate Composite" in title)
-            or ("Nimrod_5min" in title)
-        ):
-            if "amount" in title:
-                # Compute histogram following Klingaman et al. (2017): ASoP
-                bin2 = np.exp(np.log(0.02) + 0.1 * np.linspace(0, 99, 100))
-                bins = np.pad(bin2, (1, 0), "constant", constant_values=0)
-                density = False
-            else:
-                bins = 10.0 ** (
-                    np.arange(-10, 27, 1) / 10.0
-                )  # Suggestion from RMED toolbox.
-                bins = np.insert(bins, 0, 0)
-                ax.set_yscale("log")
-            vmin = bins[1]
-            vmax = bins[-1]  # Manually set vmin/vmax to override json derived value.
-            ax.set_xscale("log")
-        elif "lightning" in title:
-            bins = [0, 1, 2, 3, 4, 5]
+    # Easier to check title (where var name originates)
+    # than seeing if long names exist etc.
+    # Exception case, where distribution better fits log scales/bins.
+    if (
+        ("surface_microphysical" in title)
+        or ("rain accumulation" in title)
+        or ("Rainfall rate Composite" in title)
+        or ("Nimrod_5min" in title)
+    ):
+        if "amount" in title:
+            # Compute histogram following Klingaman et al. (2017): ASoP
+            bin2 = np.exp(np.log(0.02) + 0.1 * np.linspace(0, 99, 100))
+            bins = np.pad(bin2, (1, 0), "constant", constant_values=0)
+            density = False
         else:
-            bins = np.linspace(vmin, vmax, 51)
-        logger.debug(
-            "Plotting histogram with %s bins %s - %s.",
-            np.size(bins),
-            np.min(bins),
-            np.max(bins),
-        )
+            bins = 10.0 ** (
+                np.arange(-10, 27, 1) / 10.0
+            )  # Suggestion from RMED toolbox.
+            bins = np.insert(bins, 0, 0)
+            ax.set_yscale("log")
+        vmin = bins[1]
+        vmax = bins[-1]  # Manually set vmin/vmax to override json derived value.
+        ax.set_xscale("log")
+    elif "lightning" in title:
+        bins = np.array([0, 1, 2, 3, 4, 5])
+    else:
+        bins = np.linspace(vmin, vmax, 51)
+    logger.debug(
+        "Plotting histogram with %s bins %s - %s.",
+        np.size(bins),
+        np.min(bins),
+        np.max(bins),
+    )
 
-        # Reshape cube data into a single array to allow for a single histogram.
-        # Otherwise we plot xdim histograms stacked.
-        cube_data_1d = (cube.data).flatten()
+    # Bin all cubes together, streaming through the data once, and keep the
+    # counts so the plot can be recreated without the data.
+    cubes = iris.cube.CubeList(iter_maybe(cubes))
+    all_counts = _histogram_counts(cubes, bins)
+    _save_histogram_counts(filename, bins, cubes, all_counts)
 
+    for cube, counts in zip(cubes, all_counts, strict=True):
         label = None
         color = "black"
         if model_colors_map:
             label = cube.attributes.get("model_name")
             color = model_colors_map[label]
-        x, y = np.histogram(cube_data_1d, bins=bins, density=density)
+        # Normalise as np.histogram does for a probability density function.
+        x = counts / np.diff(bins).astype(float) / counts.sum() if density else counts
+        y = bins
 
         # Compute area under curve.
         if (
@@ -1868,6 +2144,8 @@ def _spatial_plot(
     overlay_cube: iris.cube.Cube | None = None,
     contour_cube: iris.cube.Cube | None = None,
     point_cube: iris.cube.Cube | None = None,
+    decimation: str | None = None,
+    tiles: bool = False,
     **kwargs,
 ):
     """Plot a spatial variable onto a map from a 2D, 3D, or 4D cube.
@@ -1904,17 +2182,28 @@ def _spatial_plot(
         Optional 2 dimensional (lat and lon) Cube of data to overplot as contours over base cube
     point_cube: Cube | None, optional
         Optional 1 dimensional (e.g. list of points) or 2 dimensional (lat and lon) Cube of data to overplot as map of scatter points over base cube
+    decimation: str | None, optional
+        Method used to reduce gridded fields to the resolution of the figure
+        before plotting, one of 'AUTO', 'MEAN', 'MAX', 'MODE' or 'STRIDE'.
+        Defaults to plotting at full resolution.
+    tiles: bool, optional
+        Also write a zoomable pyramid of tiles of each map, rendered at the
+        full resolution of the field. Not written for postage stamp plots.
 
     Raises
     ------
     ValueError
-        If the cube doesn't have the right dimensions.
+        If the cube doesn't have the right dimensions, or the decimation
+        method isn't recognised.
     TypeError
         If the cube isn't a single cube.
     """
     # Ensure we've got a single cube.
     cube = check_single_cube(cube)
 
+    if decimation is not None:
+        check_decimation_method(decimation)
+
     # Set title based on recipe metadata or use cube name
     recipe_title = get_recipe_metadata().get("title", cube.name())
 
@@ -1970,6 +2259,35 @@ def _spatial_plot(
         contour_slice = slice_over_maybe(contour_cube, sequence_coordinate, iseq)
         point_slice = slice_over_maybe(point_cube, sequence_coordinate, iseq)
 
+        # Tiles are rendered from the field at its full resolution.
+        if tiles and plotting_func is _plot_and_save_spatial_plot:
+            if method == "scatter":
+                logger.warning("Tiles can't be written for scatter plots.")
+            else:
+                _save_tile_pyramid(cube_slice, plot_filename, method)
+
+        # Reduce gridded fields to no more cells than pixels across the
+        # 10 inch wide figure, as finer detail can't be seen.
+        if decimation is not None and method != "scatter":
+            max_cells = 10 * _get_plot_resolution()
+            cube_slice = decimate_for_display(
+                cube_slice, max_cells, decimation, _discrete_levels(cube_slice)
+            )
+            if overlay_slice is not None:
+                overlay_slice = decimate_for_display(
+                    overlay_slice,
+                    max_cells,
+                    decimation,
+                    _discrete_levels(overlay_slice),
+                )
+            if contour_slice is not None:
+                contour_slice = decimate_for_display(
+                    contour_slice,
+                    max_cells,
+                    decimation,
+                    _discrete_levels(contour_slice),
+                )
+
         # Do the actual plotting.
         plotting_func(
             cube_slice,
@@ -2001,6 +2319,7 @@ def spatial_contour_plot(
     filename: str | None = None,
     sequence_coordinate: str = "time",
     stamp_coordinate: str = "realization",
+    decimation: str | None = None,
     **kwargs,
 ) -> iris.cube.Cube:
     """Plot a spatial variable onto a map from a 2D, 3D, or 4D cube.
@@ -2024,6 +2343,13 @@ def spatial_contour_plot(
     stamp_coordinate: str, optional
         Coordinate about which to plot postage stamp plots. Defaults to
         ``"realization"``.
+    decimation: str, optional
+        Reduce the field to the resolution of the figure before plotting,
+        which is much faster for high resolution fields. One of 'MEAN' or
+        'MAX' for continuous fields, 'MODE' for categorical fields, 'STRIDE'
+        to subsample, or 'AUTO' to keep the most common colour level of fields
+        with discrete colour levels, and otherwise choose between 'MODE' and
+        'MEAN' based on the data type. Defaults to plotting at full resolution.
 
     Returns
     -------
@@ -2038,7 +2364,13 @@ def spatial_contour_plot(
         If the cube isn't a single cube.
     """
     _spatial_plot(
-        "contourf", cube, filename, sequence_coordinate, stamp_coordinate, **kwargs
+        "contourf",
+        cube,
+        filename,
+        sequence_coordinate,
+        stamp_coordinate,
+        decimation=decimation,
+        **kwargs,
     )
     return cube
 
@@ -2048,6 +2380,8 @@ def spatial_pcolormesh_plot(
     filename: str | None = None,
     sequence_coordinate: str = "time",
     stamp_coordinate: str = "realization",
+    decimation: str | None = None,
+    tiles: bool = False,
     **kwargs,
 ) -> iris.cube.Cube:
     """Plot a spatial variable onto a map from a 2D, 3D, or 4D cube.
@@ -2075,6 +2409,18 @@ def spatial_pcolormesh_plot(
     stamp_coordinate: str, optional
         Coordinate about which to plot postage stamp plots. Defaults to
         ``"realization"``.
+    decimation: str, optional
+        Reduce the field to the resolution of the figure before plotting,
+        which is much faster for high resolution fields. One of 'MEAN' or
+        'MAX' for continuous fields, 'MODE' for categorical fields, 'STRIDE'
+        to subsample, or 'AUTO' to keep the most common colour level of fields
+        with discrete colour levels, and otherwise choose between 'MODE' and
+        'MEAN' based on the data type. Defaults to plotting at full resolution.
+    tiles: bool, optional
+        Also write a zoomable pyramid of image tiles for each plot, rendered at
+        the full resolution of the field, which can be browsed on the plot
+        page. Useful for very high resolution or large domains. Not written
+        for postage stamp plots. Defaults to False.
 
     Returns
     -------
@@ -2094,6 +2440,8 @@ def spatial_pcolormesh_plot(
                 filename,
                 sequence_coordinate,
                 stamp_coordinate,
+                decimation=decimation,
+                tiles=tiles,
                 **kwargs,
             )
     elif isinstance(cubes, iris.cube.Cube):
@@ -2103,6 +2451,8 @@ def spatial_pcolormesh_plot(
             filename,
             sequence_coordinate,
             stamp_coordinate,
+            decimation=decimation,
+            tiles=tiles,
             **kwargs,
         )
     return cubes
@@ -2116,6 +2466,7 @@ def spatial_multi_pcolormesh_plot(
     filename: str | None = None,
     sequence_coordinate: str = "time",
     stamp_coordinate: str = "realization",
+    decimation: str | None = None,
     **kwargs,
 ) -> iris.cube.Cube:
     """Plot a set of spatial variables onto a map from a 2D, 3D, or 4D cube.
@@ -2165,6 +2516,13 @@ def spatial_multi_pcolormesh_plot(
     stamp_coordinate: str, optional
         Coordinate about which to plot postage stamp plots. Defaults to
         ``"realization"``.
+    decimation: str, optional
+        Reduce the field to the resolution of the figure before plotting,
+        which is much faster for high resolution fields. One of 'MEAN' or
+        'MAX' for continuous fields, 'MODE' for categorical fields, 'STRIDE'
+        to subsample, or 'AUTO' to keep the most common colour level of fields
+        with discrete colour levels, and otherwise choose between 'MODE' and
+        'MEAN' based on the data type. Defaults to plotting at full resolution.
 
     Returns
     -------
@@ -2184,6 +2542,7 @@ def spatial_multi_pcolormesh_plot(
         filename,
         sequence_coordinate,
         stamp_coordinate,
+        decimation=decimation,
         overlay_cube=overlay_cube,
         contour_cube=contour_cube,
         point_cube=point_cube,
@@ -2307,30 +2666,8 @@ def plot_line_series(
             cube_iterables = cubes[0].slices_over(sequence_coordinate)
             nplot = np.size(cubes[0].coord(sequence_coordinate).points)
         else:
-            all_points = sorted(
-                set(
-                    itertools.chain.from_iterable(
-                        cb.coord(sequence_coordinate).points for cb in cubes
-                    )
-                )
-            )
-            all_slices = list(
-                itertools.chain.from_iterable(
-                    cb.slices_over(sequence_coordinate) for cb in cubes
-                )
-            )
-            # Matched slices (matched by seq coord point; it may happen that
-            # evaluated models do not cover the same seq coord range, hence matching
-            # necessary)
-            cube_iterables = [
-                iris.cube.CubeList(
-                    s
-                    for s in all_slices
-                    if s.coord(sequence_coordinate).points[0] == point
-                )
-                for point in all_points
-            ]
-            nplot = len(all_points)
+            nplot = len(_matched_slice_indices(cubes, sequence_coordinate))
+            cube_iterables = _find_matched_slices(cubes, sequence_coordinate)
 
         # Create a plot for each value of the sequence coordinate. Allowing for
         # multiple cubes in a CubeList to be plotted in the same plot for similar
@@ -3075,6 +3412,11 @@ def plot_histogram_series(
     stamp_coordinate and single_plot is True, all postage stamp plots will be
     plotted in a single plot instead of separate postage stamp plots.
 
+    Histograms are computed chunk by chunk, so lazy data is never fully loaded.
+    The bin counts of each histogram are saved alongside its plot, as JSON with
+    the ``_histogram.json`` suffix, so they can be replotted or combined across
+    cases without the original data.
+
     Parameters
     ----------
     cubes: Cube | iris.cube.CubeList
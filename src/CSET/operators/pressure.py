@@ -14,12 +14,27 @@
 
 """Operators for pressure conversions."""
 
+import dask.array as da
 import iris.cube
 import numpy as np
 
 from CSET._common import iter_maybe
 from CSET.operators._atmospheric_constants import E0, KAPPA, P0
-from CSET.operators.misc import convert_units
+from CSET.operators._memoise import memoise
+from CSET.operators._utils import lazy_data_in_units
+
+
+@memoise
+def _vapour_pressure_data(temperature: iris.cube.Cube) -> da.Array:
+    """Lazy vapour pressure in hPa, as calculated by vapour_pressure."""
+    T = lazy_data_in_units(temperature, "Celsius")
+    return E0 * np.exp((17.502 * T) / (240.97 + T))
+
+
+@memoise
+def _exner_pressure_data(pressure: iris.cube.Cube) -> da.Array:
+    """Lazy exner pressure, as calculated by exner_pressure."""
+    return (lazy_data_in_units(pressure, "hPa") / P0) ** KAPPA
 
 
 def vapour_pressure(
@@ -65,10 +80,7 @@ def vapour_pressure(
     """
     v_pressure = iris.cube.CubeList([])
     for T in iter_maybe(temperature):
-        es = T.copy()
-        T_units = convert_units(T, "Celsius")
-        exponent = (17.502 * T_units) / (240.97 + T_units)
-        es.data = E0 * np.exp(exponent.core_data())
+        es = T.copy(data=_vapour_pressure_data(T))
         es.units = "hPa"
         es.rename("vapour_pressure")
         v_pressure.append(es)
@@ -120,8 +132,7 @@ def vapour_pressure_from_relative_humidity(
     for T, RH in zip(
         iter_maybe(temperature), iter_maybe(relative_humidity), strict=True
     ):
-        RH = convert_units(RH, "1")
-        vp = vapour_pressure(T) * RH
+        vp = T.copy(data=_vapour_pressure_data(T) * lazy_data_in_units(RH, "1"))
         vp.units = "hPa"
         vp.rename("vapour_pressure")
         v_pressure.append(vp)
@@ -171,9 +182,7 @@ def exner_pressure(
     """
     pi = iris.cube.CubeList([])
     for P in iter_maybe(pressure):
-        PI = P.copy()
-        P = convert_units(P, "hPa")
-        PI.data = (P.core_data() / P0) ** KAPPA
+        PI = P.copy(data=_exner_pressure_data(P))
         PI.rename("exner_pressure")
         PI.units = "1"
         pi.append(PI)
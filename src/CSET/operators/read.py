@@ -20,8 +20,9 @@ import functools
 import glob
 import itertools
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import Literal, NamedTuple
 
 import dask
 import iris
@@ -34,6 +35,7 @@ import numpy as np
 from iris.analysis.cartography import rotate_pole, rotate_winds
 
 from CSET._common import iter_maybe
+from CSET.operators._catalogue import CATALOGUE_FILENAME, prune_files
 from CSET.operators._stash_to_lfric import STASH_TO_LFRIC
 from CSET.operators._utils import (
     get_cube_coordindex,
@@ -54,6 +56,8 @@ def read_cube(
     model_names: list[str] | str | None = None,
     subarea_type: str | None = None,
     subarea_extent: list[float] | None = None,
+    load_workers: int = 1,
+    load_pool: Literal["thread", "process"] = "thread",
     **kwargs,
 ) -> iris.cube.Cube:
     """Read a single cube from files.
@@ -84,6 +88,11 @@ def read_cube(
     subarea_extent: list, optional
         List of coordinates to constraint data by, in order lower latitude,
         upper latitude, lower longitude, upper longitude.
+    load_workers: int, optional
+        Number of workers to load files with. Defaults to 1, loading serially.
+    load_pool: "thread" | "process", optional
+        Whether workers are threads or processes. Processes avoid contention on
+        the GIL and NetCDF library lock, at the cost of starting the pool.
 
     Returns
     -------
@@ -103,6 +112,8 @@ def read_cube(
         model_names=model_names,
         subarea_type=subarea_type,
         subarea_extent=subarea_extent,
+        load_workers=load_workers,
+        load_pool=load_pool,
     )
     # Check filtered cubes is a CubeList containing one cube.
     if len(cubes) == 1:
@@ -119,6 +130,8 @@ def read_cubes(
     model_names: str | list[str] | None = None,
     subarea_type: str | None = None,
     subarea_extent: list | None = None,
+    load_workers: int = 1,
+    load_pool: Literal["thread", "process"] = "thread",
     **kwargs,
 ) -> iris.cube.CubeList:
     """Read cubes from files.
@@ -138,6 +151,11 @@ def read_cubes(
     Data output by XIOS (such as LFRic) has its per-file metadata removed so
     that the cubes merge across files.
 
+    Loading many files, such as one per ensemble member and lead time, can be
+    sped up by using multiple workers. Files are then loaded concurrently, and
+    when multiple models are given they are also loaded concurrently. The
+    result is the same as loading serially.
+
     Arguments
     ---------
     file_paths: str | list[str]
@@ -152,6 +170,11 @@ def read_cubes(
     subarea_extent: list[float], optional
         List of coordinates to constraint data by, in order lower latitude,
         upper latitude, lower longitude, upper longitude.
+    load_workers: int, optional
+        Number of workers to load files with. Defaults to 1, loading serially.
+    load_pool: "thread" | "process", optional
+        Whether workers are threads or processes. Processes avoid contention on
+        the GIL and NetCDF library lock, at the cost of starting the pool.
 
     Returns
     -------
@@ -185,19 +208,31 @@ def read_cubes(
         )
 
     # Load the data for each model into a CubeList per model.
-    model_cubes = (
-        _load_model(path, name, constraint)
-        for path, name in itertools.zip_longest(paths, model_names, fillvalue=None)
-    )
+    model_args = list(itertools.zip_longest(paths, model_names, fillvalue=None))
+    if load_workers > 1:
+        with (
+            _load_executor(load_workers, load_pool) as file_executor,
+            ThreadPoolExecutor(len(model_args)) as model_executor,
+        ):
+            # Models are loaded concurrently, sharing the file loading workers.
+            # Results are in model order, as map preserves the order.
+            model_cubes = list(
+                model_executor.map(
+                    lambda args: _load_model(*args, constraint, file_executor),
+                    model_args,
+                )
+            )
+    else:
+        model_cubes = [_load_model(path, name, constraint) for path, name in model_args]
 
     # Split out first model's cubes and mark it as the base for comparisons.
-    cubes = next(model_cubes)
+    cubes = model_cubes[0]
     for cube in cubes:
         # Use 1 to indicate True, as booleans can't be saved in NetCDF attributes.
         cube.attributes["cset_comparison_base"] = 1
 
-    # Load the rest of the models.
-    cubes.extend(itertools.chain.from_iterable(model_cubes))
+    # Add the rest of the models.
+    cubes.extend(itertools.chain.from_iterable(model_cubes[1:]))
 
     # Enable different point-based observation sources to be concatenated.
     cubes = _check_combine_point_observations(cubes)
@@ -236,16 +271,75 @@ def read_cubes(
     return cubes
 
 
+def _load_executor(
+    load_workers: int, load_pool: Literal["thread", "process"]
+) -> Executor:
+    """Create the pool of workers for loading files."""
+    match load_pool:
+        case "thread":
+            return ThreadPoolExecutor(load_workers)
+        case "process":
+            return ProcessPoolExecutor(load_workers)
+        case _:
+            raise ValueError(f"Unknown load_pool: {load_pool}")
+
+
+def _load_file(
+    path: Path, constraint: iris.Constraint | None = None
+) -> iris.cube.CubeList:
+    """Load the unmerged cubes from a single file, applying the callbacks."""
+    return iris.load_raw(path, constraint, callback=_loading_callback)
+
+
+def _load_files_concurrently(
+    input_files: list[Path],
+    constraint: iris.Constraint | None,
+    executor: Executor,
+) -> iris.cube.CubeList:
+    """Load files using a pool of workers, combining them as iris.load would.
+
+    Each worker loads the unmerged cubes of a file, running the loading
+    callbacks. The cubes are kept in file order, and merged together once
+    all are loaded, so the result does not depend on the order the workers
+    finish in.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        # Constraints can contain unpicklable functions, so are applied here.
+        raw_cubes = iris.cube.CubeList(
+            itertools.chain.from_iterable(executor.map(_load_file, input_files))
+        )
+        if constraint is not None:
+            raw_cubes = raw_cubes.extract(constraint)
+    else:
+        raw_cubes = iris.cube.CubeList(
+            itertools.chain.from_iterable(
+                executor.map(_load_file, input_files, itertools.repeat(constraint))
+            )
+        )
+    return raw_cubes.merge(unique=False)
+
+
 def _load_model(
     paths: str | list[str],
     model_name: str | None,
     constraint: iris.Constraint | None,
+    executor: Executor | None = None,
 ) -> iris.cube.CubeList:
-    """Load a single model's data into a CubeList."""
+    """Load a single model's data into a CubeList.
+
+    If an executor is given, the files are loaded concurrently with it.
+    """
     input_files = _check_input_files(paths)
     # If unset, a constraint of None lets everything be loaded.
     logger.debug("Constraint: %s", constraint)
-    cubes = iris.load(input_files, constraint, callback=_loading_callback)
+    # Skip files the field catalogue shows cannot match the constraint.
+    input_files = prune_files(input_files, constraint)
+    if not input_files:
+        cubes = iris.cube.CubeList()
+    elif executor is not None:
+        cubes = _load_files_concurrently(input_files, constraint, executor)
+    else:
+        cubes = iris.load(input_files, constraint, callback=_loading_callback)
     # If required, compute wind_speed from components.
     cubes = _compute_winds(cubes)
 
@@ -289,7 +383,11 @@ def _check_input_files(input_paths: str | list[str]) -> list[Path]:
                 # Get the list of files in the directory, or use it directly.
                 if input_path.is_dir():
                     logger.debug("Checking directory '%s' for files", input_path)
-                    files.extend(p for p in input_path.iterdir() if p.is_file())
+                    files.extend(
+                        p
+                        for p in input_path.iterdir()
+                        if p.is_file() and not p.name.startswith(CATALOGUE_FILENAME)
+                    )
                 else:
                     files.append(input_path)
 
@@ -403,10 +501,18 @@ def _cutout_cubes(
 
 
 def _loading_callback(cube: iris.cube.Cube, field, filename: str) -> iris.cube.Cube:
-    """Compose together the needed callbacks into a single function."""
+    """Compose together the needed callbacks into a single function.
+
+    Callbacks that only modify fields with particular STASH codes, names or cell
+    methods are skipped when the field's metadata plan shows they can't apply.
+    The plan is memoised on the field's metadata, so the decisions are only made
+    once for all the fields of each variable.
+    """
+    plan = _metadata_plan(*_field_signature(cube))
     # Most callbacks operate in-place, but save the cube when returned!
     _realization_callback(cube)
-    _um_normalise_callback(cube)
+    if plan.um_normalise:
+        _um_normalise_callback(cube)
     _lfric_normalise_callback(cube)
     _nimrod_normalise_callback(cube)
     cube = _lfric_time_coord_fix_callback(cube)
@@ -414,11 +520,15 @@ def _loading_callback(cube: iris.cube.Cube, field, filename: str) -> iris.cube.C
     cube = _fix_no_spatial_coords_callback(cube)
     _fix_spatial_coords_callback(cube)
     _fix_pressure_coord_callback(cube)
-    _fix_um_radtime(cube)
-    _fix_cell_methods(cube)
-    cube = _convert_cube_units_callback(cube)
+    if plan.fix_um_radtime:
+        _fix_um_radtime(cube)
+    if plan.fix_cell_methods:
+        _fix_cell_methods(cube)
+    if plan.convert_units:
+        cube = _convert_cube_units_callback(cube)
     cube = _grid_longitude_fix_callback(cube)
-    _fix_lfric_cloud_base_altitude(cube)
+    if plan.fix_cloud_base_altitude:
+        _fix_lfric_cloud_base_altitude(cube)
     _proleptic_gregorian_fix(cube)
     _lfric_time_callback(cube)
     _lfric_forecast_period_callback(cube)
@@ -427,6 +537,81 @@ def _loading_callback(cube: iris.cube.Cube, field, filename: str) -> iris.cube.C
     return cube
 
 
+# Radiation diagnostics which may be output at times offset from the hour.
+_RADIATION_STASH = frozenset(
+    [
+        "m01s01i207",
+        "m01s01i208",
+        "m01s01i235",
+        "m01s02i201",
+        "m01s02i205",
+        "m01s02i207",
+    ]
+)
+
+# Accumulations which the UM describes with a "mean" cell method.
+_ACCUMULATION_STASH = frozenset(
+    [
+        "m01s04i201",
+        "m01s04i202",
+        "m01s05i201",
+        "m01s05i202",
+        "m01s21i104",
+    ]
+)
+
+
+class _MetadataPlan(NamedTuple):
+    """Which of the metadata dependent loading callbacks may modify a field."""
+
+    um_normalise: bool
+    fix_um_radtime: bool
+    fix_cell_methods: bool
+    convert_units: bool
+    fix_cloud_base_altitude: bool
+
+
+def _field_signature(cube: iris.cube.Cube) -> tuple:
+    """Metadata of a loaded field that determines its metadata plan."""
+    stash = cube.attributes.get("STASH")
+    return (
+        str(stash) if stash is not None else None,
+        cube.standard_name,
+        cube.long_name,
+        cube.var_name,
+        tuple(cm.method for cm in cube.cell_methods),
+    )
+
+
+@functools.lru_cache(None)
+def _metadata_plan(
+    stash: str | None,
+    standard_name: str | None,
+    long_name: str | None,
+    var_name: str | None,
+    cell_methods: tuple[str, ...],
+) -> _MetadataPlan:
+    """Decide which metadata dependent callbacks may modify a field.
+
+    The names are those the callbacks will see, after the earlier callbacks
+    have renamed the field from its STASH code and normalised its var_name.
+    """
+    if stash in STASH_TO_LFRIC:
+        long_name = STASH_TO_LFRIC[stash][0]
+    if var_name and var_name.endswith("_0"):
+        var_name = var_name.removesuffix("_0")
+    names = [name for name in (long_name, standard_name, var_name) if name]
+    return _MetadataPlan(
+        um_normalise=stash is not None,
+        fix_um_radtime=stash in _RADIATION_STASH,
+        fix_cell_methods=stash in _ACCUMULATION_STASH and set(cell_methods) == {"mean"},
+        convert_units=any(
+            "surface_microphysical" in name or "visibility" in name for name in names
+        ),
+        fix_cloud_base_altitude=any("cloud_base_altitude" in name for name in names),
+    )
+
+
 def _realization_callback(cube):
     """Add a realization coordinate initialised to 0 if missing.
 
@@ -488,8 +673,13 @@ def _lfric_normalise_callback(cube: iris.cube.Cube):
     # Sort STASH code list.
     stash_list = cube.attributes.get("um_stash_source")
     if stash_list:
-        # Parse the string as a list, sort, then re-encode as a string.
-        cube.attributes["um_stash_source"] = str(sorted(ast.literal_eval(stash_list)))
+        cube.attributes["um_stash_source"] = _sorted_stash_list(stash_list)
+
+
+@functools.lru_cache(None)
+def _sorted_stash_list(stash_list: str) -> str:
+    """Parse a string encoded list of STASH codes, sort, then re-encode it."""
+    return str(sorted(ast.literal_eval(stash_list)))
 
 
 def _nimrod_normalise_callback(cube: iris.cube.Cube):
@@ -760,15 +950,7 @@ def _fix_um_radtime(cube: iris.cube.Cube):
     with models which may output radiation data on the hour.
     """
     try:
-        if cube.attributes["STASH"] in [
-            "m01s01i207",
-            "m01s01i208",
-            "m01s02i205",
-            "m01s02i201",
-            "m01s01i207",
-            "m01s02i207",
-            "m01s01i235",
-        ]:
+        if str(cube.attributes["STASH"]) in _RADIATION_STASH:
             time_coord = cube.coord("time")
 
             # Convert time points to datetime objects
@@ -825,13 +1007,9 @@ def _fix_cell_methods(cube: iris.cube.Cube):
     enabling the cell_method constraint on reading to select correct input.
     """
     # Shift "mean" cell_method to "sum" for selected UM inputs.
-    if cube.attributes.get("STASH") in [
-        "m01s21i104",
-        "m01s04i201",
-        "m01s04i202",
-        "m01s05i201",
-        "m01s05i202",
-    ] and {cm.method for cm in cube.cell_methods} == {"mean"}:
+    stash = str(cube.attributes.get("STASH"))
+    methods = {cm.method for cm in cube.cell_methods}
+    if stash in _ACCUMULATION_STASH and methods == {"mean"}:
         # Retrieve interval and any comment information.
         for cell_method in cube.cell_methods:
             interval_str = cell_method.intervals
@@ -15,20 +15,22 @@
 """A module containing wrappers for the scores module."""
 
 import logging
+import math
 import operator
 
+import dask
+import dask.array as da
 import iris
 import iris.exceptions
 import numpy as np
 import scores
 import scores.categorical
 import scores.continuous
-import scores.probability
 import xarray as xr
 from iris.cube import Cube, CubeList
 from iris.util import reverse
 
-from CSET._common import is_increasing
+from CSET._common import is_increasing, iter_maybe
 from CSET.operators._utils import fully_equalise_attributes, get_cube_yxcoordname
 from CSET.operators.constraints import (
     generate_realization_constraint,
@@ -478,33 +480,7 @@ def scores_rmse(
             )
         )
 
-        # If time is aggregated out, attach a scalar time coordinate with bounds
-        # so plotting can display the aggregated period in the title.
-        try:
-            if not scores_cube.coords("time"):
-                base_time = base.coord("time")
-                time_vals = (
-                    base_time.bounds.flatten()
-                    if base_time.has_bounds()
-                    else base_time.points
-                )
-                t_start = float(time_vals[0])
-                t_end = float(time_vals[-1])
-                t_mid = 0.5 * (t_start + t_end)
-
-                scores_cube.add_aux_coord(
-                    iris.coords.AuxCoord(
-                        t_mid,
-                        standard_name=base_time.standard_name,
-                        long_name=base_time.long_name,
-                        var_name=base_time.var_name,
-                        units=base_time.units,
-                        bounds=np.array([t_start, t_end]),
-                        attributes=base_time.attributes.copy(),
-                    )
-                )
-        except iris.exceptions.CoordinateNotFoundError:
-            pass
+        _add_aggregated_time_coord(scores_cube, base)
 
         scores_cube.rename(f"RMSE_of_{base.name()}")
         scores_cubelist.append(scores_cube)
@@ -569,33 +545,7 @@ def scores_mae(
             )
         )
 
-        # If time is aggregated out, attach a scalar time coordinate with bounds
-        # so plotting can display the aggregated period in the title.
-        try:
-            if not scores_cube.coords("time"):
-                base_time = base.coord("time")
-                time_vals = (
-                    base_time.bounds.flatten()
-                    if base_time.has_bounds()
-                    else base_time.points
-                )
-                t_start = float(time_vals[0])
-                t_end = float(time_vals[-1])
-                t_mid = 0.5 * (t_start + t_end)
-
-                scores_cube.add_aux_coord(
-                    iris.coords.AuxCoord(
-                        t_mid,
-                        standard_name=base_time.standard_name,
-                        long_name=base_time.long_name,
-                        var_name=base_time.var_name,
-                        units=base_time.units,
-                        bounds=np.array([t_start, t_end]),
-                        attributes=base_time.attributes.copy(),
-                    )
-                )
-        except iris.exceptions.CoordinateNotFoundError:
-            pass
+        _add_aggregated_time_coord(scores_cube, base)
 
         scores_cube.rename(f"MAE_of_{base.name()}")
         scores_cubelist.append(scores_cube)
@@ -659,33 +609,7 @@ def scores_additive_bias(
             )
         )
 
-        # If time is aggregated out, attach a scalar time coordinate with bounds
-        # so plotting can display the aggregated period in the title.
-        try:
-            if not scores_cube.coords("time"):
-                base_time = base.coord("time")
-                time_vals = (
-                    base_time.bounds.flatten()
-                    if base_time.has_bounds()
-                    else base_time.points
-                )
-                t_start = float(time_vals[0])
-                t_end = float(time_vals[-1])
-                t_mid = 0.5 * (t_start + t_end)
-
-                scores_cube.add_aux_coord(
-                    iris.coords.AuxCoord(
-                        t_mid,
-                        standard_name=base_time.standard_name,
-                        long_name=base_time.long_name,
-                        var_name=base_time.var_name,
-                        units=base_time.units,
-                        bounds=np.array([t_start, t_end]),
-                        attributes=base_time.attributes.copy(),
-                    )
-                )
-        except iris.exceptions.CoordinateNotFoundError:
-            pass
+        _add_aggregated_time_coord(scores_cube, base)
         scores_cube.rename(f"Additive_Bias_of_{base.name()}")
         scores_cubelist.append(scores_cube)
         model_name = other.attributes["model_name"]
@@ -748,33 +672,7 @@ def scores_correlation_pearsonr(
             )
         )
 
-        # If time is aggregated out, attach a scalar time coordinate with bounds
-        # so plotting can display the aggregated period in the title.
-        try:
-            if not scores_cube.coords("time"):
-                base_time = base.coord("time")
-                time_vals = (
-                    base_time.bounds.flatten()
-                    if base_time.has_bounds()
-                    else base_time.points
-                )
-                t_start = float(time_vals[0])
-                t_end = float(time_vals[-1])
-                t_mid = 0.5 * (t_start + t_end)
-
-                scores_cube.add_aux_coord(
-                    iris.coords.AuxCoord(
-                        t_mid,
-                        standard_name=base_time.standard_name,
-                        long_name=base_time.long_name,
-                        var_name=base_time.var_name,
-                        units=base_time.units,
-                        bounds=np.array([t_start, t_end]),
-                        attributes=base_time.attributes.copy(),
-                    )
-                )
-        except iris.exceptions.CoordinateNotFoundError:
-            pass
+        _add_aggregated_time_coord(scores_cube, base)
 
         scores_cube.rename(f"Pearson_Correlation_of_{base.name()}")
         scores_cubelist.append(scores_cube)
@@ -783,6 +681,205 @@ def scores_correlation_pearsonr(
     return scores_cubelist[0] if len(scores_cubelist) == 1 else scores_cubelist
 
 
+def _add_aggregated_time_coord(scores_cube: Cube, base: Cube):
+    """Attach a scalar time coordinate with bounds if time is aggregated out.
+
+    This allows plotting to display the aggregated period in the title.
+    """
+    try:
+        if not scores_cube.coords("time"):
+            base_time = base.coord("time")
+            time_vals = (
+                base_time.bounds.flatten()
+                if base_time.has_bounds()
+                else base_time.points
+            )
+            t_start = float(time_vals[0])
+            t_end = float(time_vals[-1])
+            t_mid = 0.5 * (t_start + t_end)
+
+            scores_cube.add_aux_coord(
+                iris.coords.AuxCoord(
+                    t_mid,
+                    standard_name=base_time.standard_name,
+                    long_name=base_time.long_name,
+                    var_name=base_time.var_name,
+                    units=base_time.units,
+                    bounds=np.array([t_start, t_end]),
+                    attributes=base_time.attributes.copy(),
+                )
+            )
+    except iris.exceptions.CoordinateNotFoundError:
+        pass
+
+
+def _sufficient_statistics(
+    fcst: xr.DataArray, obs: xr.DataArray, reduce_dims: list[str]
+) -> dict[str, xr.DataArray]:
+    """Accumulate the sums needed for the continuous scores in one pass.
+
+    Points where either the forecast or observation is missing are excluded,
+    as they are by ``scores``. Sums are accumulated in double precision.
+    """
+    fcst = fcst.astype(np.float64)
+    obs = obs.astype(np.float64)
+    error = fcst - obs
+    valid = error.notnull()
+    fcst = fcst.where(valid)
+    obs = obs.where(valid)
+    stats = {
+        "n": valid.astype(np.int64).sum(reduce_dims),
+        "sum_f": fcst.sum(reduce_dims),
+        "sum_o": obs.sum(reduce_dims),
+        "sum_ff": (fcst * fcst).sum(reduce_dims),
+        "sum_oo": (obs * obs).sum(reduce_dims),
+        "sum_fo": (fcst * obs).sum(reduce_dims),
+        "sum_sq_err": (error * error).sum(reduce_dims),
+        "sum_abs_err": abs(error).sum(reduce_dims),
+    }
+    # Computing together reads each chunk of the data only once.
+    return dict(zip(stats, dask.compute(*stats.values()), strict=True))
+
+
+def _metric_from_statistics(metric: str, stats: dict) -> xr.DataArray:
+    """Calculate a continuous score from its sufficient statistics."""
+    n = stats["n"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        match metric:
+            case "rmse":
+                return np.sqrt(stats["sum_sq_err"] / n)
+            case "mae":
+                return stats["sum_abs_err"] / n
+            case "additive_bias":
+                return (stats["sum_f"] - stats["sum_o"]) / n
+            case "pearsonr":
+                cov = n * stats["sum_fo"] - stats["sum_f"] * stats["sum_o"]
+                var_f = n * stats["sum_ff"] - stats["sum_f"] ** 2
+                var_o = n * stats["sum_oo"] - stats["sum_o"] ** 2
+                return cov / np.sqrt(var_f * var_o)
+
+
+# Name prefixes matching the individual score operators.
+_SUMMARY_METRIC_NAMES = {
+    "rmse": "RMSE",
+    "mae": "MAE",
+    "additive_bias": "Additive_Bias",
+    "pearsonr": "Pearson_Correlation",
+}
+
+
+def scores_summary(
+    cubes: CubeList,
+    metrics: list[str] | str = ("rmse", "mae", "additive_bias", "pearsonr"),
+    preserved_coordinates: list[str] | str | None = None,
+    obs_model_comparison: bool = False,
+) -> CubeList:
+    r"""Calculate several continuous scores from a single pass over the data.
+
+    The base and other cubes are aligned once, then the sums of the forecast,
+    observation, their squares and product, and the squared and absolute
+    errors, along with the count of valid points, are accumulated chunk by
+    chunk in a single pass. All requested scores are derived from these sums,
+    giving the same results as the individual ``scores_rmse``, ``scores_mae``,
+    ``scores_additive_bias`` and ``scores_correlation_pearsonr`` operators
+    (and their ``_model_obs`` variants) without reading and aligning the data
+    once per score.
+
+    Parameters
+    ----------
+    cubes: iris.cube.CubeList
+        A CubeList containing a base and at least one "other" model, or an
+        observation cube and at least one model cube if obs_model_comparison.
+    metrics: list[str] | str, optional
+        Scores to calculate, from "rmse", "mae", "additive_bias" and
+        "pearsonr". Defaults to all of them.
+    preserved_coordinates: list[str] | str | None, default is None.
+        The coordinates that you wish to preserve in the calculation of the
+        scores. For example if you want a map of each time you can preserve
+        ["time","grid_latitude", "grid_longitude"] or if you want a time series
+        you can preserve ["time"], if you want to collapse to a single value
+        use `None`. The default is `None`.
+    obs_model_comparison: bool, default False
+        Set true if doing model-obs comparison, in which case the cube with
+        "observed" in its name is the base.
+
+    Returns
+    -------
+    scores_cubelist: iris.cube.CubeList
+        A cubelist containing each requested score for each other model, named
+        and with metadata as from the individual score operators.
+
+    Raises
+    ------
+    ValueError
+        If an unknown score is requested, or all dimensions are preserved when
+        calculating the Pearson correlation.
+    """
+    metrics = [metrics] if isinstance(metrics, str) else list(metrics)
+    for metric in metrics:
+        if metric not in _SUMMARY_METRIC_NAMES:
+            raise ValueError(f"Unknown score: {metric}")
+
+    if obs_model_comparison:
+        base = next(cb for cb in cubes if "observed" in cb.long_name)
+        others = [cb for cb in cubes if "observed" not in cb.long_name]
+    else:
+        base, others = _sort_cube_into_base_and_other(cubes)
+
+    scores_cubelist = CubeList()
+    for other in others:
+        base, other = _process_cubes_for_verification(base, other)
+
+        other_xr = xr.DataArray.from_iris(other)
+        base_xr = xr.DataArray.from_iris(base)
+        preserve_dims = _resolve_preserve_dims(other, other_xr, preserved_coordinates)
+        reduce_dims = [dim for dim in other_xr.dims if dim not in (preserve_dims or [])]
+        if "pearsonr" in metrics and not reduce_dims:
+            raise ValueError("You cannot preserve all dimensions with pearsonr.")
+
+        stats = _sufficient_statistics(other_xr, base_xr, reduce_dims)
+        for metric in metrics:
+            scores_cube = xr.DataArray.to_iris(_metric_from_statistics(metric, stats))
+            _add_aggregated_time_coord(scores_cube, base)
+            scores_cube.rename(f"{_SUMMARY_METRIC_NAMES[metric]}_of_{base.name()}")
+            scores_cube.attributes["model_name"] = other.attributes["model_name"]
+            scores_cubelist.append(scores_cube)
+
+    return scores_cubelist
+
+
+def _crps_for_ensemble_points(
+    ensemble: np.ndarray, observation: np.ndarray, method: str
+) -> np.ndarray:
+    r"""Calculate the CRPS of an ensemble at each point.
+
+    Uses the sorted member form of the ensemble spread term,
+
+    .. math:: \sum_i \sum_j |x_i - x_j| = 2 \sum_k (2k - m - 1) x_{(k)}
+
+    for members sorted into order :math:`x_{(1)} \le \dots \le x_{(m)}`,
+    which is O(m log m) rather than O(m^2) in the number of members m.
+
+    Parameters
+    ----------
+    ensemble: np.ndarray
+        Ensemble member values, with members along the last axis.
+    observation: np.ndarray
+        Values to compare the ensemble against.
+    method: str
+        Either "ecdf" or "fair", as in ``scores.probability.crps_for_ensemble``.
+    """
+    members = ensemble.shape[-1]
+    observation_term = np.abs(ensemble - observation[..., np.newaxis]).mean(axis=-1)
+    rank_weights = 2 * np.arange(1, members + 1) - members - 1
+    pair_sum = 2 * (np.sort(ensemble, axis=-1) * rank_weights).sum(axis=-1)
+    if method == "ecdf":
+        spread_term = pair_sum / (2 * members**2)
+    else:
+        spread_term = pair_sum / (2 * members * (members - 1))
+    return observation_term - spread_term
+
+
 def scores_crps_for_ensemble(
     cubes: Cube | CubeList, method: str = "ecdf", control_member: int = 0
 ) -> iris.Constraint:
@@ -796,6 +893,11 @@ def scores_crps_for_ensemble(
     Default method is ecdf.  ecdf is exact value from the empirical distributions,
     whereas fair produces an approximated value based on a random sample of the underlying distribution.
 
+    The CRPS is calculated lazily, a block of points at a time, with the
+    members of each point sorted to give the spread term in O(m log m) time. Peak
+    memory use is therefore bounded by the data chunk size rather than the size
+    of the field.
+
     See [CRPS]_ for further information.
 
     Parameters
@@ -829,22 +931,25 @@ def scores_crps_for_ensemble(
         generate_remove_single_ensemble_member_constraint(control_member)
     )
 
-    # Realising the data in advance provides a large speedup
-    _ = ctrl.data
-    _ = ens_mem.data
-    del _
-
-    ctrl = xr.DataArray.from_iris(ctrl)
-    ens_mem = xr.DataArray.from_iris(ens_mem)
-
+    if method not in ("ecdf", "fair"):
+        raise ValueError(f"Unknown CRPS method: {method}")
+
+    # Each block needs every member of its points, but can be any subset of
+    # the points, so the data is never realised all at once.
+    ens_mem = xr.DataArray.from_iris(ens_mem).chunk({"realization": -1})
+    ctrl = xr.DataArray.from_iris(ctrl).drop_vars("realization", errors="ignore")
+    crps_points = xr.apply_ufunc(
+        _crps_for_ensemble_points,
+        ens_mem,
+        ctrl,
+        input_core_dims=[["realization"], []],
+        kwargs={"method": method},
+        dask="parallelized",
+        output_dtypes=[np.float64],
+    )
+    # Average over everything but time, as scores does with preserve_dims.
     crps = xr.DataArray.to_iris(
-        scores.probability.crps_for_ensemble(
-            ens_mem,
-            ctrl,
-            ensemble_member_dim="realization",
-            method=method,
-            preserve_dims="time",
-        )
+        crps_points.mean([dim for dim in crps_points.dims if dim != "time"]).compute()
     )
 
     crps.rename(f"CRPS_of_{cubes[0].name()}")
@@ -1063,3 +1168,249 @@ def scores_ets_model_obs(
         scores_results.append(scores_cube)
 
     return scores_results
+
+
+def _contingency_tables(
+    fcst: xr.DataArray,
+    obs: xr.DataArray,
+    thresholds: np.ndarray,
+    op_func: str,
+    preserve_dims: list[str],
+) -> dict[str, np.ndarray]:
+    """Count the contingency tables of every threshold in a single pass.
+
+    Each forecast and observation value is classified by how many of the sorted
+    thresholds it exceeds, and the joint counts of these classes are taken with
+    a single bincount. The tables for every threshold then follow from
+    cumulative sums of the joint counts. Pairs with a missing value are
+    excluded.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The hits, misses, false alarms and correct negatives, each with the
+        threshold as the first dimension followed by the preserved dimensions.
+    """
+    fcst, obs = xr.align(fcst, obs, join="inner")
+    reduce_dims = [dim for dim in fcst.dims if dim not in preserve_dims]
+    fcst = da.asarray(fcst.transpose(*preserve_dims, *reduce_dims).data)
+    obs = da.asarray(obs.transpose(*preserve_dims, *reduce_dims).data)
+    preserved_shape = fcst.shape[: len(preserve_dims)]
+    n_preserved = math.prod(preserved_shape)
+    n_classes = len(thresholds) + 1
+
+    # For "gt" a class is the number of thresholds below the value, so events
+    # are classes above the threshold's index. For "lt" it is the number of
+    # thresholds at or below the value, so events are classes at or below it.
+    right = op_func == "gt"
+    fcst_class = da.digitize(fcst, thresholds, right=right)
+    obs_class = da.digitize(obs, thresholds, right=right)
+    preserved_index = np.arange(n_preserved).reshape(
+        preserved_shape + (1,) * len(reduce_dims)
+    )
+    index = (preserved_index * n_classes + fcst_class) * n_classes + obs_class
+    valid = ~(da.isnan(fcst) | da.isnan(obs))
+    counts = da.bincount(
+        index.ravel(),
+        weights=valid.ravel(),
+        minlength=n_preserved * n_classes**2,
+    )
+    counts = counts.compute().reshape(n_preserved, n_classes, n_classes)
+
+    if op_func == "gt":
+        # Counts of forecast and observed classes at or above each class.
+        above = counts[:, ::-1, ::-1].cumsum(axis=1).cumsum(axis=2)[:, ::-1, ::-1]
+        k = np.arange(1, n_classes)
+        hits = above[:, k, k]
+        forecast_events = above[:, k, 0]
+        observed_events = above[:, 0, k]
+        total = above[:, :1, 0]
+    else:
+        # Counts of forecast and observed classes at or below each class.
+        below = counts.cumsum(axis=1).cumsum(axis=2)
+        k = np.arange(n_classes - 1)
+        hits = below[:, k, k]
+        forecast_events = below[:, k, -1]
+        observed_events = below[:, -1, k]
+        total = below[:, -1:, -1]
+
+    misses = observed_events - hits
+    false_alarms = forecast_events - hits
+    tables = {
+        "hits": hits,
+        "misses": misses,
+        "false_alarms": false_alarms,
+        "correct_negatives": total - hits - misses - false_alarms,
+    }
+    # Move thresholds to the first dimension, and unflatten preserved dims.
+    return {
+        name: table.T.reshape((len(thresholds), *preserved_shape))
+        for name, table in tables.items()
+    }
+
+
+def _categorical_score(score: str, tables: dict[str, np.ndarray]) -> np.ndarray:
+    """Calculate a categorical score from contingency tables."""
+    hits = tables["hits"]
+    misses = tables["misses"]
+    false_alarms = tables["false_alarms"]
+    total = hits + misses + false_alarms + tables["correct_negatives"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        match score:
+            case "pod":
+                return hits / (hits + misses)
+            case "far":
+                return false_alarms / (hits + false_alarms)
+            case "csi":
+                return hits / (hits + misses + false_alarms)
+            case "ets":
+                hits_random = (hits + misses) * (hits + false_alarms) / total
+                return (hits - hits_random) / (
+                    hits + misses + false_alarms - hits_random
+                )
+            case "frequency_bias":
+                return (hits + false_alarms) / (hits + misses)
+
+
+# Names of the categorical scores, matching the single threshold operators.
+_CATEGORICAL_SCORE_NAMES = {
+    "pod": "Probability_Of_Detection",
+    "far": "False_Alarm_Ratio",
+    "csi": "Critical_Success_Index",
+    "ets": "Equitable_Threat_Score",
+    "frequency_bias": "Frequency_Bias",
+}
+
+
+def scores_contingency_model_obs(
+    cubes: CubeList,
+    preserved_coordinates: list[str] | str | None,
+    thresholds: list[str | float] | str | float,
+    op_func: str,
+    categorical_scores: list[str] | str = (
+        "pod",
+        "far",
+        "csi",
+        "ets",
+        "frequency_bias",
+    ),
+) -> CubeList:
+    r"""
+    Compute categorical scores for several thresholds at once.
+
+    The contingency tables for all thresholds are counted in a single
+    vectorised pass over the paired data, rather than building event tables
+    once per threshold as :func:`scores_pod_model_obs` and
+    :func:`scores_ets_model_obs` do.
+
+    Parameters
+    ----------
+    cubes: iris.cube.CubeList
+        An iris cubelist containing model(s) and an observation cube.
+    preserved_coordinates: list | str | None
+        An object containing which coordinates to preserve in the computation.
+        For example, if cubes contain shape time, point location, then
+        preserving coordinate 'time' will produce a score for each timeslice
+        (shape time). If None, then it will return a single value score per
+        threshold for all times/point locations.
+    thresholds: list[str | float] | str | float
+        Thresholds used to define events. Strings are converted to floats, as
+        values are passed as strings around the recipe templating.
+    op_func: str
+        Either 'lt' for less than or 'gt' for greater than, to determine how the
+        thresholds are applied to the data to define events.
+    categorical_scores: list[str] | str, optional
+        Scores to compute, from "pod" (probability of detection), "far" (false
+        alarm ratio), "csi" (critical success index), "ets" (equitable threat
+        score) and "frequency_bias". Defaults to all of them.
+
+    Returns
+    -------
+    iris.cube.CubeList
+        A cube per score and model, with a threshold dimension followed by any
+        preserved dimensions.
+
+    Raises
+    ------
+    ValueError
+        If the operator or a score is not supported.
+
+    Notes
+    -----
+    With hits, misses, false alarms and the total count of each contingency
+    table the scores are calculated as:
+
+    .. math::
+
+        POD = \frac{hits}{hits + misses}
+
+        FAR = \frac{false\ alarms}{hits + false\ alarms}
+
+        CSI = \frac{hits}{hits + misses + false\ alarms}
+
+        ETS = \frac{hits - hits_{random}}{hits + misses + false\ alarms - hits_{random}},
+        \quad hits_{random} = \frac{(hits + misses)(hits + false\ alarms)}{total}
+
+        Frequency\ Bias = \frac{hits + false\ alarms}{hits + misses}
+
+    Scores whose denominator is zero, such as POD when no events were observed,
+    are NaN.
+    """
+    if op_func not in ("gt", "lt"):
+        raise ValueError(f"Operator {op_func} not supported.")
+    categorical_scores = (
+        [categorical_scores]
+        if isinstance(categorical_scores, str)
+        else list(categorical_scores)
+    )
+    for score in categorical_scores:
+        if score not in _CATEGORICAL_SCORE_NAMES:
+            raise ValueError(f"Score {score} not supported.")
+    thresholds = np.unique([float(threshold) for threshold in iter_maybe(thresholds)])
+
+    # Split out model(s) and obs
+    models = CubeList()
+    for c in cubes:
+        if "observed" in c.long_name:
+            observed = c
+        else:
+            models.append(c)
+
+    scores_results = CubeList()
+    for model in models:
+        other_xr = xr.DataArray.from_iris(model)
+        base_xr = xr.DataArray.from_iris(observed)
+        preserve_dims = (
+            _resolve_preserve_dims(observed, other_xr, preserved_coordinates) or []
+        )
+        tables = _contingency_tables(
+            other_xr, base_xr, thresholds, op_func, preserve_dims
+        )
+
+        # Keep the coordinates which only vary along the preserved dimensions.
+        coords = {
+            name: coord
+            for name, coord in base_xr.coords.items()
+            if set(coord.dims) <= set(preserve_dims)
+        }
+        coords["threshold"] = xr.DataArray(
+            thresholds,
+            dims="threshold",
+            attrs={"long_name": "threshold", "units": str(observed.units)},
+        )
+        for score in categorical_scores:
+            scores_cube = xr.DataArray.to_iris(
+                xr.DataArray(
+                    _categorical_score(score, tables),
+                    dims=["threshold", *preserve_dims],
+                    coords=coords,
+                )
+            )
+            scores_cube.rename(
+                f"{_CATEGORICAL_SCORE_NAMES[score]}_{op_func}_{observed.name()}"
+            )
+            scores_cube.units = "1"
+            scores_cube.attributes["model_name"] = model.attributes["model_name"]
+            scores_results.append(scores_cube)
+
+    return scores_results
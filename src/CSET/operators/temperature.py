@@ -14,20 +14,46 @@
 
 """Operators for temperature conversions."""
 
+import dask.array as da
 import iris.cube
 import numpy as np
 
 from CSET._common import iter_maybe
 from CSET.operators._atmospheric_constants import CPD, EPSILON, LV, RV, T0
-from CSET.operators.humidity import (
-    mixing_ratio_from_relative_humidity,
-    saturation_mixing_ratio,
-)
-from CSET.operators.misc import convert_units
-from CSET.operators.pressure import (
-    exner_pressure,
-    vapour_pressure_from_relative_humidity,
-)
+from CSET.operators._memoise import memoise
+from CSET.operators._utils import lazy_data_in_units
+from CSET.operators.humidity import _saturation_mixing_ratio_data
+from CSET.operators.pressure import _exner_pressure_data, _vapour_pressure_data
+
+
+def _nan_where(condition: da.Array, data: da.Array) -> da.Array:
+    """Lazily set data to NaN where a condition holds, keeping any mask."""
+    if isinstance(da.utils.meta_from_array(data), np.ma.MaskedArray):
+        # Unlike numpy.where, numpy.ma.where doesn't drop the mask.
+        return da.map_blocks(np.ma.where, condition, np.nan, data, dtype=data.dtype)
+    return da.where(condition, np.nan, data)
+
+
+def _virtual_temperature_data(
+    temperature: iris.cube.Cube, mixing_ratio: iris.cube.Cube
+) -> da.Array:
+    """Lazy virtual temperature, as calculated by virtual_temperature."""
+    W = mixing_ratio.lazy_data()
+    return temperature.lazy_data() * ((W + EPSILON) / (EPSILON * (1 + W)))
+
+
+@memoise
+def _equivalent_potential_temperature_data(
+    temperature: iris.cube.Cube,
+    relative_humidity: iris.cube.Cube,
+    pressure: iris.cube.Cube,
+) -> da.Array:
+    """Lazy equivalent potential temperature, as in equivalent_potential_temperature."""
+    T = lazy_data_in_units(temperature, "K")
+    RH = lazy_data_in_units(relative_humidity, "1")
+    w = _saturation_mixing_ratio_data(temperature, pressure) * RH
+    theta = T / _exner_pressure_data(pressure)
+    return theta * RH ** (-(w * RV) / CPD) * np.exp(LV * w / (CPD * T))
 
 
 def dewpoint_temperature(
@@ -76,16 +102,14 @@ def dewpoint_temperature(
     for T, RH in zip(
         iter_maybe(temperature), iter_maybe(relative_humidity), strict=True
     ):
-        vp = vapour_pressure_from_relative_humidity(T, RH)
-        td = vp.copy()
-        td.data = ((243.5 * np.log(vp.core_data())) - 440.8) / (
-            19.48 - np.log(vp.core_data())
+        ln_vp = np.log(_vapour_pressure_data(T) * lazy_data_in_units(RH, "1"))
+        td_celsius = (243.5 * ln_vp - 440.8) / (19.48 - ln_vp)
+        T_celsius = lazy_data_in_units(T, "Celsius")
+        td = T.copy(
+            data=_nan_where((T_celsius < -35.0) | (T_celsius > 35.0), td_celsius + T0)
         )
-        td.data[T.data - T0 < -35.0] = np.nan
-        td.data[T.data - T0 > 35.0] = np.nan
-        td.units = "Celsius"
+        td.units = "K"
         td.rename("dewpoint_temperature")
-        td = convert_units(td, "K")
         Td.append(td)
     if len(Td) == 1:
         return Td[0]
@@ -132,7 +156,7 @@ def virtual_temperature(
     """
     Tv = iris.cube.CubeList([])
     for T, W in zip(iter_maybe(temperature), iter_maybe(mixing_ratio), strict=True):
-        virT = T * ((W + EPSILON) / (EPSILON * (1 + W)))
+        virT = T.copy(data=_virtual_temperature_data(T, W))
         virT.rename("virtual_temperature")
         Tv.append(virT)
     if len(Tv) == 1:
@@ -186,23 +210,19 @@ def wet_bulb_temperature(
     for T, RH in zip(
         iter_maybe(temperature), iter_maybe(relative_humidity), strict=True
     ):
-        RH = convert_units(RH, "%")
-        T = convert_units(T, "Celsius")
-        wetT = (
-            T * np.arctan(0.151977 * (RH.core_data() + 8.313659) ** 0.5)
-            + np.arctan(T.core_data() + RH.core_data())
-            - np.arctan(RH.core_data() - 1.676331)
-            + 0.00391838
-            * (RH.core_data()) ** (3.0 / 2.0)
-            * np.arctan(0.023101 * RH.core_data())
+        rh = lazy_data_in_units(RH, "%")
+        t = lazy_data_in_units(T, "Celsius")
+        tw_celsius = (
+            t * np.arctan(0.151977 * (rh + 8.313659) ** 0.5)
+            + np.arctan(t + rh)
+            - np.arctan(rh - 1.676331)
+            + 0.00391838 * rh ** (3.0 / 2.0) * np.arctan(0.023101 * rh)
             - 4.686035
         )
+        out_of_range = (t < -20.0) | (t > 50.0) | (rh < 5.0) | (rh > 99.0)
+        wetT = T.copy(data=_nan_where(out_of_range, tw_celsius + T0))
+        wetT.units = "K"
         wetT.rename("wet_bulb_temperature")
-        wetT = convert_units(wetT, "K")
-        wetT.data[T.core_data() < -20.0] = np.nan
-        wetT.data[T.core_data() > 50.0] = np.nan
-        wetT.data[RH.core_data() < 5.0] = np.nan
-        wetT.data[RH.core_data() > 99.0] = np.nan
         Tw.append(wetT)
     if len(Tw) == 1:
         return Tw[0]
@@ -249,7 +269,7 @@ def potential_temperature(
     """
     theta = iris.cube.CubeList([])
     for T, P in zip(iter_maybe(temperature), iter_maybe(pressure), strict=True):
-        TH = T / exner_pressure(P)
+        TH = T.copy(data=T.lazy_data() / _exner_pressure_data(P))
         TH.rename("potential_temperature")
         theta.append(TH)
     if len(theta) == 1:
@@ -306,7 +326,7 @@ def virtual_potential_temperature(
         iter_maybe(pressure),
         strict=True,
     ):
-        TH_V = virtual_temperature(T, W) / exner_pressure(P)
+        TH_V = T.copy(data=_virtual_temperature_data(T, W) / _exner_pressure_data(P))
         TH_V.rename("virtual_potential_temperature")
         theta_v.append(TH_V)
     if len(theta_v) == 1:
@@ -376,14 +396,7 @@ def equivalent_potential_temperature(
         iter_maybe(pressure),
         strict=True,
     ):
-        RH = convert_units(RH, "1")
-        theta = potential_temperature(T, P)
-        w = mixing_ratio_from_relative_humidity(T, P, RH)
-        second_term_power = -(w * RV) / CPD
-        second_term = RH.core_data() ** second_term_power.core_data()
-        third_term_power = LV * w / (CPD * T)
-        third_term = np.exp(third_term_power.core_data())
-        TH_E = theta * second_term * third_term
+        TH_E = T.copy(data=_equivalent_potential_temperature_data(T, RH, P))
         TH_E.rename("equivalent_potential_temperature")
         TH_E.units = "K"
         theta_e.append(TH_E)
@@ -448,9 +461,8 @@ def wet_bulb_potential_temperature(
         iter_maybe(pressure),
         strict=True,
     ):
-        TH_E = equivalent_potential_temperature(T, RH, P)
-        X = TH_E / T0
-        X.units = "1"
+        th_e = _equivalent_potential_temperature_data(T, RH, P)
+        X = th_e / T0
         A0 = 7.101574
         A1 = -20.68208
         A2 = 16.11182
@@ -463,11 +475,10 @@ def wet_bulb_potential_temperature(
         exponent = (A0 + A1 * X + A2 * X**2 + A3 * X**3 + A4 * X**4) / (
             1.0 + B1 * X + B2 * X**2 + B3 * X**3 + B4 * X**4
         )
-        TH_W = TH_E.copy()
-        TH_W.data[:] = TH_E.core_data() - np.exp(exponent.core_data())
+        th_w = th_e - np.exp(exponent)
+        TH_W = T.copy(data=_nan_where((th_w - T0 < -30.0) | (th_w - T0 > 50.0), th_w))
         TH_W.rename("wet_bulb_potential_temperature")
-        TH_W.data[TH_W.data - T0 < -30.0] = np.nan
-        TH_W.data[TH_W.data - T0 > 50.0] = np.nan
+        TH_W.units = "K"
         theta_w.append(TH_W)
     if len(theta_w) == 1:
         return theta_w[0]
@@ -524,11 +535,9 @@ def saturation_equivalent_potential_temperature(
         iter_maybe(pressure),
         strict=True,
     ):
-        theta = potential_temperature(T, P)
-        ws = saturation_mixing_ratio(T, P)
-        second_term_power = LV * ws / (CPD * T)
-        second_term = np.exp(second_term_power.core_data())
-        TH_ES = theta * second_term
+        t = lazy_data_in_units(T, "K")
+        ws = _saturation_mixing_ratio_data(T, P)
+        TH_ES = T.copy(data=t / _exner_pressure_data(P) * np.exp(LV * ws / (CPD * t)))
         TH_ES.rename("saturation_equivalent_potential_temperature")
         TH_ES.units = "K"
         theta_es.append(TH_ES)
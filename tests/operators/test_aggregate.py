@@ -86,6 +86,31 @@ def test_ensure_aggregatable_across_cases_cubelist(
     )
 
 
+def test_ensure_aggregatable_across_cases_lazy(
+    long_forecast_many_cubes, long_forecast_multi_day
+):
+    """Check cases are stacked lazily, in order of forecast_reference_time."""
+    cubes = iris.cube.CubeList(
+        cube.copy(data=cube.lazy_data()) for cube in reversed(long_forecast_many_cubes)
+    )
+    cube = aggregate.ensure_aggregatable_across_cases(cubes)[0]
+    assert cube.has_lazy_data()
+    for name in ["forecast_period", "forecast_reference_time", "time"]:
+        assert np.array_equal(
+            cube.coord(name).points, long_forecast_multi_day.coord(name).points
+        )
+    assert np.allclose(cube.data, long_forecast_multi_day.data, rtol=1e-06, atol=1e-02)
+
+
+def test_ensure_aggregatable_across_cases_duplicate_cases(long_forecast_many_cubes):
+    """Check that cubes of the same case can't be aggregated."""
+    cube = long_forecast_many_cubes[0]
+    with pytest.raises(ValueError, match="duplicate"):
+        aggregate.ensure_aggregatable_across_cases(
+            iris.cube.CubeList([cube, cube.copy()])
+        )
+
+
 def test_ensure_aggregatable_across_cases_different_buckets(
     long_forecast_multi_day: iris.cube.Cube,
 ):
@@ -98,6 +123,17 @@ def test_ensure_aggregatable_across_cases_different_buckets(
     assert len(output) == 2
 
 
+def test_ensure_aggregatable_across_cases_common_attributes(
+    long_forecast_many_cubes,
+):
+    """Check only attributes common to the cubes are compared."""
+    cubes = iris.cube.CubeList(cube.copy() for cube in long_forecast_many_cubes)
+    cubes[1].attributes["extra"] = "only on one case"
+    assert len(aggregate.ensure_aggregatable_across_cases(cubes)) == 1
+    cubes[0].attributes["extra"] = "different value"
+    assert len(aggregate.ensure_aggregatable_across_cases(cubes)) == 2
+
+
 def test_ensure_aggregatable_across_cube_coord_attribute(long_forecast_multi_day):
     """Check that aggregatable cubes preserve information on Ncases."""
     print(long_forecast_multi_day)
@@ -0,0 +1,178 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the field catalogue used to prune input files."""
+
+import os
+import shutil
+
+import iris
+import pytest
+
+from CSET.operators import _catalogue, constraints, read
+
+
+@pytest.fixture()
+def data_dir(tmp_path):
+    """Directory containing two files with different variables."""
+    shutil.copy("tests/test_data/air_temp.nc", tmp_path)
+    shutil.copy("tests/test_data/u10_v10.nc", tmp_path)
+    return tmp_path
+
+
+def test_field_filter_var_constraint():
+    """Variable constraints get a field filter matching on any name."""
+    field_filter = _catalogue.get_field_filter(
+        constraints.generate_var_constraint("air_temperature")
+    )
+    assert field_filter(_catalogue.FieldSummary({"names": ["air_temperature"]}))
+    assert not field_filter(_catalogue.FieldSummary({"names": ["eastward_wind"]}))
+
+
+def test_field_filter_stash_constraint():
+    """STASH constraints get a field filter matching on STASH."""
+    field_filter = _catalogue.get_field_filter(
+        constraints.generate_var_constraint("m01s03i236")
+    )
+    assert field_filter(_catalogue.FieldSummary({"stash": "m01s03i236"}))
+    assert not field_filter(_catalogue.FieldSummary({"stash": "m01s03i225"}))
+
+
+def test_field_filter_level_constraint():
+    """Level constraints check coordinate presence and points."""
+    field = _catalogue.FieldSummary({"coords": {"pressure": [850.0, 500.0]}})
+    assert _catalogue.get_field_filter(
+        constraints.generate_level_constraint("pressure", 850)
+    )(field)
+    assert not _catalogue.get_field_filter(
+        constraints.generate_level_constraint("pressure", 250)
+    )(field)
+    assert _catalogue.get_field_filter(
+        constraints.generate_level_constraint("pressure", "*")
+    )(field)
+    assert not _catalogue.get_field_filter(
+        constraints.generate_level_constraint("pressure", [])
+    )(field)
+    # Unrecorded points might match.
+    unrecorded = _catalogue.FieldSummary({"coords": {"pressure": None}})
+    assert _catalogue.get_field_filter(
+        constraints.generate_level_constraint("pressure", 250)
+    )(unrecorded)
+
+
+def test_field_filter_time_constraint():
+    """Time constraints check the time points of the field."""
+    field = _catalogue.FieldSummary(
+        {
+            "coords": {"time": [0.0, 1.0]},
+            "time": {
+                "units": "hours since 2000-01-01 00:00:00",
+                "calendar": "standard",
+                "points": [0.0, 1.0],
+            },
+        }
+    )
+    assert _catalogue.get_field_filter(
+        constraints.generate_time_constraint("2000-01-01T01:00Z")
+    )(field)
+    assert not _catalogue.get_field_filter(
+        constraints.generate_time_constraint("2000-01-01T03:00Z")
+    )(field)
+
+
+def test_field_filter_hour_constraint():
+    """Hour constraints check the hour points of the field."""
+    field = _catalogue.FieldSummary({"coords": {"hour": [0, 1, 2]}})
+    assert _catalogue.get_field_filter(constraints.generate_hour_constraint(2, 5))(
+        field
+    )
+    assert not _catalogue.get_field_filter(constraints.generate_hour_constraint(12))(
+        field
+    )
+    assert not _catalogue.get_field_filter(constraints.generate_hour_constraint(0))(
+        _catalogue.FieldSummary({"coords": {}})
+    )
+
+
+def test_field_filter_combined_constraint():
+    """Combined constraints combine the field filters of their parts."""
+    combined = constraints.combine_constraints(
+        varname_constraint=constraints.generate_var_constraint("air_temperature"),
+        level_constraint=constraints.generate_level_constraint("pressure", []),
+    )
+    field_filter = _catalogue.get_field_filter(combined)
+    assert field_filter(_catalogue.FieldSummary({"names": ["air_temperature"]}))
+    assert not field_filter(
+        _catalogue.FieldSummary(
+            {"names": ["air_temperature"], "coords": {"pressure": [850.0]}}
+        )
+    )
+
+
+def test_field_filter_unknown_constraint():
+    """Constraints without a field filter can't prune files."""
+    assert _catalogue.get_field_filter(None) is None
+    assert _catalogue.get_field_filter(iris.Constraint("air_temperature")) is None
+    assert (
+        _catalogue.get_field_filter(
+            constraints.generate_var_constraint("air_temperature")
+            | iris.Constraint("air_temperature")
+        )
+        is None
+    )
+
+
+def test_prune_files_whole_directory(data_dir):
+    """Files that can't match are skipped, and a catalogue is written."""
+    files = read._check_input_files(str(data_dir))
+    pruned = _catalogue.prune_files(
+        files, constraints.generate_var_constraint("air_temperature")
+    )
+    assert pruned == [data_dir / "air_temp.nc"]
+    assert (data_dir / _catalogue.CATALOGUE_FILENAME).is_file()
+    # The catalogue itself is not an input file.
+    assert read._check_input_files(str(data_dir)) == files
+
+
+def test_prune_files_partial_directory_no_catalogue(data_dir):
+    """No catalogue is built when only some of a directory is read."""
+    files = [data_dir / "air_temp.nc"]
+    pruned = _catalogue.prune_files(
+        files, constraints.generate_var_constraint("eastward_wind")
+    )
+    assert pruned == files
+    assert not (data_dir / _catalogue.CATALOGUE_FILENAME).exists()
+
+
+def test_prune_files_changed_file_reindexed(data_dir):
+    """Files changed since being catalogued are indexed again."""
+    catalogue = _catalogue.update_catalogue(data_dir)
+    assert set(catalogue["files"]) == {"air_temp.nc", "u10_v10.nc"}
+    # Swap the file contents, so the old catalogue entry is wrong.
+    shutil.copy("tests/test_data/u10_v10.nc", data_dir / "air_temp.nc")
+    os.utime(data_dir / "air_temp.nc", (0, 0))
+    files = read._check_input_files(str(data_dir))
+    pruned = _catalogue.prune_files(
+        files, constraints.generate_var_constraint("air_temperature")
+    )
+    assert pruned == []
+
+
+def test_read_cubes_with_catalogue(data_dir):
+    """Reading with a catalogue gives the same cubes as without."""
+    constraint = constraints.generate_var_constraint("air_temperature")
+    expected = read.read_cubes(str(data_dir / "air_temp.nc"), constraint)
+    actual = read.read_cubes(str(data_dir), constraint)
+    assert (data_dir / _catalogue.CATALOGUE_FILENAME).is_file()
+    assert actual == expected
@@ -17,6 +17,8 @@
 import datetime
 
 import cf_units
+import dask
+import dask.array as da
 import iris
 import iris.cube
 import numpy as np
@@ -284,6 +286,51 @@ def test_collapse_by_validity_time(long_forecast_multi_day):
     assert repr(collapsed_cube) == expected_cube
 
 
+def test_collapse_by_validity_time_lazy(long_forecast_multi_day):
+    """Validity times are collapsed lazily, over all cases at each time."""
+    cube = long_forecast_multi_day
+    lazy_cube = cube.copy(data=da.from_array(cube.data))
+    collapsed_cube = collapse.collapse_by_validity_time(lazy_cube, "MAX")
+    assert collapsed_cube.has_lazy_data()
+    assert collapsed_cube.cell_methods[-1] == iris.coords.CellMethod(
+        "maximum", "equalised_validity_time"
+    )
+    time_points = cube.coord("time").points
+    for index in (0, 50, -1):
+        point = collapsed_cube.coord("time").points[index]
+        expected = cube.data[time_points == point].max(axis=0)
+        assert np.allclose(collapsed_cube.data[index], expected)
+
+
+def test_collapse_by_hour_of_day_lazy(long_forecast_multi_day):
+    """Collapsing lazy data by hour of day gives the same result."""
+    lazy_cube = long_forecast_multi_day.copy(
+        data=da.from_array(long_forecast_multi_day.data)
+    )
+    expected_cube = collapse.collapse_by_hour_of_day(long_forecast_multi_day, "MEAN")
+    collapsed_cube = collapse.collapse_by_hour_of_day(lazy_cube, "MEAN")
+    assert collapsed_cube.coord("hour") == expected_cube.coord("hour")
+    assert np.allclose(collapsed_cube.data, expected_cube.data)
+
+
+def test_collapse_by_hour_of_day_lazy_without_lazy_aggregator(
+    long_forecast_multi_day,
+):
+    """Aggregators without a lazy form don't compute data until it is needed."""
+
+    def no_compute(*args, **kwargs):
+        raise AssertionError("Data was computed.")
+
+    lazy_cube = long_forecast_multi_day.copy(
+        data=da.from_array(long_forecast_multi_day.data)
+    )
+    expected_cube = collapse.collapse_by_hour_of_day(long_forecast_multi_day, "MEDIAN")
+    with dask.config.set(scheduler=no_compute):
+        collapsed_cube = collapse.collapse_by_hour_of_day(lazy_cube, "MEDIAN")
+    assert collapsed_cube.has_lazy_data()
+    assert np.allclose(collapsed_cube.data, expected_cube.data)
+
+
 def test_collapse_by_validity_time_cubelist(long_forecast_multi_day):
     """Collapsing a CubeList by validity time collapses each cube separately."""
     cubes = iris.cube.CubeList(
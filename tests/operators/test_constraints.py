@@ -16,7 +16,10 @@
 
 from datetime import datetime
 
+import cf_units
 import iris
+import iris.coords
+import iris.cube
 import numpy as np
 import pytest
 
@@ -96,7 +99,7 @@ def test_generate_time_constraint():
     time_constraint = constraints.generate_time_constraint(
         "2023-03-24T00:00", "2023-03-24T06:00"
     )
-    expected_time_constraint = "Constraint(coord_values={'time': <function generate_time_constraint.<locals>.<lambda> at "
+    expected_time_constraint = "_PointRangeConstraint(time: _PointRange("
     assert expected_time_constraint in repr(time_constraint)
     # Try with datetime.datetime dates
     time_constraint = constraints.generate_time_constraint(
@@ -109,6 +112,51 @@ def test_generate_time_constraint():
     assert expected_time_constraint in repr(time_constraint)
 
 
+def _time_cube(units="hours since 2023-03-24 00:00:00", calendar="standard"):
+    """Cube with six hourly times over a day."""
+    time = iris.coords.DimCoord(
+        [0.0, 6.0, 12.0, 18.0],
+        standard_name="time",
+        units=cf_units.Unit(units, calendar=calendar),
+    )
+    return iris.cube.Cube(np.arange(4), dim_coords_and_dims=[(time, 0)])
+
+
+def test_generate_time_constraint_extract():
+    """Time constraints select the points within their inclusive range."""
+    cube = _time_cube()
+    time_constraint = constraints.generate_time_constraint(
+        "2023-03-24T06:00Z", "2023-03-24T12:00Z"
+    )
+    extracted = cube.extract(time_constraint)
+    assert np.array_equal(extracted.coord("time").points, [6.0, 12.0])
+    # Times in other units are compared in their own units.
+    cube = _time_cube("days since 2023-03-24 00:00:00")
+    cube.coord("time").points = [0.0, 0.25, 0.5, 0.75]
+    extracted = cube.extract(time_constraint)
+    assert np.array_equal(extracted.coord("time").points, [0.25, 0.5])
+    # Nothing is selected outside of the range.
+    assert cube.extract(constraints.generate_time_constraint("2023-03-25")) is None
+
+
+def test_generate_time_constraint_extract_calendar():
+    """Non-standard calendars are respected."""
+    time_constraint = constraints.generate_time_constraint("2023-03-01T12:00")
+    cube = _time_cube("days since 2023-02-28 00:00:00", calendar="360_day")
+    cube.coord("time").points = [0.5, 1.5, 2.5, 3.5]
+    extracted = cube.extract(time_constraint)
+    # The 360 day calendar has 30 days in February.
+    assert np.array_equal(extracted.coord("time").points, [2.5])
+
+
+def test_generate_time_constraint_extract_partial_date():
+    """Partial dates select the whole of their period."""
+    cube = _time_cube("days since 2023-02-28 00:00:00")
+    cube.coord("time").points = [0.0, 1.0, 31.0, 32.0]
+    extracted = cube.extract(constraints.generate_time_constraint("2023-03"))
+    assert np.array_equal(extracted.coord("time").points, [1.0, 31.0])
+
+
 def test_generate_level_constraint_single_level():
     """Generate constraint for a single level."""
     pressure_constraint = constraints.generate_level_constraint(
@@ -225,15 +273,37 @@ def test_generate_realization_constraint_multiple_realizations():
 def test_generate_hour_constraint():
     """Generate hour constraint with hour_start."""
     hour_constraint = constraints.generate_hour_constraint(hour_start=12)
-    expected_hour_constraint = "Constraint(coord_values={'hour': <function generate_hour_constraint.<locals>.<lambda> at"
-    assert expected_hour_constraint in repr(hour_constraint)
+    assert repr(hour_constraint) == "_PointRangeConstraint(hour: _PointRange(12 to 12))"
 
 
 def test_generate_hour_constraint_both_limits():
     """Generate hour constraint with hour_start and hour_end."""
     hour_constraint = constraints.generate_hour_constraint(hour_start=12, hour_end=15)
-    expected_hour_constraint = "Constraint(coord_values={'hour': <function generate_hour_constraint.<locals>.<lambda> at"
-    assert expected_hour_constraint in repr(hour_constraint)
+    assert repr(hour_constraint) == "_PointRangeConstraint(hour: _PointRange(12 to 15))"
+    hour = iris.coords.AuxCoord(np.arange(24), long_name="hour")
+    cube = iris.cube.Cube(np.arange(24), aux_coords_and_dims=[(hour, 0)])
+    extracted = cube.extract(hour_constraint)
+    assert np.array_equal(extracted.coord("hour").points, [12, 13, 14, 15])
+    # Cubes without an hour coordinate don't match.
+    assert iris.cube.Cube(np.arange(24)).extract(hour_constraint) is None
+
+
+def test_generate_time_constraint_compares_points_once(monkeypatch):
+    """Time constraints compare all the points of a cube in a single call."""
+    calls = []
+    point_mask = constraints._PointRange.point_mask
+
+    def counting_point_mask(self, points, units=None):
+        calls.append(len(points))
+        return point_mask(self, points, units)
+
+    monkeypatch.setattr(constraints._PointRange, "point_mask", counting_point_mask)
+    time_constraint = constraints.generate_time_constraint(
+        "2023-03-24T06:00Z", "2023-03-24T12:00Z"
+    )
+    extracted = _time_cube().extract(time_constraint)
+    assert np.array_equal(extracted.coord("time").points, [6.0, 12.0])
+    assert calls == [4]
 
 
 def test_generate_hour_constraint_negative_values():
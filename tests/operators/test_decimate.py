@@ -0,0 +1,114 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for reducing spatial fields to the display resolution."""
+
+import iris.coords
+import iris.cube
+import numpy as np
+import pytest
+
+from CSET.operators import _decimate
+
+
+def _grid_cube(data) -> iris.cube.Cube:
+    """Cube on a regular latitude longitude grid with bounds."""
+    data = np.asanyarray(data)
+    lat = iris.coords.DimCoord(
+        np.arange(data.shape[-2], dtype=float),
+        standard_name="latitude",
+        units="degrees",
+    )
+    lon = iris.coords.DimCoord(
+        np.arange(data.shape[-1], dtype=float),
+        standard_name="longitude",
+        units="degrees",
+    )
+    lat.guess_bounds()
+    lon.guess_bounds()
+    dims = data.ndim
+    return iris.cube.Cube(
+        data,
+        long_name="field",
+        dim_coords_and_dims=[(lat, dims - 2), (lon, dims - 1)],
+    )
+
+
+def test_decimate_small_field_unchanged():
+    """Fields already within the display resolution are unchanged."""
+    cube = _grid_cube(np.zeros((4, 6)))
+    assert _decimate.decimate_for_display(cube, 6) is cube
+
+
+def test_decimate_mean():
+    """Blocks of cells are averaged, with coordinates covering each block."""
+    cube = _grid_cube(np.arange(24, dtype=float).reshape(4, 6))
+    reduced = _decimate.decimate_for_display(cube, 2, "MEAN")
+    assert reduced.shape == (2, 2)
+    assert np.array_equal(reduced.data, [[4.0, 7.0], [16.0, 19.0]])
+    assert np.array_equal(reduced.coord("latitude").points, [0.5, 2.5])
+    assert np.array_equal(reduced.coord("longitude").points, [1.0, 4.0])
+    assert np.array_equal(reduced.coord("longitude").bounds, [[-0.5, 2.5], [2.5, 5.5]])
+
+
+def test_decimate_max_partial_blocks():
+    """Partial blocks at the edge of the domain only use their own cells."""
+    cube = _grid_cube(np.arange(25, dtype=float).reshape(5, 5))
+    reduced = _decimate.decimate_for_display(cube, 2, "MAX")
+    assert reduced.shape == (2, 2)
+    assert np.array_equal(reduced.data, [[12.0, 14.0], [22.0, 24.0]])
+    assert np.array_equal(reduced.coord("latitude").bounds, [[-0.5, 2.5], [2.5, 4.5]])
+
+
+def test_decimate_auto_mode_for_categories():
+    """Categorical fields take the most common category, ignoring masks."""
+    data = np.ma.masked_array(
+        [[1, 1, 2, 3], [1, 3, 3, 3]],
+        mask=[[False, False, True, True], [False, False, True, True]],
+    )
+    reduced = _decimate.decimate_for_display(_grid_cube(data), 2, "AUTO")
+    assert reduced.dtype == data.dtype
+    assert reduced.data[0, 0] == 1
+    assert reduced.data.mask[0, 1]
+
+
+def test_decimate_auto_levels_for_float_categories():
+    """Fields with discrete colour levels keep the most common level."""
+    data = np.array(
+        [
+            [0.0, 0.2, 2.0, 2.0],
+            [2.5, 0.4, 2.0, 0.9],
+            [1.0, 1.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0, 0.0],
+        ]
+    )
+    reduced = _decimate.decimate_for_display(
+        _grid_cube(data), 2, "AUTO", levels=[0.0, 1.0, 2.0, 3.0]
+    )
+    # Each block is drawn in its most common colour, not that of its mean.
+    assert reduced.data.tolist() == [[0.0, 2.0], [1.0, 0.0]]
+
+
+def test_decimate_stride_extra_dimensions():
+    """Non-spatial dimensions are kept when subsampling."""
+    cube = _grid_cube(np.arange(48, dtype=float).reshape(2, 4, 6))
+    reduced = _decimate.decimate_for_display(cube, 3, "STRIDE")
+    assert reduced.shape == (2, 2, 3)
+    assert np.array_equal(reduced.data, cube.data[:, ::2, ::2])
+
+
+def test_decimate_unknown_method():
+    """Error for unknown decimation methods."""
+    with pytest.raises(ValueError, match="Unknown decimation method"):
+        _decimate.decimate_for_display(_grid_cube(np.zeros((4, 6))), 2, "MEDIAN")
@@ -15,6 +15,7 @@
 """Tests for ensemble operators."""
 
 import iris
+import iris.analysis
 import iris.cube
 import numpy as np
 import pytest
@@ -109,3 +110,36 @@ def test_DKE_coordinate_mismatch(xwind, ywind):
     )
     with pytest.raises(ValueError):
         ensembles.DKE(xwind_new, ywind)
+
+
+def test_DKE_lazy(xwind, ywind):
+    """Test DKE is lazily evaluated and matches the realised calculation."""
+    xwind_data = xwind.data.copy()
+    ywind_data = ywind.data.copy()
+    expected = (
+        0.5 * (xwind_data[0, :] - xwind_data[1:, :]) ** 2
+        + 0.5 * (ywind_data[0, :] - ywind_data[1:, :]) ** 2
+    )
+    dke = ensembles.DKE(xwind, ywind)
+    assert dke.has_lazy_data()
+    assert dke.name() == "Difference Kinetic Energy"
+    assert dke.coord("realization") == xwind.coord("realization")[1:]
+    assert np.allclose(dke.data, expected, rtol=1e-06, atol=1e-02)
+    # Input winds are left unchanged.
+    assert np.array_equal(xwind.data, xwind_data)
+
+
+def test_DKE_collapsed(xwind, ywind):
+    """Test DKE can be collapsed over the domain in the same pass."""
+    coordinate = ["grid_latitude", "grid_longitude"]
+    dke = ensembles.DKE(xwind, ywind, coordinate=coordinate, method="SUM")
+    assert dke.has_lazy_data()
+    expected = ensembles.DKE(xwind, ywind).collapsed(coordinate, iris.analysis.SUM)
+    assert np.allclose(dke.data, expected.data)
+    assert not dke.coord_dims("grid_latitude")
+
+
+def test_DKE_unknown_method(xwind, ywind):
+    """Test DKE fails with an unsupported collapse method."""
+    with pytest.raises(ValueError):
+        ensembles.DKE(xwind, ywind, coordinate="pressure", method="MEDIAN")
@@ -19,7 +19,7 @@ import iris.cube
 import numpy as np
 import pytest
 
-from CSET.operators import aggregate, constraints, filters, read
+from CSET.operators import aggregate, constraints, filters, misc, read
 
 constraint_single = constraints.combine_constraints(
     constraints.generate_stash_constraint("m01s03i236"),
@@ -298,37 +298,78 @@ def test_generate_mask_cube_list(cubes):
         assert np.allclose(cube.data, mask.data, rtol=1e-06, atol=1e-02)
 
 
+def test_generate_mask_lazy_bytes(cube):
+    """Masks are lazy arrays of single bytes."""
+    mask = filters.generate_mask(cube, "gt", 276)
+    assert mask.has_lazy_data()
+    assert mask.dtype == np.int8
+
+
 def test_apply_mask(cube):
     """Apply a mask to a cube."""
     mask = filters.generate_mask(cube, "eq", 276)
-    mask.data[mask.data == 0.0] = np.nan
-    mask.data[~np.isnan(mask.data)] = 1.0
-    test_data = cube.copy()
-    test_data.data *= mask.data
-    assert np.allclose(
-        filters.apply_mask(cube, mask).data,
-        test_data.data,
-        rtol=1e-06,
-        atol=1e-02,
-        equal_nan=True,
-    )
+    expected = np.ma.masked_where(cube.data != 276, cube.data)
+    masked = filters.apply_mask(cube, mask)
+    assert masked.has_lazy_data()
+    assert np.array_equal(np.ma.getmaskarray(masked.data), expected.mask)
+    assert np.ma.allclose(masked.data, expected, rtol=1e-06, atol=1e-02)
 
 
 def test_apply_mask_cubelist(cube):
     """Apply a mask to a cube list."""
     mask = filters.generate_mask(cube, "eq", 276)
-    mask.data[mask.data == 0.0] = np.nan
-    mask.data[~np.isnan(mask.data)] = 1.0
-    test_data = cube.copy()
-    test_data.data *= mask.data
-    expected_list = iris.cube.CubeList([test_data, test_data])
+    expected = np.ma.masked_where(cube.data != 276, cube.data)
     mask_list = iris.cube.CubeList([mask, mask])
     input_list = iris.cube.CubeList([cube, cube])
     actual_cubelist = filters.apply_mask(input_list, mask_list)
-    for expected_cube, mask in zip(expected_list, actual_cubelist, strict=True):
-        assert np.allclose(
-            expected_cube.data, mask.data, rtol=1e-06, atol=1e-02, equal_nan=True
-        )
+    assert len(actual_cubelist) == 2
+    for masked in actual_cubelist:
+        assert np.array_equal(np.ma.getmaskarray(masked.data), expected.mask)
+        assert np.ma.allclose(masked.data, expected, rtol=1e-06, atol=1e-02)
+
+
+def test_apply_mask_added_masks(cube):
+    """Masks combined by addition select data where either is set."""
+    mask = misc.addition(
+        filters.generate_mask(cube, "lt", 275), filters.generate_mask(cube, "gt", 277)
+    )
+    masked = filters.apply_mask(cube, mask)
+    expected = (cube.data < 275) | (cube.data > 277)
+    assert np.array_equal(~np.ma.getmaskarray(masked.data), expected)
+
+
+def test_mask_and_or_not(cube):
+    """Masks are combined with logical operations."""
+    high = filters.generate_mask(cube, "gt", 275)
+    low = filters.generate_mask(cube, "lt", 277)
+    both = filters.mask_and(high, low)
+    either = filters.mask_or(high, low)
+    not_high = filters.mask_not(high)
+    for mask in (both, either, not_high):
+        assert mask.has_lazy_data()
+        assert mask.dtype == np.int8
+        assert mask.units == "1"
+    assert np.array_equal(both.data, (cube.data > 275) & (cube.data < 277))
+    assert np.array_equal(either.data, (cube.data > 275) | (cube.data < 277))
+    assert np.array_equal(not_high.data, cube.data <= 275)
+    assert both.name() == f"{high.name()}_and_{low.name()}"
+    assert not_high.name() == f"not_{high.name()}"
+
+
+def test_mask_and_cubelist(cube):
+    """Lists of masks are combined pairwise."""
+    high = filters.generate_mask(iris.cube.CubeList([cube, cube]), "gt", 275)
+    low = filters.generate_mask(iris.cube.CubeList([cube, cube]), "lt", 277)
+    both = filters.mask_and(high, low)
+    assert isinstance(both, iris.cube.CubeList)
+    assert len(both) == 2
+
+
+def test_mask_and_different_shapes(cube):
+    """Masks of different shapes can't be combined."""
+    high = filters.generate_mask(cube, "gt", 275)
+    with pytest.raises(ValueError, match="Masks have different shapes"):
+        filters.mask_and(high, high[0])
 
 
 def test_generate_single_ensemble_member_constraint_reduced_member(ensemble_cube):
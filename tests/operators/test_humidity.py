@@ -731,6 +731,15 @@ def test_precipitable_water(mr_3d, pw_3d):
     )
 
 
+def test_precipitable_water_lazy(mr_3d, pw_3d):
+    """Test precipitable water is calculated without realising the data."""
+    mr_lazy = mr_3d.copy(data=mr_3d.lazy_data())
+    pw = humidity.precipitable_water(mr_lazy)
+    assert mr_lazy.has_lazy_data()
+    assert pw.has_lazy_data()
+    assert np.allclose(pw_3d.data, pw.data, rtol=1e-6, atol=1e-2)
+
+
 def test_precipitable_water_cubelist(mr_3d, pw_3d):
     """Test calculation of precipitable water in a cubelist."""
     input_cube = iris.cube.CubeList([mr_3d, mr_3d])
@@ -17,6 +17,7 @@
 import datetime
 
 import cf_units
+import dask.array as da
 import iris
 import iris.coords
 import iris.cube
@@ -321,3 +322,24 @@ def test_structural_similarity_model_comparisons_SSIM_different_sigma_not_one(
     # As both cubes use the same data, check the SSIM is one.
     assert isinstance(SSIM_cube, iris.cube.Cube)
     assert np.allclose(SSIM_cube.data, ssim.data, atol=1e-9)
+
+
+def test_structural_similarity_lazy_matches_realised(cube: iris.cube.Cube):
+    """Lazy data is processed block-wise, giving the same result."""
+    other_cube = cube.copy()
+    other_cube.data = np.flip(other_cube.data)
+    del other_cube.attributes["cset_comparison_base"]
+    cubes = iris.cube.CubeList([cube, other_cube])
+    lazy_cubes = iris.cube.CubeList(
+        [c.copy(data=da.from_array(c.data, chunks=1)) for c in cubes]
+    )
+
+    for operator in (
+        imageprocessing.spatial_structural_similarity_model_comparisons,
+        imageprocessing.mean_structural_similarity_model_comparisons,
+    ):
+        expected = operator(cubes, sigma=0.5)
+        actual = operator(lazy_cubes, sigma=0.5)
+        assert actual.has_lazy_data()
+        assert actual.shape == expected.shape
+        assert np.allclose(actual.data, expected.data, atol=1e-9)
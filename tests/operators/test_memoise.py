@@ -0,0 +1,153 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for memoisation of intermediate diagnostics."""
+
+import dask
+import dask.array as da
+import iris.cube
+import numpy as np
+
+from CSET.operators import _memoise, humidity, temperature
+
+
+def _counting_function():
+    """Memoised function recording how often blocks are really computed."""
+    computed = []
+
+    def count(block, factor):
+        if block.size:
+            computed.append(block)
+        return block * factor
+
+    @_memoise.memoise
+    def double(cube, factor=2):
+        return cube.lazy_data().map_blocks(count, factor, dtype=cube.dtype)
+
+    return double, computed
+
+
+def test_memoise_without_cache_is_lazy():
+    """Without an active cache every call is evaluated lazily."""
+    double, computed = _counting_function()
+    cube = iris.cube.Cube(np.arange(4.0), units="K")
+    assert double(cube).compute().tolist() == [0.0, 2.0, 4.0, 6.0]
+    assert double(cube).compute().tolist() == [0.0, 2.0, 4.0, 6.0]
+    assert len(computed) == 2
+
+
+def test_memoise_computes_once():
+    """Intermediates are computed once for equal inputs and arguments."""
+    double, computed = _counting_function()
+    with _memoise.intermediate_cache():
+        first = double(iris.cube.Cube(np.arange(4.0), units="K"))
+        second = double(iris.cube.Cube(np.arange(4.0), units="K"))
+        # Nothing is computed until the result is needed.
+        assert isinstance(first, da.Array)
+        assert not computed
+        # Intermediates computed together share their tasks.
+        first, second = dask.compute(first, second)
+        assert np.array_equal(first, second)
+        assert len(computed) == 1
+        # Later calls use the cached blocks.
+        double(iris.cube.Cube(np.arange(4.0), units="K")).compute()
+        assert len(computed) == 1
+        # Different units or arguments are different intermediates.
+        double(iris.cube.Cube(np.arange(4.0), units="Celsius")).compute()
+        double(iris.cube.Cube(np.arange(4.0), units="K"), factor=3).compute()
+        assert len(computed) == 3
+
+
+def test_memoise_spills_to_directory(tmp_path):
+    """Intermediates evicted from memory are shared through the directory."""
+    double, computed = _counting_function()
+    cube = iris.cube.Cube(np.ma.masked_less(np.arange(4.0), 1.0), units="K")
+    with _memoise.intermediate_cache(memory_limit=48, directory=tmp_path):
+        double(cube).compute()
+        # Caching another intermediate evicts the first.
+        double(cube, factor=3).compute()
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+    with _memoise.intermediate_cache(memory_limit=48, directory=tmp_path):
+        result = double(cube).compute()
+    assert len(computed) == 2
+    assert np.ma.getmaskarray(result).tolist() == [True, False, False, False]
+
+
+def test_memoise_close_writes_to_directory(tmp_path):
+    """Intermediates held in memory are shared with later caches on closing."""
+    double, computed = _counting_function()
+    cube = iris.cube.Cube(np.arange(4.0), units="K")
+    with _memoise.intermediate_cache(directory=tmp_path):
+        double(cube).compute()
+        assert not list(tmp_path.glob("*.npz"))
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    with _memoise.intermediate_cache(directory=tmp_path):
+        assert double(cube).compute().tolist() == [0.0, 2.0, 4.0, 6.0]
+    assert len(computed) == 1
+
+
+def test_memoise_processes_scheduler(tmp_path):
+    """Blocks computed in other processes are cached in the directory."""
+    double, computed = _counting_function()
+    cube = iris.cube.Cube(da.arange(8.0, chunks=4), units="K")
+    with _memoise.intermediate_cache(directory=tmp_path) as cache:
+        with dask.config.set(scheduler="processes", num_workers=2):
+            result = double(cube).compute()
+        assert result.tolist() == [0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0]
+        assert not cache._arrays
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+    with _memoise.intermediate_cache(directory=tmp_path):
+        assert double(cube).compute().tolist() == result.tolist()
+    # Blocks were only computed in the worker processes.
+    assert not computed
+
+
+def test_memoise_memory_limit():
+    """Intermediates larger than the memory limit are not cached."""
+    double, computed = _counting_function()
+    cube = iris.cube.Cube(np.arange(1000.0), units="K")
+    with _memoise.intermediate_cache(memory_limit="1KiB") as cache:
+        result = double(cube).compute()
+        double(cube).compute()
+        assert len(computed) == 2
+        assert not cache._arrays
+    assert result[-1] == 1998.0
+
+
+def test_memoised_diagnostics_match(
+    temperature_for_conversions_cube,
+    relative_humidity_for_conversions_cube,
+    pressure_for_conversions_cube,
+):
+    """Derived diagnostics are unchanged when intermediates are memoised."""
+    args = (
+        temperature_for_conversions_cube,
+        relative_humidity_for_conversions_cube,
+        pressure_for_conversions_cube,
+    )
+    expected_theta_w = temperature.wet_bulb_potential_temperature(*args)
+    expected_mr = humidity.mixing_ratio_from_relative_humidity(
+        temperature_for_conversions_cube,
+        pressure_for_conversions_cube,
+        relative_humidity_for_conversions_cube,
+    )
+    with _memoise.intermediate_cache():
+        theta_w = temperature.wet_bulb_potential_temperature(*args)
+        mr = humidity.mixing_ratio_from_relative_humidity(
+            temperature_for_conversions_cube,
+            pressure_for_conversions_cube,
+            relative_humidity_for_conversions_cube,
+        )
+        assert np.allclose(expected_theta_w.data, theta_w.data, equal_nan=True)
+        assert np.allclose(expected_mr.data, mr.data)
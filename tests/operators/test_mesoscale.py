@@ -24,10 +24,9 @@ from CSET.operators._utils import get_cube_yxcoordname
 def test_spatial_perturbation_field_gaussian(cube):
     """Test smoothing a cube with a Gaussian filter."""
     calculated = cube.copy()
-    coords = [coord.name() for coord in cube.coords()]
     axes = (
-        coords.index(get_cube_yxcoordname(cube)[0]),
-        coords.index(get_cube_yxcoordname(cube)[1]),
+        cube.coord_dims(get_cube_yxcoordname(cube)[0])[0],
+        cube.coord_dims(get_cube_yxcoordname(cube)[1])[0],
     )
     calculated.data -= gaussian_filter(cube.data, 40, axes=axes)
     assert np.allclose(
@@ -50,10 +49,9 @@ def test_spatial_perturbation_field_gaussian(cube):
 def test_spatial_perturbation_field_uniform(cube):
     """Test smoothing a cube with a uniform filter."""
     calculated = cube.copy()
-    coords = [coord.name() for coord in cube.coords()]
     axes = (
-        coords.index(get_cube_yxcoordname(cube)[0]),
-        coords.index(get_cube_yxcoordname(cube)[1]),
+        cube.coord_dims(get_cube_yxcoordname(cube)[0])[0],
+        cube.coord_dims(get_cube_yxcoordname(cube)[1])[0],
     )
     calculated.data -= uniform_filter(cube.data, 40, axes=axes)
     assert np.allclose(
@@ -73,3 +71,17 @@ def test_spatial_perturbation_field_uniform(cube):
         rtol=1e-06,
         atol=1e-02,
     )
+
+
+def test_spatial_perturbation_field_lazy(cube):
+    """Test the perturbation field is computed lazily for each slice."""
+    axes = (
+        cube.coord_dims(get_cube_yxcoordname(cube)[0])[0],
+        cube.coord_dims(get_cube_yxcoordname(cube)[1])[0],
+    )
+    lazy_cube = cube.copy(data=cube.lazy_data())
+    pert_field = mesoscale.spatial_perturbation_field(lazy_cube, filter_scale=2)
+    assert lazy_cube.has_lazy_data()
+    assert pert_field.has_lazy_data()
+    expected = cube.data - gaussian_filter(cube.data, 2, axes=axes)
+    assert np.allclose(pert_field.data, expected, rtol=1e-06, atol=1e-02)
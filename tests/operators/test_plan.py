@@ -0,0 +1,109 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for planning recipes sharing common steps."""
+
+import iris.cube
+import numpy as np
+
+from CSET.operators import _plan
+
+READ = {
+    "operator": "read.read_cube",
+    "file_paths": "data",
+    "constraint": {"operator": "constraints.generate_var_constraint", "varname": "x"},
+}
+COLLAPSE = {"operator": "collapse.collapse", "coordinate": "time", "method": "MEAN"}
+
+
+def test_canonical_step_ignores_key_order():
+    """Steps with the same arguments in a different order are identical."""
+    reordered = dict(reversed(READ.items()))
+    assert _plan.canonical_step(reordered) == _plan.canonical_step(READ)
+    assert _plan.canonical_step(COLLAPSE) != _plan.canonical_step(
+        COLLAPSE | {"method": "MAX"}
+    )
+
+
+def test_shareable_prefix_length():
+    """Steps from the first which writes output aren't shared."""
+    plot = {"operator": "plot.spatial_pcolormesh_plot"}
+    assert _plan.shareable_prefix_length([READ, COLLAPSE, plot]) == 2
+    assert _plan.shareable_prefix_length([plot, READ]) == 0
+    assert _plan.shareable_prefix_length([READ, COLLAPSE]) == 2
+    # Nested steps are also checked.
+    assert _plan.shareable_prefix_length([{"operator": "misc.noop", "x": plot}]) == 0
+
+
+def test_recipe_plan_executes_shared_steps_once():
+    """Identical prefixes are executed once, and their outputs released."""
+    plot = {"operator": "plot.spatial_pcolormesh_plot"}
+    histogram = {"operator": "plot.plot_histogram_series"}
+    maximum = COLLAPSE | {"method": "MAX"}
+    plan = _plan.RecipePlan(
+        [[READ, COLLAPSE, plot], [READ, maximum, plot], [READ, COLLAPSE, histogram]]
+    )
+    evaluated = []
+
+    def evaluate(step, step_input):
+        evaluated.append(step["operator"])
+        return (step_input or ()) + (step.get("method", step["operator"]),)
+
+    outputs = {}
+    for index in plan.order:
+        outputs[index] = plan.prefix_output(index, evaluate)
+        plan.release(index)
+    assert evaluated == ["read.read_cube", "collapse.collapse", "collapse.collapse"]
+    assert outputs == {
+        0: ("read.read_cube", "MEAN"),
+        1: ("read.read_cube", "MAX"),
+        2: ("read.read_cube", "MEAN"),
+    }
+    assert plan.prefix_length(0) == 2
+    assert plan._outputs == {}
+
+
+def test_recipe_plan_separates_compute_policies():
+    """Prefixes aren't shared between recipes with different compute policies."""
+    plot = {"operator": "plot.spatial_pcolormesh_plot"}
+    plan = _plan.RecipePlan(
+        [[READ, plot], [READ, plot], [READ, plot]],
+        [
+            {"scheduler": "threads"},
+            {"scheduler": "processes"},
+            {"scheduler": "threads"},
+        ],
+    )
+    evaluated = []
+
+    def evaluate(step, step_input):
+        evaluated.append(step["operator"])
+        return step["operator"]
+
+    for index in plan.order:
+        plan.prefix_output(index, evaluate)
+        plan.release(index)
+    assert evaluated == ["read.read_cube", "read.read_cube"]
+    # Recipes with the same compute policy run consecutively.
+    assert plan.order == [1, 0, 2]
+
+
+def test_share_copies_cubes():
+    """Shared cubes are copies, so modifying them doesn't affect others."""
+    cube = iris.cube.Cube(np.zeros(3))
+    shared = _plan.share(iris.cube.CubeList([cube]))
+    shared[0].data[0] = 1
+    shared[0].rename("modified")
+    assert cube.data[0] == 0
+    assert cube.name() == "unknown"
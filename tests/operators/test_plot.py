@@ -23,6 +23,7 @@ import iris.coords
 import iris.cube
 import matplotlib as mpl
 import numpy as np
+import PIL.Image
 import pytest
 
 from CSET.operators import collapse, constraints, filters, plot, read
@@ -385,6 +386,32 @@ def test_spatial_pcolormesh_plot(cube, tmp_working_dir):
     assert Path("plot.png").is_file()
 
 
+def test_spatial_pcolormesh_plot_decimated(cube, tmp_working_dir, monkeypatch):
+    """Plot spatial pcolormesh plot reduced to the figure resolution."""
+    # Fewer pixels than grid cells across the figure, so the field is reduced.
+    monkeypatch.setattr(plot, "_get_plot_resolution", lambda: 1)
+    cube.remove_coord("realization")
+    cube_2d = cube.slices_over("time").next()
+    plot.spatial_pcolormesh_plot(cube_2d, filename="plot", decimation="MEAN")
+    assert Path("plot.png").is_file()
+
+
+def test_spatial_pcolormesh_plot_tiles(cube, tmp_working_dir):
+    """Plot spatial pcolormesh plot with a zoomable tile pyramid."""
+    cube.remove_coord("realization")
+    cube_2d = cube.slices_over("time").next()
+    plot.spatial_pcolormesh_plot(cube_2d, filename="plot", tiles=True)
+    assert Path("plot.png").is_file()
+    assert Path("plot_tiles/tiles.json").is_file()
+    assert Path("plot_tiles/0/0/0.png").is_file()
+
+
+def test_spatial_plot_unknown_decimation(cube, tmp_working_dir):
+    """Error for unknown decimation methods."""
+    with pytest.raises(ValueError, match="Unknown decimation method"):
+        plot.spatial_pcolormesh_plot(cube, decimation="MEDIAN")
+
+
 def test_spatial_pcolormesh_levels(cube, tmp_working_dir, caplog):
     """Plot spatial pcolormesh based on defined levels."""
     # Pick a variable with defined levels
@@ -440,6 +467,34 @@ def test_postage_stamp_pcolormesh_plot(ensemble_cube, tmp_working_dir):
     assert Path("air_temperature_20221201100000.png").is_file()
 
 
+def test_map_background(ensemble_cube, tmp_working_dir):
+    """Map lines are rendered once, at the size of a postage stamp."""
+    member = next(next(ensemble_cube.slices_over("time")).slices_over("realization"))
+    cmap = mpl.colormaps["viridis"]
+    background = plot._map_background(member, cmap, (10, 10), (2, 2))
+    assert background.ndim == 3
+    assert background.shape[2] == 4
+    # Some map lines are drawn, on an otherwise transparent background.
+    assert background[..., 3].max() > 0
+    assert background[..., 3].min() == 0
+    # Stamp axes are the same size as the background.
+    fig = mpl.pyplot.figure(figsize=(10, 10), dpi=plot._get_plot_resolution())
+    axes = plot._setup_spatial_map(
+        member, fig, cmap, grid_size=(2, 2), subplot=4, map_layers="labels"
+    )
+    fig.canvas.draw()
+    assert abs(axes.bbox.width - background.shape[1]) <= 1
+    assert abs(axes.bbox.height - background.shape[0]) <= 1
+    mpl.pyplot.close(fig)
+
+
+def test_map_background_not_spatial(tmp_working_dir):
+    """No background is rendered for cubes that aren't maps."""
+    cube = iris.cube.Cube(np.zeros(3), long_name="field")
+    cmap = mpl.colormaps["viridis"]
+    assert plot._map_background(cube, cmap, (10, 10), (2, 2)) is None
+
+
 def test_postage_stamp_pcolormesh_plot_sequence_coord_check(cube, tmp_working_dir):
     """Check error when cube has no time coordinate."""
     # What does this even physically mean? No data?
@@ -660,6 +715,41 @@ def test_plot_line_series_different_coord_lengths(tmp_working_dir):
     assert Path("plot.png").is_file()
 
 
+def test_find_matched_slices():
+    """Slices are grouped by sequence coordinate point across cubes."""
+    coord1 = iris.coords.DimCoord(
+        [2, 0, 1], standard_name="time", units="hours since 1970-01-01"
+    )
+    cube1 = iris.cube.Cube(
+        [[0, 1], [2, 3], [4, 5]],
+        long_name="my_var",
+        dim_coords_and_dims=[(coord1, 0)],
+    )
+    coord2 = iris.coords.DimCoord(
+        [1, 2, 3], standard_name="time", units="hours since 1970-01-01"
+    )
+    cube2 = iris.cube.Cube(
+        [[6, 7, 8], [9, 10, 11]],
+        long_name="my_var",
+        dim_coords_and_dims=[(coord2, 1)],
+    )
+    matched = list(plot._find_matched_slices([cube1, cube2], "time"))
+    assert [[s.coord("time").points[0] for s in cl] for cl in matched] == [
+        [0],
+        [1, 1],
+        [2, 2],
+        [3],
+    ]
+    # Slices are the same as given by slices_over.
+    assert matched[1][0] == list(cube1.slices_over("time"))[2]
+    assert matched[1][1] == next(cube2.slices_over("time"))
+    # Scalar sequence coordinates give the whole cube.
+    scalar = cube1[0]
+    assert list(plot._find_matched_slices([scalar], "time")) == [
+        iris.cube.CubeList([scalar])
+    ]
+
+
 def test_plot_line_series_ensemble(ensemble_cube, tmp_working_dir):
     """Save an ensemble line series plot."""
     ensemble_cube = collapse.collapse(
@@ -1006,6 +1096,35 @@ def test_plot_and_save_histogram_series_bins_lightning(
     assert Path("test.png").is_file()
 
 
+def test_plot_and_save_histogram_series_counts_saved(histogram_cube, tmp_working_dir):
+    """Histogram bin counts are saved, and lazy data gives the same counts."""
+    lazy_cube = histogram_cube.copy(data=histogram_cube.lazy_data().rechunk(1))
+    for cube, filename in ((histogram_cube, "real.png"), (lazy_cube, "lazy.png")):
+        plot._plot_and_save_histogram_series(
+            cubes=cube, filename=filename, title="Test", vmin=200, vmax=300
+        )
+    assert lazy_cube.has_lazy_data()
+    with open("real_histogram.json", "rt", encoding="UTF-8") as fp:
+        real = json.load(fp)
+    with open("lazy_histogram.json", "rt", encoding="UTF-8") as fp:
+        lazy = json.load(fp)
+    assert real == lazy
+    assert len(real["bins"]) == 51
+    expected, _ = np.histogram(histogram_cube.data, bins=np.linspace(200, 300, 51))
+    assert real["histograms"][0]["counts"] == expected.tolist()
+
+
+def test_set_axis_range_lazy(histogram_cube):
+    """Axis range is found from lazy data without realising it."""
+    # Use a name without colorbar levels, so the range comes from the data.
+    histogram_cube.rename("unknown_variable")
+    lazy_cube = histogram_cube.copy(data=histogram_cube.lazy_data())
+    vmin, vmax = plot._set_axis_range(iris.cube.CubeList([lazy_cube]))
+    assert lazy_cube.has_lazy_data()
+    assert vmin == histogram_cube.data.min()
+    assert vmax == histogram_cube.data.max()
+
+
 def test_plot_and_save_postage_stamp_histogram_series(histogram_cube, tmp_working_dir):
     """Test plotting a postage stamp histogram."""
     plot._plot_and_save_postage_stamp_histogram_series(
@@ -1196,6 +1315,54 @@ def test_save_close_figure_in_gallery(tmp_working_dir, monkeypatch):
     assert not (tmp_working_dir / "test_filename.png").exists()
 
 
+def _filled_figure():
+    """Figure with a couple of filled areas, well within the figure."""
+    fig = mpl.pyplot.figure(figsize=(4, 4))
+    axes = fig.add_axes((0.2, 0.2, 0.6, 0.6))
+    axes.fill([0, 1, 1], [0, 0, 1], color="red")
+    axes.fill([0, 0, 1], [0, 1, 1], color="blue")
+    return fig
+
+
+def test_save_close_figure_tight_palette(tmp_working_dir):
+    """Figures are cropped to their tight bounding box, and palettised."""
+    expected = _filled_figure()
+    expected.savefig("expected.png", bbox_inches="tight", dpi=100)
+    plot._save_close_figure(_filled_figure(), "my test", "test_filename.png")
+    with (
+        PIL.Image.open("test_filename.png") as actual,
+        PIL.Image.open("expected.png") as expected_image,
+    ):
+        assert actual.mode == "P"
+        assert abs(actual.width - expected_image.width) <= 1
+        assert abs(actual.height - expected_image.height) <= 1
+
+
+def test_write_image_webp(tmp_working_dir):
+    """Images can be written in other formats based on their extension."""
+    pixels = np.full((10, 20, 4), 255, dtype=np.uint8)
+    plot._write_image(pixels, "plot.webp", 100)
+    with PIL.Image.open("plot.webp") as image:
+        assert image.format == "WEBP"
+        assert image.size == (20, 10)
+
+
+def test_write_image_quantise(tmp_working_dir):
+    """Images with many colours are only quantised if plot_quantise is set."""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (20, 20, 4), dtype=np.uint8)
+    pixels[..., 3] = 255
+    plot._write_image(pixels, "lossless.png", 100)
+    with open("meta.json", "wt", encoding="UTF-8") as fp:
+        fp.write('{"plot_quantise": true}')
+    plot._write_image(pixels, "quantised.png", 100)
+    with PIL.Image.open("lossless.png") as image:
+        assert image.mode == "RGB"
+        assert np.array_equal(np.asarray(image), pixels[..., :3])
+    with PIL.Image.open("quantised.png") as image:
+        assert image.mode == "P"
+
+
 def test_get_plot_resolution(tmp_working_dir):
     """Test getting the plot resolution."""
     with open("meta.json", "wt", encoding="UTF-8") as fp:
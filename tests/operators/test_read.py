@@ -201,6 +201,46 @@ def test_load_model_add_model_name():
         assert cube.attributes["model_name"] == "Test"
 
 
+@pytest.mark.parametrize("load_pool", ["thread", "process"])
+def test_read_cubes_concurrent_load(load_pool):
+    """Loading with multiple workers gives the same cubes as serially."""
+    constraint = constraints.generate_stash_constraint("m01s03i236")
+    expected = read.read_cubes("tests/test_data/exeter_em0?.nc", constraint)
+    actual = read.read_cubes(
+        "tests/test_data/exeter_em0?.nc",
+        constraint,
+        load_workers=2,
+        load_pool=load_pool,
+    )
+    assert actual == expected
+
+
+def test_read_cubes_concurrent_load_multiple_models():
+    """Multiple models loaded concurrently keep their order."""
+    cubes = read.read_cubes(
+        ["tests/test_data/air_temp.nc", "tests/test_data/air_temp.nc"],
+        model_names=["Model 1", "Model 2"],
+        load_workers=2,
+    )
+    expected = read.read_cubes(
+        ["tests/test_data/air_temp.nc", "tests/test_data/air_temp.nc"],
+        model_names=["Model 1", "Model 2"],
+    )
+    assert cubes == expected
+    base_models = {
+        cube.attributes["model_name"]
+        for cube in cubes
+        if cube.attributes.get("cset_comparison_base")
+    }
+    assert base_models == {"Model 1"}
+
+
+def test_read_cubes_unknown_load_pool():
+    """Error on an unknown pool type."""
+    with pytest.raises(ValueError, match="Unknown load_pool"):
+        read.read_cubes("tests/test_data/air_temp.nc", load_workers=2, load_pool="gpu")
+
+
 def test_check_input_files_direct_path(tmp_path):
     """Get a iterable of a single file from a direct path as a string."""
     file_path = tmp_path / "file"
@@ -292,6 +332,90 @@ def test_lfric_normalise_callback_sort_stash(cube):
     assert actual == expected
 
 
+def test_metadata_plan():
+    """Metadata dependent callbacks are planned from the names they will see."""
+    plan = read._metadata_plan("m01s04i203", None, None, "rain", ())
+    assert plan.um_normalise
+    assert plan.convert_units
+    assert not plan.fix_um_radtime
+    assert not plan.fix_cloud_base_altitude
+    plan = read._metadata_plan(
+        None, None, None, "cloud_base_altitude_0", ("mean", "mean")
+    )
+    assert not plan.um_normalise
+    assert not plan.fix_cell_methods
+    assert plan.fix_cloud_base_altitude
+    assert read._metadata_plan(
+        "m01s21i104", None, None, None, ("mean",)
+    ).fix_cell_methods
+    assert not read._metadata_plan(
+        "m01s21i104", None, None, None, ("mean", "maximum")
+    ).fix_cell_methods
+    assert read._metadata_plan("m01s01i207", None, None, None, ()).fix_um_radtime
+
+
+def _apply_all_callbacks(cube):
+    """Apply every loading callback without consulting the metadata plan."""
+    read._realization_callback(cube)
+    read._um_normalise_callback(cube)
+    read._lfric_normalise_callback(cube)
+    read._nimrod_normalise_callback(cube)
+    cube = read._lfric_time_coord_fix_callback(cube)
+    read._normalise_var0_varname(cube)
+    cube = read._fix_no_spatial_coords_callback(cube)
+    read._fix_spatial_coords_callback(cube)
+    read._fix_pressure_coord_callback(cube)
+    read._fix_um_radtime(cube)
+    read._fix_cell_methods(cube)
+    cube = read._convert_cube_units_callback(cube)
+    cube = read._grid_longitude_fix_callback(cube)
+    read._fix_lfric_cloud_base_altitude(cube)
+    read._proleptic_gregorian_fix(cube)
+    read._lfric_time_callback(cube)
+    read._lfric_forecast_period_callback(cube)
+    cube = read._fix_no_time_coords_callback(cube)
+    read._normalise_longname(cube)
+    return cube
+
+
+@pytest.mark.parametrize(
+    "stash,var_name,units,cell_method",
+    [
+        ("m01s03i236", None, "K", None),
+        ("m01s04i203", None, "kg m-2 s-1", None),
+        ("m01s21i104", None, "1", "mean"),
+        ("m01s09i210", None, "kft", None),
+        (None, "visibility_in_air_0", "m", None),
+    ],
+)
+def test_loading_callback_matches_all_callbacks(
+    cube_readonly, stash, var_name, units, cell_method
+):
+    """Skipping callbacks that can't apply gives the same cube."""
+    cube = cube_readonly.copy()
+    cube.attributes.pop("STASH", None)
+    if stash is not None:
+        cube.attributes["STASH"] = stash
+    cube.var_name = var_name
+    cube.units = units
+    cube.cell_methods = ()
+    if cell_method is not None:
+        cube.add_cell_method(iris.coords.CellMethod(cell_method, coords="time"))
+    expected = _apply_all_callbacks(cube.copy())
+    actual = read._loading_callback(cube.copy(), None, None)
+    assert actual == expected
+    assert actual.cell_methods == expected.cell_methods
+
+
+def test_loading_callback_memoises_metadata_plan(cube_readonly):
+    """Fields sharing metadata share a metadata plan."""
+    read._metadata_plan.cache_clear()
+    for _ in range(3):
+        read._loading_callback(cube_readonly.copy(), None, None)
+    assert read._metadata_plan.cache_info().misses == 1
+    assert read._metadata_plan.cache_info().hits == 2
+
+
 def test_lfric_time_coord_fix_callback():
     """Correctly convert time from AuxCoord to DimCoord."""
     time_coord = iris.coords.AuxCoord([0, 1, 2], standard_name="time")
@@ -286,6 +286,21 @@ def test_crps(feature_cube):
     assert np.allclose(crps_cube_fair.data, scores_crps_fair.data, atol=1e-2, rtol=1e-6)
 
 
+def test_crps_lazy_data(feature_cube):
+    """CRPS of lazy data is calculated without realising it, with same result."""
+    expected = scoreswrappers.scores_crps_for_ensemble(feature_cube, method="fair")
+    lazy_cube = feature_cube.copy(data=feature_cube.lazy_data().rechunk(1))
+    actual = scoreswrappers.scores_crps_for_ensemble(lazy_cube, method="fair")
+    assert lazy_cube.has_lazy_data()
+    assert np.allclose(actual.data, expected.data)
+
+
+def test_crps_unknown_method(feature_cube):
+    """Unknown CRPS methods raise an error."""
+    with pytest.raises(ValueError, match="Unknown CRPS method: pwm"):
+        scoreswrappers.scores_crps_for_ensemble(feature_cube, method="pwm")
+
+
 def test_crps_control_member_out_of_bounds(feature_cube):
     """Test handling of out of bounds control member value."""
     scoreswrappers.scores_crps_for_ensemble(feature_cube, control_member=1000)
@@ -802,3 +817,153 @@ def test_ets_metadata(make_cube_categorical_testing):
     assert cube.units == "1"
     assert cube.attributes["model_name"] == "ukv"
     assert cube.name() == "Equitable_Threat_Score_gt_10_observed_temperature"
+
+
+def test_scores_summary_matches_individual_scores(dummy_cubelist_model_obs):
+    """Scores summary gives the same results as the individual operators."""
+    summary = scoreswrappers.scores_summary(
+        dummy_cubelist_model_obs,
+        preserved_coordinates="time",
+        obs_model_comparison=True,
+    )
+    assert isinstance(summary, CubeList)
+    assert len(summary) == 8
+    individual = (
+        scoreswrappers.scores_rmse_model_obs(dummy_cubelist_model_obs, "time")
+        + scoreswrappers.scores_mae_model_obs(dummy_cubelist_model_obs, "time")
+        + scoreswrappers.scores_additive_bias_model_obs(
+            dummy_cubelist_model_obs, "time"
+        )
+        + scoreswrappers.scores_correlation_pearsonr_model_obs(
+            dummy_cubelist_model_obs, "time"
+        )
+    )
+    by_name = {(c.name(), c.attributes["model_name"]): c for c in summary}
+    for expected in individual:
+        actual = by_name[(expected.name(), expected.attributes["model_name"])]
+        assert actual.shape == expected.shape
+        assert actual.units == expected.units
+        assert np.allclose(actual.data, expected.data, rtol=1e-5)
+
+
+def test_scores_summary_base_other(cube: Cube):
+    """Scores summary of identical cubes compared against a base."""
+    other_cube = cube.copy()
+    del other_cube.attributes["cset_comparison_base"]
+    cube.attributes["model_name"] = "model1"
+    other_cube.attributes["model_name"] = "model2"
+    summary = scoreswrappers.scores_summary(
+        CubeList([cube, other_cube]), metrics=["rmse", "pearsonr"]
+    )
+    assert [c.name() for c in summary] == [
+        "RMSE_of_air_temperature",
+        "Pearson_Correlation_of_air_temperature",
+    ]
+    assert np.allclose(summary[0].data, 0.0, atol=1e-9)
+    assert np.allclose(summary[1].data, 1.0, atol=1e-9)
+
+
+def test_scores_summary_unknown_metric(dummy_cubelist_model_obs):
+    """Unknown scores raise an error."""
+    with pytest.raises(ValueError, match="Unknown score: brier"):
+        scoreswrappers.scores_summary(
+            dummy_cubelist_model_obs, metrics="brier", obs_model_comparison=True
+        )
+
+
+def test_scores_summary_pearsonr_preserve_all(dummy_cubelist_model_obs):
+    """Pearson correlation needs a dimension to collapse."""
+    with pytest.raises(
+        ValueError, match="You cannot preserve all dimensions with pearsonr."
+    ):
+        scoreswrappers.scores_summary(
+            dummy_cubelist_model_obs,
+            preserved_coordinates=["time", "longitude", "latitude"],
+            obs_model_comparison=True,
+        )
+
+
+def test_contingency_matches_single_threshold_scores(
+    make_cube_categorical_testing_with_time,
+):
+    """Multi-threshold scores match the single threshold operators."""
+    obs = make_cube_categorical_testing_with_time(
+        [[[12, 5], [15, 8]], [[3, 11], [9, 16]], [[7, 7], [20, 1]]],
+        long_name="observed_temperature",
+        model_name="obs",
+    )
+    model = make_cube_categorical_testing_with_time(
+        [[[14, 20], [7, 4]], [[5, 12], [10, 15]], [[6, 9], [18, 2]]],
+        long_name="temperature",
+        model_name="test_model",
+    )
+    cubes = CubeList([model, obs])
+    thresholds = ["4", "8", "10"]
+    result = scoreswrappers.scores_contingency_model_obs(
+        cubes,
+        preserved_coordinates=None,
+        thresholds=thresholds,
+        op_func="gt",
+        categorical_scores=["pod", "ets"],
+    )
+    assert len(result) == 2
+    pod, ets = result
+    assert pod.name() == "Probability_Of_Detection_gt_observed_temperature"
+    assert pod.shape == (3,)
+    assert np.allclose(pod.coord("threshold").points, [4, 8, 10])
+    for index, threshold in enumerate(thresholds):
+        expected_pod = scoreswrappers.scores_pod_model_obs(cubes, None, threshold, "gt")
+        expected_ets = scoreswrappers.scores_ets_model_obs(cubes, None, threshold, "gt")
+        assert np.allclose(pod.data[index], expected_pod[0].data)
+        assert np.allclose(ets.data[index], expected_ets[0].data)
+
+
+def test_contingency_manual_case_preserve_time(make_cube_categorical_testing_with_time):
+    """Check all scores against hand calculated values, preserving time."""
+    obs = make_cube_categorical_testing_with_time(
+        [[[1, 1], [0, 0]], [[1, 0], [1, 0]], [[0, 0], [0, 0]]],
+        long_name="observed_rainfall",
+        model_name="obs",
+    )
+    model = make_cube_categorical_testing_with_time(
+        [[[1, 0], [1, 0]], [[1, 0], [1, 0]], [[1, 1], [0, 0]]],
+        long_name="rainfall",
+        model_name="test_model",
+    )
+    result = scoreswrappers.scores_contingency_model_obs(
+        CubeList([model, obs]),
+        preserved_coordinates="time",
+        thresholds=0.5,
+        op_func="gt",
+    )
+    pod, far, csi, ets, frequency_bias = result
+    assert pod.shape == (1, 3)
+    # First time has one hit, one miss and one false alarm.
+    assert np.isclose(pod.data[0, 0], 0.5)
+    assert np.isclose(far.data[0, 0], 0.5)
+    assert np.isclose(csi.data[0, 0], 1 / 3)
+    assert np.isclose(ets.data[0, 0], 0.0)
+    assert np.isclose(frequency_bias.data[0, 0], 1.0)
+    # Second time is perfect.
+    assert np.isclose(pod.data[0, 1], 1.0)
+    assert np.isclose(ets.data[0, 1], 1.0)
+    # Third time has no observed events, so POD is undefined.
+    assert np.isnan(pod.data[0, 2])
+    assert np.isclose(far.data[0, 2], 1.0)
+
+
+def test_contingency_invalid_arguments(make_cube_categorical_testing):
+    """Unsupported operators and scores raise an error."""
+    obs = make_cube_categorical_testing(
+        [[1, 0], [1, 0]], long_name="observed_rainfall", model_name="obs"
+    )
+    model = make_cube_categorical_testing(
+        [[1, 0], [1, 0]], long_name="rainfall", model_name="test_model"
+    )
+    cubes = CubeList([model, obs])
+    with pytest.raises(ValueError, match="Operator ge not supported."):
+        scoreswrappers.scores_contingency_model_obs(cubes, None, [0.5], "ge")
+    with pytest.raises(ValueError, match="Score brier not supported."):
+        scoreswrappers.scores_contingency_model_obs(
+            cubes, None, [0.5], "gt", categorical_scores="brier"
+        )
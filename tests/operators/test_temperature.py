@@ -203,6 +203,37 @@ def test_wet_bulb_temperature(
     )
 
 
+def test_wet_bulb_temperature_lazy(
+    temperature_for_conversions_cube, relative_humidity_for_conversions_cube
+):
+    """Test wet-bulb temperature is calculated without realising the data."""
+    T = temperature_for_conversions_cube.copy(
+        data=temperature_for_conversions_cube.lazy_data()
+    )
+    RH = relative_humidity_for_conversions_cube.copy(
+        data=relative_humidity_for_conversions_cube.lazy_data()
+    )
+    Tw = temperature.wet_bulb_temperature(T, RH)
+    assert T.has_lazy_data()
+    assert RH.has_lazy_data()
+    assert Tw.has_lazy_data()
+    expected = temperature.wet_bulb_temperature(
+        temperature_for_conversions_cube, relative_humidity_for_conversions_cube
+    )
+    assert np.allclose(expected.data, Tw.data, equal_nan=True)
+
+
+def test_dewpoint_temperature_keeps_mask(
+    temperature_for_conversions_cube, relative_humidity_for_conversions_cube
+):
+    """Test masked points stay masked when out of range values are set to NaN."""
+    T = temperature_for_conversions_cube.copy(
+        data=np.ma.masked_less(temperature_for_conversions_cube.data, 280.0)
+    )
+    Td = temperature.dewpoint_temperature(T, relative_humidity_for_conversions_cube)
+    assert np.array_equal(np.ma.getmaskarray(Td.data), np.ma.getmaskarray(T.data))
+
+
 def test_wet_bulb_temperature_units(
     temperature_for_conversions_cube, relative_humidity_for_conversions_cube
 ):
@@ -0,0 +1,51 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tile pyramids of rendered plots."""
+
+import json
+
+import PIL.Image
+
+from CSET.operators import _tiles
+
+
+def test_zoom_levels():
+    """Each zoom level doubles the resolution, up to a limit."""
+    assert _tiles.zoom_levels(100) == 0
+    assert _tiles.zoom_levels(256) == 0
+    assert _tiles.zoom_levels(257) == 1
+    assert _tiles.zoom_levels(1000) == 2
+    assert _tiles.zoom_levels(10**6) == _tiles.MAX_ZOOM
+    assert _tiles.rendered_size(1000) == 1024
+
+
+def test_write_tile_pyramid(tmp_path):
+    """Tiles are written for every zoom level, with a descriptor."""
+    image = PIL.Image.new("RGBA", (600, 300), "red")
+    descriptor_path = _tiles.write_tile_pyramid(image, tmp_path / "tiles")
+    assert descriptor_path == tmp_path / "tiles" / _tiles.DESCRIPTOR_FILENAME
+    with open(descriptor_path, encoding="UTF-8") as fp:
+        descriptor = json.load(fp)
+    assert descriptor == {
+        "tile_size": 256,
+        "max_zoom": 2,
+        "levels": [[150, 75], [300, 150], [600, 300]],
+    }
+    # Zoom level 0 is a single tile of the whole image.
+    assert sorted(p.name for p in (tmp_path / "tiles/0").rglob("*.png")) == ["0.png"]
+    # The full resolution level has 3 columns and 2 rows of tiles.
+    assert len(list((tmp_path / "tiles/2").rglob("*.png"))) == 6
+    with PIL.Image.open(tmp_path / "tiles/2/2/1.png") as tile:
+        assert tile.size == (600 - 512, 300 - 256)
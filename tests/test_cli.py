@@ -18,6 +18,7 @@ In many ways these are integration tests.
 """
 
 import logging
+import shutil
 import subprocess
 from pathlib import Path
 from uuid import uuid4
@@ -80,12 +81,30 @@ def test_argument_parser_bake(tmp_path):
             "--plot-resolution",
             "72",
             "--skip-write",
+            "--dask-scheduler",
+            "threads",
+            "--dask-workers",
+            "4",
+            "--dask-memory-limit",
+            "4GiB",
+            "--dask-chunk-size",
+            "128MiB",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "--cache-memory-limit",
+            "1GiB",
         ]
     )
     assert args.input_dir == [str(tmp_path)]
     assert args.style_file == tmp_path / "style.json"
     assert args.plot_resolution == 72
     assert args.skip_write is True
+    assert args.dask_scheduler == "threads"
+    assert args.dask_workers == 4
+    assert args.dask_memory_limit == "4GiB"
+    assert args.dask_chunk_size == "128MiB"
+    assert args.cache_dir == str(tmp_path / "cache")
+    assert args.cache_memory_limit == "1GiB"
 
 
 def test_argument_parser_cookbook(tmp_path):
@@ -207,6 +226,52 @@ def test_bake_recipe_execution(monkeypatch):
     )
 
 
+def test_bake_recipe_dir(monkeypatch, tmp_path):
+    """Bake a directory of recipes together."""
+    baked = None
+
+    def mock_execute_recipes(recipes, *args):
+        nonlocal baked
+        baked = recipes
+
+    monkeypatch.setattr(CSET.operators, "execute_recipes", mock_execute_recipes)
+    shutil.copy("tests/test_data/noop_recipe.yaml", tmp_path / "a.yaml")
+    shutil.copy("tests/test_data/noop_recipe.yaml", tmp_path / "b.yaml")
+    CSET.main(
+        [
+            "cset",
+            "bake",
+            f"--recipe-dir={tmp_path}",
+            "--output-dir=/dev/null",
+        ]
+    )
+    assert [output_dir for _, output_dir in baked] == [
+        Path("/dev/null/a"),
+        Path("/dev/null/b"),
+    ]
+    assert baked[0][0]["title"] == "Noop"
+
+
+def test_bake_skipped_marker(monkeypatch, tmp_path):
+    """A marker is created when recipes are skipped as unchanged."""
+    baked = True
+    monkeypatch.setattr(CSET.operators, "execute_recipe", lambda *args: baked)
+    marker = tmp_path / "skipped"
+    command = [
+        "cset",
+        "bake",
+        "--recipe=tests/test_data/noop_recipe.yaml",
+        "--output-dir=/dev/null",
+        "--skip-unchanged",
+        f"--skipped-marker={marker}",
+    ]
+    CSET.main(command)
+    assert not marker.exists()
+    baked = False
+    CSET.main(command)
+    assert marker.is_file()
+
+
 def test_bake_invalid_args(capsys):
     """Invalid arguments give non-zero exit code."""
     with pytest.raises(SystemExit) as sysexit:
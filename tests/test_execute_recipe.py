@@ -15,6 +15,7 @@
 """Tests for running CSET operator recipes."""
 
 import json
+import os
 import zipfile
 from pathlib import Path
 
@@ -22,6 +23,7 @@ import pytest
 
 import CSET._common
 import CSET.operators
+from CSET.operators import _fingerprint
 
 
 def test_get_operator():
@@ -106,6 +108,104 @@ def test_execute_recipe_skip_write_metadata_written(tmp_path: Path):
     assert metadata["skip_write"]
 
 
+def test_execute_recipe_compute_policy_metadata_written(tmp_path: Path):
+    """Compute policy from the command line overrides the recipe's."""
+    CSET.operators.execute_recipe(
+        {
+            "compute": {"scheduler": "threads", "workers": 4},
+            "steps": [{"operator": "misc.noop"}],
+        },
+        tmp_path,
+        compute_policy={"scheduler": "synchronous", "workers": None},
+    )
+    with open(tmp_path / "meta.json", "rb") as fp:
+        metadata = json.load(fp)
+    assert metadata["compute"] == {"scheduler": "synchronous", "workers": 4}
+
+
+def test_execute_recipe_compute_policy_unknown_scheduler(tmp_path: Path):
+    """Unknown dask scheduler raises an exception."""
+    with pytest.raises(ValueError, match="Unknown dask scheduler"):
+        CSET.operators.execute_recipe(
+            {"steps": [{"operator": "misc.noop"}]},
+            tmp_path,
+            compute_policy={"scheduler": "gpu"},
+        )
+
+
+def test_execute_recipe_skip_unchanged(tmp_path: Path):
+    """Unchanged recipes are only baked once, and changed ones are rebaked."""
+    input_file = tmp_path / "air_temp.nc"
+    input_file.write_bytes(Path("tests/test_data/air_temp.nc").read_bytes())
+    recipe = CSET._common.parse_recipe(
+        Path("tests/test_data/noop_recipe.yaml"), {"INPUT_PATHS": str(input_file)}
+    )
+    recipe["steps"].insert(
+        0, {"operator": "read.read_cubes", "file_paths": str(input_file)}
+    )
+    output_dir = tmp_path / "output"
+    assert CSET.operators.execute_recipe(recipe.copy(), output_dir, skip_unchanged=True)
+    assert (output_dir / _fingerprint.FINGERPRINT_FILENAME).is_file()
+
+    # Rerunning keeps the existing output.
+    (output_dir / "meta.json").unlink()
+    assert not CSET.operators.execute_recipe(
+        recipe.copy(), output_dir, skip_unchanged=True
+    )
+    assert not (output_dir / "meta.json").exists()
+
+    # Changing options or inputs bakes the recipe again.
+    CSET.operators.execute_recipe(
+        recipe.copy(), output_dir, plot_resolution=72, skip_unchanged=True
+    )
+    assert (output_dir / "meta.json").is_file()
+    (output_dir / "meta.json").unlink()
+    os.utime(input_file, (0, 0))
+    CSET.operators.execute_recipe(
+        recipe.copy(), output_dir, plot_resolution=72, skip_unchanged=True
+    )
+    assert (output_dir / "meta.json").is_file()
+
+
+def test_execute_recipe_without_skip_unchanged_rebakes(tmp_path: Path):
+    """Recipes are always baked unless asked to skip unchanged ones."""
+    recipe = {"steps": [{"operator": "misc.noop"}]}
+    CSET.operators.execute_recipe(recipe.copy(), tmp_path, skip_unchanged=True)
+    (tmp_path / "meta.json").unlink()
+    CSET.operators.execute_recipe(recipe.copy(), tmp_path)
+    assert (tmp_path / "meta.json").is_file()
+    assert not (tmp_path / _fingerprint.FINGERPRINT_FILENAME).exists()
+
+
+def test_execute_recipes_shares_steps(tmp_path: Path, monkeypatch):
+    """Steps common to several recipes are executed once."""
+    calls = []
+    monkeypatch.setattr(
+        CSET.operators.misc, "noop", lambda x, **kwargs: calls.append(kwargs) or x
+    )
+    shared = {"operator": "misc.noop", "shared": True}
+    recipes = [
+        ({"steps": [shared, {"operator": "misc.noop", "n": n}]}, tmp_path / str(n))
+        for n in range(3)
+    ]
+    CSET.operators.execute_recipes(recipes)
+    assert calls.count({"shared": True}) == 1
+    assert len(calls) == 4
+    for _, output_dir in recipes:
+        assert (output_dir / "meta.json").is_file()
+
+
+def test_execute_recipes_continues_after_failure(tmp_path: Path):
+    """A failing recipe doesn't stop the others, but is reported."""
+    recipes = [
+        ({"steps": [{"operator": "misc.not_an_operator"}]}, tmp_path / "bad"),
+        ({"steps": [{"operator": "misc.noop"}]}, tmp_path / "good"),
+    ]
+    with pytest.raises(RuntimeError, match="1 recipes failed"):
+        CSET.operators.execute_recipes(recipes)
+    assert (tmp_path / "good/diagnostic.zip").is_file()
+
+
 def test_write_metadata_climate_varname_shortened(tmp_working_dir):
     """Recipe title written to metadata has certain variable names shortened."""
     CSET.operators._write_metadata({"title": "foo_for_climate_averaging"})
@@ -0,0 +1,207 @@
+# © Crown copyright, Met Office (2022-2026) and CSET contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for scheduling the baking of recipes."""
+
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from CSET.cset_workflow.app.bake_recipes.bin import schedule
+
+GiB = 1024**3
+
+
+def test_recipe_key():
+    """Recipes are identified across cycles without their hash."""
+    assert schedule.recipe_key(Path("dir/air-temp_0123456789ab.yaml")) == "air-temp"
+    assert schedule.recipe_key(Path("air-temp.yaml")) == "air-temp"
+
+
+def test_plan_orders_longest_first_and_packs_memory():
+    """Longest recipes are first, and the largest fit in memory together."""
+    estimates = {
+        "small.yaml": schedule.Estimate(10, 1 * GiB),
+        "large.yaml": schedule.Estimate(100, 6 * GiB),
+        "medium.yaml": schedule.Estimate(50, 3 * GiB),
+    }
+    recipes, pool_size = schedule.plan(estimates, 8, 10 * GiB)
+    assert recipes == ["large.yaml", "medium.yaml", "small.yaml"]
+    assert pool_size == 3
+    assert schedule.plan(estimates, 8, 8 * GiB)[1] == 1
+    assert schedule.plan(estimates, 2, 100 * GiB)[1] == 2
+    # At least one recipe is always baked.
+    assert schedule.plan(estimates, 8, 1)[1] == 1
+
+
+def test_profile_round_trip(tmp_path):
+    """Recorded profiles are used for later cycles."""
+    recipe = Path("air-temp_0123456789ab.yaml")
+    assert schedule.load_profile(recipe, tmp_path) is None
+    schedule.record_profile(recipe, schedule.Estimate(12.5, 2 * GiB), tmp_path)
+    later = Path("air-temp_ba9876543210.yaml")
+    assert schedule.load_profile(later, tmp_path) == schedule.Estimate(12.5, 2 * GiB)
+    assert schedule.estimate(later, tmp_path) == schedule.Estimate(12.5, 2 * GiB)
+
+
+def test_estimate_from_recipe(tmp_path):
+    """Recipes are estimated from their input size and operators."""
+    shutil.copy("tests/test_data/air_temp.nc", tmp_path)
+    recipe = tmp_path / "recipe.yaml"
+    recipe.write_text(
+        "title: Test\n"
+        "steps:\n"
+        "  - operator: read.read_cubes\n"
+        f"    file_paths: {tmp_path / 'air_temp.nc'}\n"
+        "  - operator: plot.spatial_pcolormesh_plot\n"
+    )
+    estimate = schedule.estimate_from_recipe(recipe)
+    input_bytes = (tmp_path / "air_temp.nc").stat().st_size
+    assert estimate.memory == schedule.BASE_MEMORY + 2 * input_bytes
+    assert estimate.seconds == schedule.BASE_SECONDS + 3 * (
+        input_bytes / schedule.INPUT_THROUGHPUT
+    )
+
+
+def test_estimate_from_invalid_recipe(tmp_path):
+    """Recipes that can't be parsed are estimated as a bake without input."""
+    recipe = tmp_path / "recipe.yaml"
+    recipe.write_text("title: [Test\n")
+    assert schedule.estimate_from_recipe(recipe) == schedule.Estimate(
+        schedule.BASE_SECONDS, schedule.BASE_MEMORY
+    )
+    assert schedule.estimate_from_recipe(tmp_path / "missing.yaml") == (
+        schedule.Estimate(schedule.BASE_SECONDS, schedule.BASE_MEMORY)
+    )
+
+
+def test_main_profile(tmp_path, monkeypatch):
+    """Profiles are only recorded for bakes which baked every recipe."""
+    monkeypatch.setenv("CYLC_WORKFLOW_SHARE_DIR", str(tmp_path))
+    monkeypatch.setattr(schedule, "MEMORY_SAMPLE_INTERVAL", 0.01)
+    profiles_dir = tmp_path / "bake_profiles"
+    recipe = Path("recipe.yaml")
+    # The skipped marker is given as the last argument.
+    skip = "import pathlib, sys; pathlib.Path(sys.argv[1].split('=')[1]).touch()"
+    assert schedule.main_profile(recipe, [sys.executable, "-c", skip]) == 0
+    assert schedule.load_profile(recipe, profiles_dir) is None
+    fail = "import sys; sys.exit(3)"
+    assert schedule.main_profile(recipe, [sys.executable, "-c", fail]) == 3
+    assert schedule.load_profile(recipe, profiles_dir) is None
+    bake = "import time; time.sleep(0.1)"
+    assert schedule.main_profile(recipe, [sys.executable, "-c", bake]) == 0
+    profile = schedule.load_profile(recipe, profiles_dir)
+    assert profile.seconds >= 0.1
+    assert profile.memory > 0
+
+
+def test_process_tree_rss():
+    """Memory of a process includes that of its descendants."""
+    sleep = "import time; time.sleep(10)"
+    spawn = f"import subprocess, sys; subprocess.run([sys.executable, '-c', {sleep!r}])"
+    with subprocess.Popen([sys.executable, "-c", spawn]) as parent:
+        children = Path(f"/proc/{parent.pid}/task/{parent.pid}/children")
+        try:
+            # Wait for the child process to start.
+            for _ in range(1000):
+                if children.read_text():
+                    break
+                time.sleep(0.01)
+            child = int(children.read_text())
+            child_rss = schedule._process_tree_rss(child)
+            assert child_rss > 0
+            assert schedule._process_tree_rss(parent.pid) > child_rss
+            subprocess.run(["kill", str(child)], check=True)
+        finally:
+            parent.kill()
+    assert schedule._process_tree_rss(parent.pid) == 0
+
+
+def test_main_plan(tmp_path, monkeypatch):
+    """A rose-bunch configuration is written for the recipes."""
+    monkeypatch.setenv("CYLC_WORKFLOW_SHARE_DIR", str(tmp_path))
+    monkeypatch.setenv("BUNCH_POOL_SIZE", "4")
+    monkeypatch.setenv("BAKE_MEMORY_LIMIT", "100GiB")
+    recipe_dir = tmp_path / "recipes"
+    recipe_dir.mkdir()
+    for name in ("a", "b"):
+        (recipe_dir / f"{name}.yaml").write_text(
+            f"title: Test\nsteps:\n  - operator: misc.noop\n    name: {name}\n"
+        )
+    schedule.record_profile(
+        Path("b.yaml"), schedule.Estimate(1000, GiB), tmp_path / "bake_profiles"
+    )
+    opt_conf = tmp_path / "opt.conf"
+    schedule.main_plan(recipe_dir, opt_conf)
+    assert opt_conf.read_text() == (
+        "[bunch]\npool-size=2\n[bunch-args]\nrecipe_file=b.yaml a.yaml\n"
+    )
+
+
+def test_group_recipes(tmp_path, monkeypatch):
+    """Recipes starting with the same step are grouped, up to a limit."""
+    monkeypatch.setattr(schedule, "MAX_GROUP_SIZE", 2)
+    steps = {
+        "a": "  - operator: misc.noop\n  - operator: plot.spatial_contour_plot\n",
+        "b": "  - operator: misc.noop\n  - operator: plot.plot_line_series\n",
+        "c": "  - operator: misc.noop\n",
+        "d": "  - operator: misc.noop\n    n: 1\n",
+        "e": "  - operator: plot.spatial_contour_plot\n",
+        "f": "  - operator: misc.noop\ncompute:\n  scheduler: threads\n",
+        "g": "[invalid\n",
+    }
+    recipe_files = []
+    for name, recipe in steps.items():
+        recipe_files.append(tmp_path / f"{name}.yaml")
+        recipe_files[-1].write_text(
+            recipe if name == "g" else f"title: Test\nsteps:\n{recipe}"
+        )
+    groups = schedule.group_recipes(recipe_files)
+    assert [[p.stem for p in group] for group in groups] == [
+        ["a", "b"],
+        ["c"],
+        ["d"],
+        ["e"],
+        ["f"],
+        ["g"],
+    ]
+
+
+def test_main_plan_groups_recipes(tmp_path, monkeypatch):
+    """Recipes sharing steps are baked together from a directory of links."""
+    monkeypatch.setenv("CYLC_WORKFLOW_SHARE_DIR", str(tmp_path))
+    monkeypatch.setenv("BUNCH_POOL_SIZE", "4")
+    monkeypatch.setenv("BAKE_MEMORY_LIMIT", "100GiB")
+    recipe_dir = tmp_path / "recipes"
+    recipe_dir.mkdir()
+    for name in ("a", "b"):
+        (recipe_dir / f"{name}.yaml").write_text(
+            "title: Test\nsteps:\n  - operator: misc.noop\n"
+        )
+    opt_conf = tmp_path / "opt.conf"
+    schedule.main_plan(recipe_dir, opt_conf)
+    (group,) = (recipe_dir / schedule.GROUPS_DIR).iterdir()
+    assert sorted(p.name for p in group.iterdir()) == ["a.yaml", "b.yaml"]
+    assert (group / "a.yaml").resolve() == (recipe_dir / "a.yaml").resolve()
+    assert opt_conf.read_text() == (
+        "[bunch]\npool-size=1\n[bunch-args]\n"
+        f"recipe_file={schedule.GROUPS_DIR}/{group.name}\n"
+    )
+    # Planning again replaces the groups, rather than scheduling their links.
+    schedule.main_plan(recipe_dir, opt_conf)
+    assert [p.name for p in (recipe_dir / schedule.GROUPS_DIR).iterdir()] == [
+        group.name
+    ]